@@ -44,6 +44,7 @@ class RiskConfig(BaseModel):
     position_size_pct: float = Field(..., ge=0, le=1)
     stop_loss_pct: float = Field(..., ge=0, le=1)
     take_profit_pct: float = Field(..., ge=0, le=1)
+    log_every: bool = True
 
 
 class RateLimitsConfig(BaseModel):
@@ -81,6 +82,11 @@ class RecoveryProtocol(BaseModel):
     restart_checklist: List[str]
 
 
+# Config.get cache sentinels: key not cached yet / key absent from config
+_UNRESOLVED = object()
+_MISSING = object()
+
+
 class Config:
     """
     Main configuration manager.
@@ -117,11 +123,16 @@ class Config:
         self._hard_limits: Optional[HardLimits] = None
         self._kill_switch_conditions: List[KillSwitchCondition] = []
         self._recovery_protocol: Optional[RecoveryProtocol] = None
+        self._risk_limits_snapshot: Optional[Dict[str, Any]] = None
+        self._get_cache: Dict[str, Any] = {}  # Dotted key -> resolved value (or _MISSING)
 
         self.load()
 
     def load(self) -> None:
         """Load and validate all configuration files."""
+        self._risk_limits_snapshot = None
+        self._get_cache.clear()
+
         # Load default configuration
         if not self.default_config_path.exists():
             raise FileNotFoundError(
@@ -257,16 +268,24 @@ class Config:
             >>> config.get('nonexistent.key', 'default')
             'default'
         """
-        keys = key.split('.')
+        value = self._get_cache.get(key, _UNRESOLVED)
+        if value is _UNRESOLVED:
+            value = self._resolve(key)
+            self._get_cache[key] = value
+
+        return default if value is _MISSING else value
+
+    def _resolve(self, key: str) -> Any:
+        """Walk the nested configuration for a dotted key (_MISSING if absent)."""
         value = self._config
 
-        for k in keys:
+        for k in key.split('.'):
             if isinstance(value, dict):
                 value = value.get(k)
             else:
-                return default
+                return _MISSING
             if value is None:
-                return default
+                return _MISSING
 
         return value
 
@@ -291,6 +310,8 @@ class Config:
             config = config[k]
 
         config[keys[-1]] = value
+        self._risk_limits_snapshot = None
+        self._get_cache.clear()
 
         # Re-validate after change
         self._validate_limits()
@@ -310,6 +331,29 @@ class Config:
         """Get recovery protocol (read-only)."""
         return self._recovery_protocol
 
+    @property
+    def risk_limits_snapshot(self) -> Dict[str, Any]:
+        """
+        Get the risk limits reported to clients (cached).
+
+        Built on first access and rebuilt after load() or set(). The
+        returned dict is shared; do not mutate it.
+
+        Returns:
+            Dictionary of soft and hard risk limits
+        """
+        if self._risk_limits_snapshot is None:
+            self._risk_limits_snapshot = {
+                "max_portfolio_value": self.get('risk.max_portfolio_value'),
+                "max_position_size": self.get('risk.max_position_size'),
+                "max_daily_loss": self.get('risk.max_daily_loss'),
+                "max_open_positions": self.get('risk.max_open_positions'),
+                "max_single_order": self._hard_limits.MAX_SINGLE_ORDER_VALUE,
+                "max_daily_orders": self._hard_limits.MAX_DAILY_ORDERS
+            }
+
+        return self._risk_limits_snapshot
+
     def is_paper_mode(self) -> bool:
         """
         Check if running in paper trading mode.
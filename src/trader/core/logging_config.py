@@ -182,7 +182,7 @@ def log_function_call(logger: FilteringBoundLogger):
                 result = func(*args, **kwargs)
                 logger.debug(
                     f"Completed {func.__name__}",
-                    function=func.__name__},
+                    function=func.__name__,
                     success=True
                 )
                 return result
@@ -43,6 +43,20 @@ class NewsFetcher:
         'NDTV Profit': 'https://www.ndtvprofit.com/rss/markets'
     }
 
+    # Common Indian stock symbols (this is a simple implementation)
+    COMMON_SYMBOLS = (
+        'RELIANCE', 'TCS', 'INFY', 'HDFC', 'HDFCBANK', 'ICICIBANK',
+        'SBIN', 'BAJFINANCE', 'BHARTIARTL', 'ITC', 'KOTAKBANK',
+        'LT', 'AXISBANK', 'ASIANPAINT', 'MARUTI', 'TITAN',
+        'WIPRO', 'NESTLEIND', 'ULTRACEMCO', 'SUNPHARMA',
+        'TATASTEEL', 'TATAMOTORS', 'POWERGRID', 'NTPC', 'ONGC',
+        'ADANIPORTS', 'JSWSTEEL', 'INDUSINDBK', 'TECHM', 'DRREDDY'
+    )
+
+    # Compiled once: HTML tags in summaries, and any common symbol as a whole word
+    _TAG_RE = re.compile(r'<[^>]+>')
+    _SYMBOL_RE = re.compile(r'\b(' + '|'.join(COMMON_SYMBOLS) + r')\b')
+
     def __init__(self, cache_duration_minutes: int = 15):
         """
         Initialize news fetcher.
@@ -175,7 +189,7 @@ class NewsFetcher:
                 # Extract summary
                 summary = entry.get('summary', entry.get('description', ''))
                 # Clean HTML tags from summary
-                summary = re.sub(r'<[^>]+>', '', summary)
+                summary = self._TAG_RE.sub('', summary)
 
                 article = NewsArticle(
                     title=entry.get('title', 'No title'),
@@ -225,25 +239,12 @@ class NewsFetcher:
         Returns:
             List of potential stock symbols
         """
-        # Common Indian stock symbols (this is a simple implementation)
-        common_symbols = [
-            'RELIANCE', 'TCS', 'INFY', 'HDFC', 'HDFCBANK', 'ICICIBANK',
-            'SBIN', 'BAJFINANCE', 'BHARTIARTL', 'ITC', 'KOTAKBANK',
-            'LT', 'AXISBANK', 'ASIANPAINT', 'MARUTI', 'TITAN',
-            'WIPRO', 'NESTLEIND', 'ULTRACEMCO', 'SUNPHARMA',
-            'TATASTEEL', 'TATAMOTORS', 'POWERGRID', 'NTPC', 'ONGC',
-            'ADANIPORTS', 'JSWSTEEL', 'INDUSINDBK', 'TECHM', 'DRREDDY'
-        ]
-
-        symbols_found = []
-        text_upper = text.upper()
-
-        for symbol in common_symbols:
-            # Look for symbol as whole word
-            if re.search(r'\b' + symbol + r'\b', text_upper):
-                symbols_found.append(symbol)
+        # One scan for all symbols; report them in COMMON_SYMBOLS order
+        found = set(self._SYMBOL_RE.findall(text.upper()))
+        if not found:
+            return []
 
-        return symbols_found
+        return [symbol for symbol in self.COMMON_SYMBOLS if symbol in found]
 
     def _article_mentions_symbol(self, article: NewsArticle, symbol: str) -> bool:
         """
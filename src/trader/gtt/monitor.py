@@ -6,8 +6,12 @@ and executing them when trigger conditions are met.
 """
 
 import asyncio
-from typing import Optional, Dict, Any
-from datetime import datetime, time
+from collections import defaultdict
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import datetime, timedelta
+from time import monotonic
+
+import numpy as np
 
 from .storage import GTTStorage
 from .executor import GTTExecutor
@@ -17,6 +21,46 @@ from ..core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Market session as minutes since midnight (9:15 AM - 3:30 PM)
+_MARKET_OPEN_MINUTE = 9 * 60 + 15
+_MARKET_CLOSE_MINUTE = 15 * 60 + 30
+
+# How long a trading-hours answer is reused, in seconds
+_TRADING_HOURS_TTL = 30
+
+# Active GTT count from which trigger evaluation runs in a worker thread;
+# below it the thread hand-off costs more than the NumPy pass
+_OFFLOAD_MIN_GTTS = 64
+
+
+def _triggered_indices(
+    ltps: np.ndarray,
+    symbol_idx: np.ndarray,
+    direction: np.ndarray,
+    trigger_prices: np.ndarray
+) -> np.ndarray:
+    """
+    Find the GTTs whose trigger condition is met (see GTTMonitor._should_trigger).
+
+    Args:
+        ltps: LTP per symbol (NaN when unknown, which never triggers)
+        symbol_idx: Symbol index per GTT
+        direction: 1.0 for BUY, -1.0 for SELL, per GTT
+        trigger_prices: Trigger price per GTT
+
+    Returns:
+        Indices of triggered GTTs, in ascending order
+    """
+    # BUY: ltp <= trigger, SELL: ltp >= trigger, as one signed comparison
+    triggered = (ltps[symbol_idx] - trigger_prices) * direction <= 0.0
+    return np.flatnonzero(triggered)
+
+
+def _retrieve_result(task: asyncio.Future) -> None:
+    """Mark a shared fetch's outcome retrieved, in case every caller left."""
+    if not task.cancelled():
+        task.exception()
+
 
 class GTTMonitor:
     """
@@ -36,7 +80,8 @@ class GTTMonitor:
         groww_client,
         storage: GTTStorage,
         executor: GTTExecutor,
-        check_interval: int = 30
+        check_interval: int = 30,
+        max_concurrent_ltp: int = 5
     ):
         """
         Initialize GTT monitor.
@@ -46,6 +91,7 @@ class GTTMonitor:
             storage: GTTStorage instance
             executor: GTTExecutor instance
             check_interval: Check interval in seconds (default: 30)
+            max_concurrent_ltp: Max LTP requests in flight during a check (default: 5)
         """
         self.groww_client = groww_client
         self.storage = storage
@@ -69,9 +115,32 @@ class GTTMonitor:
         }
 
         # Cache for symbol prices (to reduce API calls)
-        self._price_cache: Dict[str, tuple[float, datetime]] = {}
+        # Price cache as parallel dicts keyed by the interned "SYMBOL:EXCHANGE"
+        # string; expiries are monotonic-clock seconds
+        self._sym_intern: Dict[Tuple[str, str], str] = {}
+        self._cache_price: Dict[str, float] = {}
+        self._cache_expiry: Dict[str, float] = {}
         self._cache_ttl: int = 10  # Cache TTL in seconds
 
+        # Bounds concurrent LTP fetches; created on first use inside the loop
+        self.max_concurrent_ltp = max_concurrent_ltp
+        self._ltp_semaphore: Optional[asyncio.Semaphore] = None
+
+        # LTP fetches in flight, so concurrent callers share one API call
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # Active GTTs packed for vectorized trigger checks, rebuilt whenever
+        # the storage generation changes (see _load_active_gtts)
+        self._active_generation: Optional[Any] = None
+        self._symbol_keys: List[Tuple[str, str]] = []
+        self._active_rows: List[Dict[str, Any]] = []
+        self._trigger_prices = np.empty(0, dtype=np.float64)
+        self._direction = np.empty(0, dtype=np.float64)
+        self._symbol_idx = np.empty(0, dtype=np.int32)
+
+        # (monotonic time computed, result) for _is_trading_hours
+        self._th_cache: Tuple[float, bool] = (float('-inf'), False)
+
         logger.info(
             "GTT monitor initialized",
             check_interval=check_interval
@@ -140,24 +209,41 @@ class GTTMonitor:
         """
         logger.info("GTT monitoring loop started")
 
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+
         try:
             while self._running:
                 # Check if paused
                 if self._paused:
                     await asyncio.sleep(self.check_interval)
+                    next_tick = loop.time()
                     continue
 
                 # Check if market hours (optional - can be configured)
                 if not self._is_trading_hours():
-                    logger.debug("Outside trading hours, skipping GTT check")
-                    await asyncio.sleep(60)  # Check every minute during off-hours
+                    delay = self._seconds_until_market_open()
+                    logger.debug(
+                        "Outside trading hours, sleeping until market open",
+                        seconds=delay
+                    )
+                    await asyncio.sleep(delay)
+
+                    # Re-evaluate trading hours on wake-up
+                    self._th_cache = (float('-inf'), False)
+                    next_tick = loop.time()
                     continue
 
                 # Perform GTT check
                 await self._check_gtts()
 
-                # Wait for next check
-                await asyncio.sleep(self.check_interval)
+                # Wait for next check, keeping a fixed cadence regardless of
+                # how long the check took (an overrun checks again right away)
+                next_tick += self.check_interval
+                now = loop.time()
+                if next_tick < now:
+                    next_tick = now
+                await asyncio.sleep(next_tick - now)
 
         except asyncio.CancelledError:
             logger.info("GTT monitoring loop cancelled")
@@ -178,43 +264,47 @@ class GTTMonitor:
             self.stats['checks_performed'] += 1
             self.stats['last_check_time'] = datetime.now().isoformat()
 
-            # Get all active GTTs
-            active_gtts = await self.storage.get_active_gtts()
+            # Reload active GTTs only when storage reports a change
+            generation = await self.storage.get_generation()
+            if generation != self._active_generation:
+                self._load_active_gtts(await self.storage.get_active_gtts_grouped())
+                self._active_generation = generation
+
+            # Hold on to this tick's active set; an overlapping check may
+            # reload it while this one awaits
+            symbol_keys, rows = self._symbol_keys, self._active_rows
+            symbol_idx = self._symbol_idx
+            direction, trigger_prices = self._direction, self._trigger_prices
 
-            if not active_gtts:
+            if not rows:
                 logger.debug("No active GTTs to check")
                 return
 
-            logger.debug(f"Checking {len(active_gtts)} active GTTs")
+            logger.debug(
+                f"Checking {len(rows)} active GTTs across {len(symbol_keys)} symbols"
+            )
 
-            # Group GTTs by symbol to minimize API calls
-            gtts_by_symbol = self._group_by_symbol(active_gtts)
+            # Fetch LTPs for all symbols concurrently
+            results = await asyncio.gather(
+                *(self._get_ltp(symbol, exchange) for symbol, exchange in symbol_keys),
+                return_exceptions=True
+            )
 
-            # Check each symbol
-            for symbol_key, gtts in gtts_by_symbol.items():
-                symbol, exchange = symbol_key.split(':')
+            # Symbols whose fetch failed keep NaN, which never meets a trigger
+            ltps = np.full(len(results), np.nan)
 
+            for i, ((symbol, exchange), ltp) in enumerate(zip(symbol_keys, results)):
                 try:
-                    # Get current LTP
-                    ltp = await self._get_ltp(symbol, exchange)
-
+                    # Surface a failed fetch to the handlers below; a
+                    # cancelled fetch is a failed fetch, not a cancelled check
+                    if isinstance(ltp, asyncio.CancelledError):
+                        raise DataFetchError("LTP fetch cancelled", data_type="ltp")
+                    if isinstance(ltp, BaseException):
+                        raise ltp
+
+                    ltps[i] = ltp
                     self.stats['symbols_checked'] += 1
 
-                    # Check each GTT for this symbol
-                    for gtt in gtts:
-                        if self._should_trigger(gtt, ltp):
-                            logger.info(
-                                "GTT trigger condition met",
-                                gtt_id=gtt.id,
-                                symbol=symbol,
-                                trigger_price=gtt.trigger_price,
-                                current_ltp=ltp,
-                                action=gtt.action
-                            )
-
-                            # Execute GTT
-                            await self._execute_gtt(gtt, ltp)
-
                 except DataFetchError as e:
                     self.stats['api_errors'] += 1
                     logger.warning(
@@ -231,9 +321,59 @@ class GTTMonitor:
                     )
                     # Continue checking other symbols
 
+            # Evaluate every trigger in one pass, off the event loop for
+            # large active sets so stop/pause/check_now stay responsive
+            trigger_args = (ltps, symbol_idx, direction, trigger_prices)
+            if len(rows) >= _OFFLOAD_MIN_GTTS:
+                triggered = await asyncio.to_thread(_triggered_indices, *trigger_args)
+            else:
+                triggered = _triggered_indices(*trigger_args)
+
+            # Rows are only turned into GTTOrder objects once triggered
+            to_execute: Dict[str, List[Tuple[GTTOrder, float]]] = defaultdict(list)
+            for i in triggered.tolist():
+                row = rows[i]
+                ltp = float(ltps[symbol_idx[i]])
+
+                try:
+                    gtt = GTTOrder(**row)
+                except Exception as e:
+                    logger.error(
+                        f"Error checking GTTs for {row['symbol']}: {e}",
+                        symbol=row['symbol']
+                    )
+                    # Continue with other triggered GTTs
+                    continue
+
+                logger.info(
+                    "GTT trigger condition met",
+                    gtt_id=gtt.id,
+                    symbol=gtt.symbol,
+                    trigger_price=gtt.trigger_price,
+                    current_ltp=ltp,
+                    action=gtt.action
+                )
+                to_execute[gtt.symbol].append((gtt, ltp))
+
+            # Execute symbols concurrently; GTTs on the same symbol run in
+            # order so each one's risk check sees the previous fill
+            await asyncio.gather(*(
+                self._execute_gtts(triggered_gtts) for triggered_gtts in to_execute.values()
+            ))
+
         except Exception as e:
             logger.error(f"Error in GTT check: {e}")
 
+    async def _execute_gtts(self, triggered_gtts: List[Tuple[GTTOrder, float]]) -> None:
+        """
+        Execute triggered GTTs one after another.
+
+        Args:
+            triggered_gtts: (GTT order, triggering LTP) pairs for one symbol
+        """
+        for gtt, ltp in triggered_gtts:
+            await self._execute_gtt(gtt, ltp)
+
     async def _execute_gtt(self, gtt: GTTOrder, ltp: float) -> None:
         """
         Execute triggered GTT.
@@ -282,25 +422,50 @@ class GTTMonitor:
         Returns:
             Last traded price
         """
-        cache_key = f"{symbol}:{exchange}"
+        cache_key = self._sym_intern.get((symbol, exchange))
+        if cache_key is None:
+            cache_key = self._sym_intern[(symbol, exchange)] = f"{symbol}:{exchange}"
 
         # Check cache
-        if cache_key in self._price_cache:
-            cached_price, cached_time = self._price_cache[cache_key]
-            age = (datetime.now() - cached_time).total_seconds()
-
-            if age < self._cache_ttl:
-                logger.debug(
-                    f"Using cached LTP for {symbol}",
-                    age_seconds=age
-                )
-                return cached_price
+        if monotonic() < self._cache_expiry.get(cache_key, 0.0):
+            logger.debug(f"Using cached LTP for {symbol}")
+            return self._cache_price[cache_key]
+
+        # Join the fetch in flight for this symbol, or start one. The fetch
+        # runs in its own task so a cancelled caller never cancels it for
+        # the others
+        pending = self._inflight.get(cache_key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch_ltp(symbol, exchange, cache_key))
+            pending.add_done_callback(_retrieve_result)
+            self._inflight[cache_key] = pending
+
+        return await asyncio.shield(pending)
+
+    async def _fetch_ltp(self, symbol: str, exchange: str, cache_key: str) -> float:
+        """
+        Fetch LTP from the API and cache it (see _get_ltp).
+
+        Args:
+            symbol: Trading symbol
+            exchange: Exchange
+            cache_key: Interned "SYMBOL:EXCHANGE" cache key
 
-        # Fetch fresh LTP
-        ltp = await self.groww_client.get_ltp(symbol, exchange)
+        Returns:
+            Last traded price
+        """
+        if self._ltp_semaphore is None:
+            self._ltp_semaphore = asyncio.Semaphore(self.max_concurrent_ltp)
+
+        try:
+            async with self._ltp_semaphore:
+                ltp = await self.groww_client.get_ltp(symbol, exchange)
+        finally:
+            self._inflight.pop(cache_key, None)
 
         # Update cache
-        self._price_cache[cache_key] = (ltp, datetime.now())
+        self._cache_price[cache_key] = ltp
+        self._cache_expiry[cache_key] = monotonic() + self._cache_ttl
 
         return ltp
 
@@ -337,25 +502,33 @@ class GTTMonitor:
 
         return should_trigger
 
-    def _group_by_symbol(self, gtts: list[GTTOrder]) -> Dict[str, list[GTTOrder]]:
+    def _load_active_gtts(self, gtts_by_symbol: Dict[str, List[Dict[str, Any]]]) -> None:
         """
-        Group GTTs by symbol to minimize API calls.
+        Pack active GTTs into flat arrays for vectorized trigger checks.
 
         Args:
-            gtts: List of GTT orders
-
-        Returns:
-            Dictionary mapping "symbol:exchange" to list of GTTs
+            gtts_by_symbol: Row dicts keyed by "symbol:exchange", as returned
+                by GTTStorage.get_active_gtts_grouped()
         """
-        grouped = {}
-
-        for gtt in gtts:
-            key = f"{gtt.symbol}:{gtt.exchange}"
-            if key not in grouped:
-                grouped[key] = []
-            grouped[key].append(gtt)
-
-        return grouped
+        symbol_keys = []
+        rows = []
+        symbol_idx = []
+
+        for i, (symbol_key, gtts) in enumerate(gtts_by_symbol.items()):
+            symbol, exchange = symbol_key.split(':')
+            symbol_keys.append((symbol, exchange))
+            rows.extend(gtts)
+            symbol_idx.extend([i] * len(gtts))
+
+        self._symbol_keys = symbol_keys
+        self._active_rows = rows
+        self._trigger_prices = np.array(
+            [row['trigger_price'] for row in rows], dtype=np.float64
+        )
+        self._direction = np.array(
+            [1.0 if row['action'] == "BUY" else -1.0 for row in rows], dtype=np.float64
+        )
+        self._symbol_idx = np.array(symbol_idx, dtype=np.int32)
 
     def _is_trading_hours(self) -> bool:
         """
@@ -371,21 +544,44 @@ class GTTMonitor:
             - Market holidays
             - Pre-market and post-market sessions
             - Different exchanges
+
+            The answer is reused for _TRADING_HOURS_TTL seconds.
         """
+        mono = monotonic()
+        computed_at, result = self._th_cache
+        if mono - computed_at < _TRADING_HOURS_TTL:
+            return result
+
         now = datetime.now()
+        minute_of_day = now.hour * 60 + now.minute
 
-        # Check if weekend
-        if now.weekday() >= 5:  # Saturday = 5, Sunday = 6
-            return False
+        # Weekdays only (Saturday = 5, Sunday = 6), 9:15 AM - 3:30 PM
+        # For testing/paper trading, you might want to allow 24/7
+        result = (
+            now.weekday() < 5
+            and _MARKET_OPEN_MINUTE <= minute_of_day < _MARKET_CLOSE_MINUTE
+        )
 
-        # Check time (9:15 AM - 3:30 PM)
-        current_time = now.time()
-        market_open = time(9, 15)
-        market_close = time(15, 30)
+        self._th_cache = (mono, result)
+        return result
 
-        # For testing/paper trading, you might want to allow 24/7
-        # Comment out the time check below for 24/7 monitoring
-        return market_open <= current_time <= market_close
+    def _seconds_until_market_open(self) -> float:
+        """
+        Get the time until the next market open (9:15 AM on a weekday).
+
+        Returns:
+            Seconds until the next session opens (0 if it is opening now)
+        """
+        now = datetime.now()
+        hour, minute = divmod(_MARKET_OPEN_MINUTE, 60)
+        next_open = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+
+        if now >= next_open:
+            next_open += timedelta(days=1)
+        while next_open.weekday() >= 5:  # Skip Saturday and Sunday
+            next_open += timedelta(days=1)
+
+        return max(0.0, (next_open - now).total_seconds())
 
     async def check_now(self) -> None:
         """
@@ -426,7 +622,7 @@ class GTTMonitor:
         # Add current state
         stats['is_running'] = self._running
         stats['is_paused'] = self._paused
-        stats['cache_size'] = len(self._price_cache)
+        stats['cache_size'] = len(self._cache_price)
 
         # Calculate success rate
         total_triggers = stats['gtts_triggered'] + stats['trigger_failures']
@@ -448,8 +644,9 @@ class GTTMonitor:
 
     def clear_price_cache(self) -> None:
         """Clear price cache (useful for testing or manual refresh)."""
-        logger.debug(f"Clearing price cache ({len(self._price_cache)} entries)")
-        self._price_cache.clear()
+        logger.debug(f"Clearing price cache ({len(self._cache_price)} entries)")
+        self._cache_price.clear()
+        self._cache_expiry.clear()
 
     def __repr__(self) -> str:
         """String representation."""
@@ -7,17 +7,33 @@ which are custom trigger-based orders that execute when price conditions are met
 
 import sqlite3
 import asyncio
-from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Union
 from contextlib import asynccontextmanager
 
+try:
+    import orjson as json  # Optional, see the `speed` extra
+except ImportError:
+    import json
+
 from ..api.models import GTTOrder, GTTStatus
 from ..api.exceptions import GTTError, GTTNotFoundError
 from ..core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# GTTOrder fields in gtt_orders column order; `SELECT *` rows zip onto these
+# (trailing trigger_ltp/notes columns are not part of the model)
+_GTT_FIELDS = (
+    'id', 'symbol', 'exchange', 'trigger_price', 'order_type', 'action',
+    'quantity', 'limit_price', 'status', 'created_at', 'triggered_at',
+    'completed_at', 'order_id', 'error_message'
+)
+
+# Sort key for row dicts: oldest first, ties broken by insertion order
+_CREATION_ORDER = itemgetter('created_at', 'id')
+
 
 class GTTStorage:
     """
@@ -31,25 +47,38 @@ class GTTStorage:
     - Provide transaction support
     """
 
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(self, db_path: Optional[Union[str, Path]] = None):
         """
         Initialize GTT storage.
 
         Args:
-            db_path: Path to SQLite database file (default: data/gtt_orders.db)
+            db_path: Path to SQLite database file (default: data/gtt_orders.db),
+                or ":memory:" / a "file:" URI such as
+                "file:gtt?mode=memory&cache=shared" for an in-memory database
         """
         if db_path is None:
             # Default to data/gtt_orders.db
             db_path = Path(__file__).parent.parent.parent.parent / "data" / "gtt_orders.db"
 
-        self.db_path = Path(db_path)
+        # In-memory databases and URIs are passed to SQLite as-is
+        self._is_uri = isinstance(db_path, str) and (
+            db_path == ":memory:" or db_path.startswith("file:")
+        )
+
+        if self._is_uri:
+            self.db_path = db_path
+        else:
+            self.db_path = Path(db_path)
 
-        # Ensure data directory exists
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            # Ensure data directory exists
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Connection will be created per thread/task
         self._conn: Optional[sqlite3.Connection] = None
 
+        # Bumped on every write through this instance (see get_generation)
+        self._generation: int = 0
+
         logger.info(f"GTT storage initialized at {self.db_path}")
 
         # Initialize database schema
@@ -118,9 +147,18 @@ class GTTStorage:
             so we use one connection per async task context.
         """
         if self._conn is None:
-            self._conn = sqlite3.connect(str(self.db_path))
+            self._conn = sqlite3.connect(str(self.db_path), uri=self._is_uri)
             self._conn.row_factory = sqlite3.Row  # Enable column access by name
 
+            # WAL + synchronous=NORMAL: commits append to the log instead of
+            # fsyncing the main database file every time
+            self._conn.executescript("""
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA mmap_size=268435456;
+            """)
+
         return self._conn
 
     async def create_gtt(
@@ -153,34 +191,88 @@ class GTTStorage:
         Raises:
             GTTError: If creation fails
         """
+        gtts = await self.create_gtts_bulk([{
+            'symbol': symbol,
+            'exchange': exchange,
+            'trigger_price': trigger_price,
+            'order_type': order_type,
+            'action': action,
+            'quantity': quantity,
+            'limit_price': limit_price,
+            'notes': notes
+        }])
+        return gtts[0]
+
+    async def create_gtts_bulk(self, orders: List[Dict[str, Any]]) -> List[GTTOrder]:
+        """
+        Create several GTT orders in a single transaction.
+
+        One commit (and fsync) covers the whole batch; either every order
+        is created or none is.
+
+        Args:
+            orders: Dicts with the create_gtt arguments (limit_price and
+                notes are optional)
+
+        Returns:
+            Created GTTOrders with IDs, in input order
+
+        Raises:
+            GTTError: If creation fails
+        """
+        if not orders:
+            return []
+
         try:
             conn = await self._get_connection()
 
-            cursor = conn.execute("""
-                INSERT INTO gtt_orders (
-                    symbol, exchange, trigger_price, order_type, action,
-                    quantity, limit_price, status, notes
+            rows = [
+                (
+                    order['symbol'], order['exchange'], order['trigger_price'],
+                    order['order_type'], order['action'], order['quantity'],
+                    order.get('limit_price'), GTTStatus.ACTIVE.value, order.get('notes')
+                )
+                for order in orders
+            ]
+
+            # IMMEDIATE takes the write lock up front, so the AUTOINCREMENT
+            # IDs of the batch are contiguous
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany("""
+                    INSERT INTO gtt_orders (
+                        symbol, exchange, trigger_price, order_type, action,
+                        quantity, limit_price, status, notes
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, rows)
+                last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
+            self._generation += 1
+            first_id = last_id - len(rows) + 1
+
+            for gtt_id, order in enumerate(orders, first_id):
+                logger.info(
+                    "GTT order created",
+                    gtt_id=gtt_id,
+                    symbol=order['symbol'],
+                    action=order['action'],
+                    trigger_price=order['trigger_price'],
+                    quantity=order['quantity']
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                symbol, exchange, trigger_price, order_type, action,
-                quantity, limit_price, GTTStatus.ACTIVE.value, notes
-            ))
-
-            conn.commit()
-            gtt_id = cursor.lastrowid
 
-            logger.info(
-                "GTT order created",
-                gtt_id=gtt_id,
-                symbol=symbol,
-                action=action,
-                trigger_price=trigger_price,
-                quantity=quantity
-            )
+            # Fetch and return the created GTTs
+            cursor = conn.execute("""
+                SELECT * FROM gtt_orders
+                WHERE id BETWEEN ? AND ?
+                ORDER BY id ASC
+            """, (first_id, last_id))
 
-            # Fetch and return the created GTT
-            return await self.get_gtt(gtt_id)
+            return [self._row_to_gtt(row) for row in cursor]
 
         except Exception as e:
             logger.error(f"Failed to create GTT: {e}")
@@ -247,6 +339,72 @@ class GTTStorage:
             logger.error(f"Failed to get active GTTs: {e}")
             raise GTTError(f"Failed to retrieve active GTTs: {str(e)}")
 
+    async def get_active_gtts_grouped(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get active GTT orders grouped by symbol, without building GTTOrder objects.
+
+        Grouping happens in SQL, so callers only pay for hydrating the rows
+        they actually act on (e.g. via GTTOrder(**row)).
+
+        Returns:
+            Dictionary mapping "symbol:exchange" to lists of row dicts,
+            oldest first within each group
+        """
+        try:
+            conn = await self._get_connection()
+
+            cursor = conn.execute("""
+                SELECT symbol || ':' || exchange AS symbol_key,
+                       json_group_array(json_object(
+                           'id', id,
+                           'symbol', symbol,
+                           'exchange', exchange,
+                           'trigger_price', trigger_price,
+                           'order_type', order_type,
+                           'action', action,
+                           'quantity', quantity,
+                           'limit_price', limit_price,
+                           'status', status,
+                           'created_at', created_at,
+                           'triggered_at', triggered_at,
+                           'completed_at', completed_at,
+                           'order_id', order_id,
+                           'error_message', error_message
+                       )) AS gtts
+                FROM gtt_orders
+                WHERE status = ?
+                GROUP BY symbol, exchange
+            """, (GTTStatus.ACTIVE.value,))
+
+            grouped = {row['symbol_key']: json.loads(row['gtts']) for row in cursor}
+
+            # SQLite doesn't guarantee json_group_array input order; sort here
+            for gtts in grouped.values():
+                gtts.sort(key=_CREATION_ORDER)
+
+            logger.debug(f"Retrieved active GTT orders for {len(grouped)} symbols")
+
+            return grouped
+
+        except Exception as e:
+            logger.error(f"Failed to get grouped active GTTs: {e}")
+            raise GTTError(f"Failed to retrieve active GTTs: {str(e)}")
+
+    async def get_generation(self) -> Tuple[int, int]:
+        """
+        Get a token that changes whenever gtt_orders may have changed.
+
+        Combines a counter of writes made through this instance with
+        SQLite's data_version, which changes when another connection
+        (e.g. the CLI) commits to the same database file.
+
+        Returns:
+            Opaque generation token; compare for equality only
+        """
+        conn = await self._get_connection()
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        return (self._generation, data_version)
+
     async def get_gtts_by_symbol(
         self,
         symbol: str,
@@ -388,6 +546,7 @@ class GTTStorage:
 
             cursor = conn.execute(query, params)
             conn.commit()
+            self._generation += 1
 
             if cursor.rowcount == 0:
                 raise GTTNotFoundError(f"GTT order {gtt_id} not found", gtt_id=gtt_id)
@@ -464,6 +623,7 @@ class GTTStorage:
 
             cursor = conn.execute("DELETE FROM gtt_orders WHERE id = ?", (gtt_id,))
             conn.commit()
+            self._generation += 1
 
             if cursor.rowcount == 0:
                 raise GTTNotFoundError(f"GTT order {gtt_id} not found", gtt_id=gtt_id)
@@ -538,34 +698,23 @@ class GTTStorage:
         """
         Convert database row to GTTOrder.
 
+        Columns are read positionally (see _GTT_FIELDS) and timestamps are
+        parsed by the model, which avoids a by-name lookup per field.
+
         Args:
-            row: Database row
+            row: Database row from a `SELECT * FROM gtt_orders` query
 
         Returns:
             GTTOrder object
         """
-        return GTTOrder(
-            id=row['id'],
-            symbol=row['symbol'],
-            exchange=row['exchange'],
-            trigger_price=row['trigger_price'],
-            order_type=row['order_type'],
-            action=row['action'],
-            quantity=row['quantity'],
-            limit_price=row['limit_price'],
-            status=row['status'],
-            created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None,
-            triggered_at=datetime.fromisoformat(row['triggered_at']) if row['triggered_at'] else None,
-            completed_at=datetime.fromisoformat(row['completed_at']) if row['completed_at'] else None,
-            order_id=row['order_id'],
-            error_message=row['error_message']
-        )
+        return GTTOrder.model_validate(dict(zip(_GTT_FIELDS, row)))
 
     async def close(self) -> None:
         """Close database connection."""
         if self._conn:
             self._conn.close()
             self._conn = None
+            self._generation += 1  # data_version restarts on a new connection
             logger.info("GTT storage connection closed")
 
     def __repr__(self) -> str:
@@ -94,6 +94,7 @@ async def app_lifespan():
     # Initialize risk manager
     logger.info("Initializing risk manager...")
     risk_manager = RiskManager(groww_client, config=config)
+    await risk_manager.start_recording()
 
     # Initialize kill switch
     logger.info("Initializing kill switch...")
@@ -153,6 +154,10 @@ async def app_lifespan():
     logger.info("Stopping kill switch monitoring...")
     await kill_switch.stop_monitoring()
 
+    # Flush pending order records
+    logger.info("Stopping order recording...")
+    await risk_manager.stop_recording()
+
     # Close GTT storage
     logger.info("Closing GTT storage...")
     await gtt_storage.close()
@@ -168,6 +173,28 @@ mcp.lifespan(app_lifespan)
 from . import tools  # noqa: E402, F401
 
 
+def _install_uvloop() -> bool:
+    """
+    Use uvloop for the server event loop when it is installed.
+
+    uvloop is optional (not available on Windows); the default asyncio
+    loop is used otherwise.
+
+    Returns:
+        True if uvloop was installed
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed, using default asyncio event loop")
+        return False
+
+    # Set the policy directly; uvloop.install() is deprecated on newer Pythons
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+    return True
+
+
 def main():
     """
     Main entry point for MCP server.
@@ -193,6 +220,8 @@ def main():
         logger.warning("⚠️  Ensure you have tested thoroughly in paper mode first")
 
     # Run server
+    _install_uvloop()
+
     try:
         mcp.run()
     except KeyboardInterrupt:
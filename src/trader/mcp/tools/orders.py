@@ -4,16 +4,56 @@ MCP Tools for Order Management.
 Provides tools for placing, canceling, and monitoring orders with full risk validation.
 """
 
+import asyncio
 from typing import Optional, Dict, Any, List
 
 from mcp.server.fastmcp import Context
 
 from ..server import mcp
 from ...core.logging_config import get_logger
-from ...api.exceptions import OrderError, RiskError
+from ...api.exceptions import OrderError, RiskManagementError
 
 logger = get_logger(__name__)
 
+# Order types that require a limit price / trigger price
+_REQUIRES_PRICE = frozenset({"LIMIT", "SL"})
+_REQUIRES_TRIGGER = frozenset({"SL", "SL-M"})
+_MARKET = "MARKET"
+
+_PAPER_WARNING = "PAPER MODE - Order simulated, not sent to exchange"
+
+
+async def _place_and_record(
+    groww_client,
+    risk_manager,
+    reservation,
+    params: Dict[str, Any]
+):
+    """
+    Place an approved order, record it, and release its risk reservation.
+
+    Args:
+        groww_client: Groww client to place the order with
+        risk_manager: Risk manager that issued the reservation
+        reservation: Reservation from risk_manager.reserve_order
+        params: place_order keyword arguments
+
+    Returns:
+        The placed Order
+    """
+    try:
+        order = await groww_client.place_order(**params)
+    except Exception:
+        risk_manager.release_reservation(reservation, placed=False)
+        raise
+
+    try:
+        await risk_manager.enqueue_order(order)
+    finally:
+        risk_manager.release_reservation(reservation, placed=True)
+
+    return order
+
 
 @mcp.tool()
 async def place_order(
@@ -62,7 +102,9 @@ async def place_order(
         )
     """
     logger.info(
-        f"Placing {transaction_type} order for {symbol}",
+        "Placing order",
+        symbol=symbol,
+        transaction_type=transaction_type,
         quantity=quantity,
         order_type=order_type,
         price=price
@@ -82,49 +124,63 @@ async def place_order(
             raise OrderError(error_msg)
 
         # 2. Validate order type and price requirements
-        if order_type in ["LIMIT", "SL"] and price is None:
+        if order_type in _REQUIRES_PRICE and price is None:
             raise OrderError(f"{order_type} order requires price parameter")
 
-        if order_type in ["SL", "SL-M"] and trigger_price is None:
+        if order_type in _REQUIRES_TRIGGER and trigger_price is None:
             raise OrderError(f"{order_type} order requires trigger_price parameter")
 
-        # Use current market price for MARKET orders
-        if order_type == "MARKET":
-            ltp = await groww_client.get_ltp(symbol, exchange)
-            price = ltp
-            logger.info(f"Using market price for MARKET order: {price}")
+        # Reject before any network call if today's order limit is exhausted
+        if risk_manager.daily_order_limit_reached():
+            error_msg = (
+                f"Order rejected by risk manager: daily order limit reached "
+                f"({risk_manager.max_daily_orders})"
+            )
+            logger.warning(error_msg, symbol=symbol, quantity=quantity)
+            raise RiskManagementError(error_msg)
 
         # 3. Risk validation
-        validation = await risk_manager.validate_order(
+        if order_type == _MARKET:
+            # Use current market price for MARKET orders
+            price = await groww_client.get_ltp(symbol, exchange)
+            logger.info("Using market price for MARKET order", price=price)
+
+        validation, reservation = risk_manager.reserve_order(
             symbol=symbol,
             quantity=quantity,
             price=price,
-            transaction_type=transaction_type
+            transaction_type=transaction_type,
+            order_type=order_type,
+            exchange=exchange,
+            product=product,
+            segment=segment
         )
 
         if not validation.approved:
             error_msg = f"Order rejected by risk manager: {validation.reason}"
             logger.warning(error_msg, symbol=symbol, quantity=quantity)
-            raise RiskError(error_msg)
+            raise RiskManagementError(error_msg)
 
         logger.info("Order passed risk validation")
 
-        # 4. Place order via Groww client
-        order = await groww_client.place_order(
-            symbol=symbol,
-            exchange=exchange,
-            transaction_type=transaction_type,
-            quantity=quantity,
-            order_type=order_type,
-            price=price,
-            trigger_price=trigger_price,
-            product=product,
-            segment=segment
+        # 4-5. Place order via Groww client and record it with the risk manager
+        order = await _place_and_record(
+            groww_client,
+            risk_manager,
+            reservation,
+            {
+                "symbol": symbol,
+                "exchange": exchange,
+                "transaction_type": transaction_type,
+                "quantity": quantity,
+                "order_type": order_type,
+                "price": price,
+                "trigger_price": trigger_price,
+                "product": product,
+                "segment": segment
+            }
         )
 
-        # 5. Record order with risk manager
-        await risk_manager.record_order(order)
-
         logger.info(
             "Order placed successfully",
             order_id=order.order_id,
@@ -138,15 +194,199 @@ async def place_order(
         result["paper_mode"] = config.is_paper_mode()
 
         if config.is_paper_mode():
-            result["warning"] = "PAPER MODE - Order simulated, not sent to exchange"
+            result["warning"] = _PAPER_WARNING
 
         return result
 
-    except (OrderError, RiskError) as e:
-        logger.error(f"Order placement failed: {e}", symbol=symbol)
+    except (OrderError, RiskManagementError) as e:
+        logger.error("Order placement failed", error=str(e), symbol=symbol)
         raise
     except Exception as e:
-        logger.error(f"Unexpected error placing order: {e}", symbol=symbol)
+        logger.error("Unexpected error placing order", error=str(e), symbol=symbol)
+        raise
+
+
+@mcp.tool()
+async def place_orders(
+    orders: List[Dict[str, Any]],
+    ctx: Optional[Context] = None
+) -> List[Dict[str, Any]]:
+    """
+    Place multiple orders in one call with full risk validation.
+
+    Runs the same checks as place_order, but batched:
+    1. Kill switch check (once for the whole batch)
+    2. LTP fetch for all MARKET orders (concurrently)
+    3. Risk validation and placement per order (concurrently across
+       symbols, in input order per symbol). Each approved order reserves
+       its daily-order and open-position slots before the network call,
+       so the batch as a whole cannot exceed those limits.
+
+    Args:
+        orders: List of order dicts accepting the same keys as place_order
+            (symbol, transaction_type, quantity, order_type, price,
+            trigger_price, exchange, product, segment)
+
+    Returns:
+        List of per-order results, in input order, each with "success" and
+        either the order details or an "error" message
+
+    Example:
+        place_orders(orders=[
+            {"symbol": "RELIANCE", "transaction_type": "BUY", "quantity": 1,
+             "order_type": "LIMIT", "price": 2500.00},
+            {"symbol": "TCS", "transaction_type": "BUY", "quantity": 1,
+             "order_type": "MARKET"}
+        ])
+    """
+    logger.info("Placing order batch", count=len(orders))
+
+    try:
+        groww_client = ctx.request_context.groww_client
+        risk_manager = ctx.request_context.risk_manager
+        kill_switch = ctx.request_context.kill_switch
+        config = ctx.request_context.config
+
+        # 1. Check kill switch once for the whole batch
+        if kill_switch.is_active():
+            error_msg = "Kill switch is ACTIVE - trading halted. Cannot place orders."
+            logger.error(error_msg)
+            raise OrderError(error_msg)
+
+        # Reject before any network call if today's order limit is exhausted
+        if risk_manager.daily_order_limit_reached():
+            error_msg = (
+                f"Orders rejected by risk manager: daily order limit reached "
+                f"({risk_manager.max_daily_orders})"
+            )
+            logger.warning(error_msg)
+            raise RiskManagementError(error_msg)
+
+        paper_mode = config.is_paper_mode()
+
+        # 2. Normalize orders and validate order type and price requirements
+        prepared: List[Optional[Dict[str, Any]]] = []
+        results: List[Optional[Dict[str, Any]]] = []
+
+        for item in orders:
+            params = {
+                "symbol": item.get("symbol"),
+                "transaction_type": item.get("transaction_type"),
+                "quantity": item.get("quantity"),
+                "order_type": item.get("order_type", "LIMIT"),
+                "price": item.get("price"),
+                "trigger_price": item.get("trigger_price"),
+                "exchange": item.get("exchange", "NSE"),
+                "product": item.get("product", "CNC"),
+                "segment": item.get("segment", "EQUITY")
+            }
+            order_type = params["order_type"]
+
+            error = None
+            if not params["symbol"] or not params["transaction_type"] or not params["quantity"]:
+                error = "Order requires symbol, transaction_type and quantity"
+            elif order_type in _REQUIRES_PRICE and params["price"] is None:
+                error = f"{order_type} order requires price parameter"
+            elif order_type in _REQUIRES_TRIGGER and params["trigger_price"] is None:
+                error = f"{order_type} order requires trigger_price parameter"
+
+            if error:
+                prepared.append(None)
+                results.append({"symbol": params["symbol"], "success": False, "error": error})
+            else:
+                prepared.append(params)
+                results.append(None)
+
+        # 3. Fetch LTPs for all MARKET orders concurrently
+        market_orders = [
+            params for params in prepared
+            if params is not None and params["order_type"] == _MARKET
+        ]
+        ltps = await asyncio.gather(
+            *[
+                groww_client.get_ltp(params["symbol"], params["exchange"])
+                for params in market_orders
+            ],
+            return_exceptions=True
+        )
+        for params, ltp in zip(market_orders, ltps):
+            params["price"] = ltp
+
+        # 4. Validate and place each order; same-symbol orders keep input order
+        async def submit(params: Dict[str, Any]) -> Dict[str, Any]:
+            symbol = params["symbol"]
+
+            if isinstance(params["price"], Exception):
+                return {
+                    "symbol": symbol,
+                    "success": False,
+                    "error": f"Failed to fetch market price: {params['price']}"
+                }
+
+            try:
+                async with risk_manager.symbol_lock(symbol):
+                    validation, reservation = risk_manager.reserve_order(
+                        symbol=symbol,
+                        quantity=params["quantity"],
+                        price=params["price"],
+                        transaction_type=params["transaction_type"],
+                        order_type=params["order_type"],
+                        exchange=params["exchange"],
+                        product=params["product"],
+                        segment=params["segment"]
+                    )
+
+                    if not validation.approved:
+                        return {
+                            "symbol": symbol,
+                            "success": False,
+                            "error": f"Order rejected by risk manager: {validation.reason}"
+                        }
+
+                    order = await _place_and_record(
+                        groww_client, risk_manager, reservation, params
+                    )
+
+            except Exception as e:
+                logger.error("Order placement failed", error=str(e), symbol=symbol)
+                return {"symbol": symbol, "success": False, "error": str(e)}
+
+            result = order.model_dump()
+            result["success"] = True
+            result["paper_mode"] = paper_mode
+
+            if paper_mode:
+                result["warning"] = _PAPER_WARNING
+
+            return result
+
+        submitted = await asyncio.gather(
+            *[submit(params) for params in prepared if params is not None]
+        )
+
+        submitted_iter = iter(submitted)
+        results = [
+            result if result is not None else next(submitted_iter)
+            for result in results
+        ]
+
+        succeeded = sum(1 for result in results if result["success"])
+
+        logger.info(
+            "Order batch processed",
+            total=len(results),
+            succeeded=succeeded,
+            failed=len(results) - succeeded,
+            paper_mode=paper_mode
+        )
+
+        return results
+
+    except (OrderError, RiskManagementError) as e:
+        logger.error("Batch order placement failed", error=str(e))
+        raise
+    except Exception as e:
+        logger.error("Unexpected error placing order batch", error=str(e))
         raise
 
 
@@ -169,7 +409,7 @@ async def cancel_order(
     Example:
         cancel_order(order_id="123456789", segment="EQUITY")
     """
-    logger.info(f"Cancelling order {order_id}")
+    logger.info("Cancelling order", order_id=order_id)
 
     try:
         groww_client = ctx.request_context.groww_client
@@ -191,7 +431,7 @@ async def cancel_order(
         }
 
     except Exception as e:
-        logger.error(f"Error cancelling order: {e}", order_id=order_id)
+        logger.error("Error cancelling order", error=str(e), order_id=order_id)
         raise
 
 
@@ -212,7 +452,7 @@ async def get_order_status(
     Example:
         get_order_status(order_id="123456789")
     """
-    logger.info(f"Fetching status for order {order_id}")
+    logger.info("Fetching order status", order_id=order_id)
 
     try:
         groww_client = ctx.request_context.groww_client
@@ -228,7 +468,7 @@ async def get_order_status(
         return status
 
     except Exception as e:
-        logger.error(f"Error fetching order status: {e}", order_id=order_id)
+        logger.error("Error fetching order status", error=str(e), order_id=order_id)
         raise
 
 
@@ -260,6 +500,10 @@ async def get_risk_status(
         kill_switch = ctx.request_context.kill_switch
         config = ctx.request_context.config
 
+        # Static limits are cached on the config; only availability is per call
+        limits = config.risk_limits_snapshot
+        kill_switch_active = kill_switch.is_active()
+
         # Get risk status from manager
         status = await risk_manager.get_status()
 
@@ -268,20 +512,13 @@ async def get_risk_status(
             "daily_pnl": status.daily_pnl,
             "open_positions": status.open_positions,
             "daily_order_count": status.daily_order_count,
-            "kill_switch_active": kill_switch.is_active(),
+            "kill_switch_active": kill_switch_active,
             "paper_mode": config.is_paper_mode(),
-            "limits": {
-                "max_portfolio_value": config.get('risk.max_portfolio_value'),
-                "max_position_size": config.get('risk.max_position_size'),
-                "max_daily_loss": config.get('risk.max_daily_loss'),
-                "max_open_positions": config.get('risk.max_open_positions'),
-                "max_single_order": config.hard_limits['MAX_SINGLE_ORDER_VALUE'],
-                "max_daily_orders": config.hard_limits['MAX_DAILY_ORDERS']
-            },
+            "limits": limits,
             "available": {
-                "can_place_orders": not kill_switch.is_active(),
-                "positions_available": config.get('risk.max_open_positions') - status.open_positions,
-                "orders_remaining_today": config.hard_limits['MAX_DAILY_ORDERS'] - status.daily_order_count
+                "can_place_orders": not kill_switch_active,
+                "positions_available": limits["max_open_positions"] - status.open_positions,
+                "orders_remaining_today": limits["max_daily_orders"] - status.daily_order_count
             }
         }
 
@@ -290,7 +527,7 @@ async def get_risk_status(
         return result
 
     except Exception as e:
-        logger.error(f"Error fetching risk status: {e}")
+        logger.error("Error fetching risk status", error=str(e))
         raise
 
 
@@ -315,7 +552,7 @@ async def activate_kill_switch(
     Example:
         activate_kill_switch(reason="manual", message="Market volatility too high")
     """
-    logger.warning(f"Manual kill switch activation requested: {reason}")
+    logger.warning("Manual kill switch activation requested", reason=reason)
 
     try:
         kill_switch = ctx.request_context.kill_switch
@@ -336,7 +573,7 @@ async def activate_kill_switch(
         }
 
     except Exception as e:
-        logger.error(f"Error activating kill switch: {e}")
+        logger.error("Error activating kill switch", error=str(e))
         raise
 
 
@@ -382,7 +619,7 @@ async def deactivate_kill_switch(
             }
 
     except Exception as e:
-        logger.error(f"Error deactivating kill switch: {e}")
+        logger.error("Error deactivating kill switch", error=str(e))
         raise
 
 
@@ -404,17 +641,20 @@ async def get_order_book(
     try:
         risk_manager = ctx.request_context.risk_manager
 
-        # Access today's orders (private attribute)
-        todays_orders = risk_manager._daily_orders if hasattr(risk_manager, '_daily_orders') else []
+        # Access today's orders (private attribute, always set by RiskManager),
+        # serialized at record time; holds the latest max_daily_orders
+        todays_orders = risk_manager._daily_orders_dumped
+
+        daily_order_count = risk_manager.daily_order_count
 
-        logger.info(f"Order book summary fetched: {len(todays_orders)} orders today")
+        logger.info("Order book summary fetched", daily_order_count=daily_order_count)
 
         return {
-            "daily_order_count": len(todays_orders),
-            "orders": [order.model_dump() for order in todays_orders],
+            "daily_order_count": daily_order_count,
+            "orders": list(todays_orders),
             "note": "Showing today's orders tracked by risk manager. For complete order history, use Groww API directly."
         }
 
     except Exception as e:
-        logger.error(f"Error fetching order book: {e}")
+        logger.error("Error fetching order book", error=str(e))
         raise
@@ -4,6 +4,7 @@ MCP Tools for Portfolio Management.
 Provides tools for viewing positions, holdings, and portfolio analytics.
 """
 
+from operator import attrgetter, itemgetter
 from typing import Optional, Dict, Any, List
 
 from mcp.server.fastmcp import Context
@@ -42,12 +43,12 @@ async def get_positions(
 
         positions = await groww_client.get_positions()
 
-        logger.info(f"Positions fetched: {len(positions)} open positions")
+        logger.info("Positions fetched", open_positions=len(positions))
 
-        return [position.model_dump() for position in positions]
+        return [position.model_dump(mode='json') for position in positions]
 
     except Exception as e:
-        logger.error(f"Error fetching positions: {e}")
+        logger.error("Error fetching positions", error=str(e))
         raise
 
 
@@ -79,12 +80,12 @@ async def get_holdings(
 
         holdings = await groww_client.get_holdings()
 
-        logger.info(f"Holdings fetched: {len(holdings)} stocks")
+        logger.info("Holdings fetched", holdings=len(holdings))
 
-        return [holding.model_dump() for holding in holdings]
+        return [holding.model_dump(mode='json') for holding in holdings]
 
     except Exception as e:
-        logger.error(f"Error fetching holdings: {e}")
+        logger.error("Error fetching holdings", error=str(e))
         raise
 
 
@@ -122,26 +123,33 @@ async def get_portfolio_summary(
         total_positions = len(positions)
         total_holdings = len(holdings)
 
+        # Calculate per-item values once and reuse them below
+        position_values = [pos.quantity * pos.ltp for pos in positions]
+        holding_values = [holding.quantity * holding.ltp for holding in holdings]
+
         # Calculate total values
-        positions_value = sum(pos.quantity * pos.ltp for pos in positions)
-        holdings_value = sum(
-            holding.quantity * holding.ltp for holding in holdings
-        )
+        positions_value = sum(position_values)
+        holdings_value = sum(holding_values)
         total_value = positions_value + holdings_value
 
         # Calculate P&L
-        positions_pnl = sum(pos.pnl for pos in positions)
-        holdings_pnl = sum(holding.pnl for holding in holdings)
+        get_pnl = attrgetter('pnl')
+        positions_pnl = sum(map(get_pnl, positions))
+        holdings_pnl = sum(map(get_pnl, holdings))
         total_pnl = positions_pnl + holdings_pnl
 
         # Find largest position
         all_items = positions + holdings
+        all_values = position_values + holding_values
         largest = None
+        largest_value = 0
         if all_items:
-            largest = max(
-                all_items,
-                key=lambda x: abs(x.quantity * x.ltp)
+            largest_idx = max(
+                range(len(all_values)),
+                key=lambda i: abs(all_values[i])
             )
+            largest = all_items[largest_idx]
+            largest_value = all_values[largest_idx]
 
         # Find best and worst performers (by percentage)
         best_performer = None
@@ -165,6 +173,10 @@ async def get_portfolio_summary(
         # Get risk status
         risk_status = await risk_manager.get_status()
 
+        limits = config.risk_limits_snapshot
+        max_portfolio_value = limits["max_portfolio_value"]
+        max_positions = limits["max_open_positions"]
+
         summary = {
             "overview": {
                 "total_portfolio_value": total_value,
@@ -182,7 +194,7 @@ async def get_portfolio_summary(
             },
             "largest_position": {
                 "symbol": largest.symbol if largest else None,
-                "value": largest.quantity * largest.ltp if largest else 0,
+                "value": largest_value,
                 "pnl": largest.pnl if largest else 0
             } if largest else None,
             "performance": {
@@ -191,11 +203,11 @@ async def get_portfolio_summary(
             },
             "risk_metrics": {
                 "daily_pnl": risk_status.daily_pnl,
-                "max_portfolio_value": config.get('risk.max_portfolio_value'),
-                "utilization_percentage": (total_value / config.get('risk.max_portfolio_value') * 100)
-                if config.get('risk.max_portfolio_value') > 0 else 0,
-                "max_positions": config.get('risk.max_open_positions'),
-                "positions_remaining": config.get('risk.max_open_positions') - total_positions
+                "max_portfolio_value": max_portfolio_value,
+                "utilization_percentage": (total_value / max_portfolio_value * 100)
+                if max_portfolio_value > 0 else 0,
+                "max_positions": max_positions,
+                "positions_remaining": max_positions - total_positions
             }
         }
 
@@ -210,7 +222,7 @@ async def get_portfolio_summary(
         return summary
 
     except Exception as e:
-        logger.error(f"Error generating portfolio summary: {e}")
+        logger.error("Error generating portfolio summary", error=str(e))
         raise
 
 
@@ -233,7 +245,7 @@ async def get_position_by_symbol(
     Example:
         get_position_by_symbol(symbol="RELIANCE", exchange="NSE")
     """
-    logger.info(f"Fetching position for {symbol} on {exchange}")
+    logger.info("Fetching position", symbol=symbol, exchange=exchange)
 
     try:
         groww_client = ctx.request_context.groww_client
@@ -249,13 +261,13 @@ async def get_position_by_symbol(
                     quantity=position.quantity,
                     pnl=position.pnl
                 )
-                return position.model_dump()
+                return position.model_dump(mode='json')
 
-        logger.info(f"No position found for {symbol} on {exchange}")
+        logger.info("No position found", symbol=symbol, exchange=exchange)
         return None
 
     except Exception as e:
-        logger.error(f"Error fetching position: {e}", symbol=symbol)
+        logger.error("Error fetching position", error=str(e), symbol=symbol)
         raise
 
 
@@ -278,7 +290,7 @@ async def get_holding_by_symbol(
     Example:
         get_holding_by_symbol(symbol="TCS", exchange="NSE")
     """
-    logger.info(f"Fetching holding for {symbol} on {exchange}")
+    logger.info("Fetching holding", symbol=symbol, exchange=exchange)
 
     try:
         groww_client = ctx.request_context.groww_client
@@ -294,13 +306,13 @@ async def get_holding_by_symbol(
                     quantity=holding.quantity,
                     pnl=holding.pnl
                 )
-                return holding.model_dump()
+                return holding.model_dump(mode='json')
 
-        logger.info(f"No holding found for {symbol} on {exchange}")
+        logger.info("No holding found", symbol=symbol, exchange=exchange)
         return None
 
     except Exception as e:
-        logger.error(f"Error fetching holding: {e}", symbol=symbol)
+        logger.error("Error fetching holding", error=str(e), symbol=symbol)
         raise
 
 
@@ -326,10 +338,15 @@ async def calculate_portfolio_allocation(
         positions = await groww_client.get_positions()
         holdings = await groww_client.get_holdings()
 
-        all_items = positions + holdings
-
-        # Calculate total portfolio value
-        total_value = sum(item.quantity * item.ltp for item in all_items)
+        # Compute each item's value and the portfolio total in one pass,
+        # tagging items with their origin as we go
+        entries = []
+        total_value = 0
+        for items, item_type in ((positions, "position"), (holdings, "holding")):
+            for item in items:
+                item_value = item.quantity * item.ltp
+                total_value += item_value
+                entries.append((item_value, item, item_type))
 
         if total_value == 0:
             logger.info("Portfolio is empty")
@@ -338,23 +355,21 @@ async def calculate_portfolio_allocation(
                 "allocations": []
             }
 
-        # Calculate allocation for each stock
-        allocations = []
-        for item in all_items:
-            item_value = item.quantity * item.ltp
-            percentage = (item_value / total_value * 100) if total_value > 0 else 0
+        # Sort by value (largest first)
+        entries.sort(key=itemgetter(0), reverse=True)
 
-            allocations.append({
+        # Calculate allocation for each stock
+        allocations = [
+            {
                 "symbol": item.symbol,
                 "exchange": item.exchange,
                 "value": item_value,
-                "percentage": round(percentage, 2),
+                "percentage": round(item_value / total_value * 100, 2) if total_value > 0 else 0,
                 "quantity": item.quantity,
-                "type": "position" if item in positions else "holding"
-            })
-
-        # Sort by value (largest first)
-        allocations.sort(key=lambda x: x["value"], reverse=True)
+                "type": item_type
+            }
+            for item_value, item, item_type in entries
+        ]
 
         result = {
             "total_value": total_value,
@@ -375,5 +390,5 @@ async def calculate_portfolio_allocation(
         return result
 
     except Exception as e:
-        logger.error(f"Error calculating portfolio allocation: {e}")
+        logger.error("Error calculating portfolio allocation", error=str(e))
         raise
@@ -7,15 +7,18 @@ Manual intervention required to resume trading.
 """
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
-from collections import deque
+import logging
+import time
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Iterable
 
 from ..api.exceptions import KillSwitchActive
 from ..core.logging_config import get_logger
 from ..core.config import get_config
 
 logger = get_logger(__name__)
+# Underlying stdlib logger; structlog's filter_by_level gates on its level
+_stdlib_logger = logging.getLogger(__name__)
 
 
 class KillSwitchCondition:
@@ -44,6 +47,12 @@ class KillSwitch:
     - Admin approval code
     """
 
+    # Number of recent API calls the error rate is computed over
+    API_ERROR_WINDOW = 50
+    _API_WINDOW_MASK = (1 << API_ERROR_WINDOW) - 1
+    # Minimum calls in the window before the error rate can trip
+    API_MIN_SAMPLE = 20
+
     def __init__(self, risk_manager, config=None):
         """
         Initialize kill switch.
@@ -54,11 +63,15 @@ class KillSwitch:
         """
         self.risk_manager = risk_manager
         self.config = config or get_config()
+        self._risk_logger = get_logger('risk_events')
 
         # Kill switch state
         self._active: bool = False
         self._reason: Optional[str] = None
-        self._activated_at: Optional[datetime] = None
+        self._block_message: str = "Kill switch active"  # Raised for blocked orders
+        self._activated_at: Optional[datetime] = None  # Wall clock, for display
+        self._activated_at_iso: Optional[str] = None
+        self._activated_mono: Optional[float] = None  # Monotonic, for durations
         self._activation_count: int = 0
 
         # Monitoring state
@@ -67,8 +80,16 @@ class KillSwitch:
 
         # Tracking for conditions
         self._consecutive_losses: int = 0
-        self._api_call_history: deque = deque(maxlen=100)  # Last 100 API calls
-        self._network_failure_start: Optional[datetime] = None
+        # Recent API call outcomes as a bitmap, newest in bit 0 (1 = failure)
+        self._api_failure_bits: int = 0
+        self._api_calls_recorded: int = 0  # Calls in the window (up to API_ERROR_WINDOW)
+        self._api_error_count: int = 0  # Set bits in _api_failure_bits
+        self._network_failure_mono: Optional[float] = None
+        # Fires the network timeout; None when no event loop was running to schedule it
+        self._net_timer_handle: Optional[asyncio.TimerHandle] = None
+
+        # Cached get_status() result, cleared whenever state changes
+        self._status_cache: Optional[Dict[str, Any]] = None
 
         # Load configuration
         self._load_config()
@@ -104,22 +125,24 @@ class KillSwitch:
         self.check_interval_seconds = kill_switch_config.get('check_interval_seconds', 30)
 
         # Recovery protocol
-        recovery_config = self.config.get('kill_switch', {}).get('recovery_protocol', {})
+        recovery_config = kill_switch_config.get('recovery_protocol', {})
         self.cooldown_minutes = recovery_config.get('cooldown_period_minutes', 60)
+        self._cooldown_seconds = self.cooldown_minutes * 60
         self.approval_code = recovery_config.get('approval_code', 'RESUME_TRADING_2024')
 
-        logger.debug(
-            "Kill switch config loaded",
-            thresholds={
-                'daily_loss': self.daily_loss_threshold,
-                'consecutive_losses': self.consecutive_loss_threshold,
-                'api_error_rate': self.api_error_rate_threshold,
-                'network_timeout': self.network_timeout_seconds
-            },
-            recovery={
-                'cooldown_minutes': self.cooldown_minutes
-            }
-        )
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Kill switch config loaded",
+                thresholds={
+                    'daily_loss': self.daily_loss_threshold,
+                    'consecutive_losses': self.consecutive_loss_threshold,
+                    'api_error_rate': self.api_error_rate_threshold,
+                    'network_timeout': self.network_timeout_seconds
+                },
+                recovery={
+                    'cooldown_minutes': self.cooldown_minutes
+                }
+            )
 
     def activate(
         self,
@@ -141,8 +164,12 @@ class KillSwitch:
 
         self._active = True
         self._reason = reason
+        self._block_message = reason or "Kill switch active"
         self._activated_at = datetime.now()
+        self._activated_at_iso = self._activated_at.isoformat()
+        self._activated_mono = time.monotonic()
         self._activation_count += 1
+        self._status_cache = None
 
         self.stats['activations'] += 1
 
@@ -157,19 +184,18 @@ class KillSwitch:
             reason=reason,
             message=message,
             condition=condition,
-            activated_at=self._activated_at.isoformat(),
+            activated_at=self._activated_at_iso,
             activation_count=self._activation_count,
             event_type="kill_switch_activated"
         )
 
         # Log to risk event logger
-        risk_logger = get_logger('risk_events')
-        risk_logger.critical(
+        self._risk_logger.critical(
             "KILL SWITCH ACTIVATED - ALL TRADING HALTED",
             reason=reason,
             message=message,
             condition=condition,
-            activated_at=self._activated_at.isoformat()
+            activated_at=self._activated_at_iso
         )
 
     def deactivate(self, admin_approval: str) -> bool:
@@ -201,29 +227,26 @@ class KillSwitch:
             )
             raise KillSwitchActive(
                 "Invalid approval code. Cannot deactivate kill switch.",
-                activated_at=self._activated_at.isoformat() if self._activated_at else None
+                activated_at=self._activated_at_iso
             )
 
         # Check cooldown period
-        if self._activated_at:
-            elapsed = datetime.now() - self._activated_at
-            cooldown_delta = timedelta(minutes=self.cooldown_minutes)
-
-            if elapsed < cooldown_delta:
-                remaining = cooldown_delta - elapsed
-                remaining_minutes = remaining.total_seconds() / 60
-
-                logger.warning(
-                    "Kill switch cooldown not elapsed",
-                    elapsed_minutes=elapsed.total_seconds() / 60,
-                    required_minutes=self.cooldown_minutes,
-                    remaining_minutes=remaining_minutes
-                )
+        elapsed = time.monotonic() - self._activated_mono if self._activated_mono is not None else None
 
-                raise KillSwitchActive(
-                    f"Cooldown period not elapsed. Wait {remaining_minutes:.1f} more minutes.",
-                    activated_at=self._activated_at.isoformat()
-                )
+        if elapsed is not None and elapsed < self._cooldown_seconds:
+            remaining_minutes = (self._cooldown_seconds - elapsed) / 60
+
+            logger.warning(
+                "Kill switch cooldown not elapsed",
+                elapsed_minutes=elapsed / 60,
+                required_minutes=self.cooldown_minutes,
+                remaining_minutes=remaining_minutes
+            )
+
+            raise KillSwitchActive(
+                f"Cooldown period not elapsed. Wait {remaining_minutes:.1f} more minutes.",
+                activated_at=self._activated_at_iso
+            )
 
         # Deactivate
         previous_reason = self._reason
@@ -231,6 +254,9 @@ class KillSwitch:
         self._active = False
         self._reason = None
         self._activated_at = None
+        self._activated_at_iso = None
+        self._activated_mono = None
+        self._status_cache = None
 
         self.stats['deactivations'] += 1
 
@@ -241,11 +267,10 @@ class KillSwitch:
         )
 
         # Log to risk event logger
-        risk_logger = get_logger('risk_events')
-        risk_logger.warning(
+        self._risk_logger.warning(
             "KILL SWITCH DEACTIVATED - TRADING RESUMED",
             previous_reason=previous_reason,
-            total_activation_time_minutes=(datetime.now() - self._activated_at).total_seconds() / 60 if self._activated_at else 0
+            total_activation_time_minutes=elapsed / 60 if elapsed is not None else 0
         )
 
         return True
@@ -266,17 +291,25 @@ class KillSwitch:
         Raises:
             KillSwitchActive: If kill switch is active
         """
-        if self._active:
-            logger.error(
-                "Order blocked by active kill switch",
-                reason=self._reason,
-                activated_at=self._activated_at.isoformat() if self._activated_at else None
-            )
+        if not self._active:
+            return
 
-            raise KillSwitchActive(
-                self._reason or "Kill switch active",
-                activated_at=self._activated_at.isoformat() if self._activated_at else None
-            )
+        self._raise_blocked()
+
+    def _raise_blocked(self) -> None:
+        """
+        Log and raise for an order blocked by the active kill switch.
+
+        Raises:
+            KillSwitchActive: Always
+        """
+        logger.error(
+            "Order blocked by active kill switch",
+            reason=self._reason,
+            activated_at=self._activated_at_iso
+        )
+
+        raise KillSwitchActive(self._block_message, activated_at=self._activated_at_iso)
 
     async def start_monitoring(self) -> None:
         """
@@ -289,6 +322,7 @@ class KillSwitch:
             return
 
         self._monitoring = True
+        self._status_cache = None
 
         logger.info(
             "Starting kill switch monitoring",
@@ -306,6 +340,7 @@ class KillSwitch:
         logger.info("Stopping kill switch monitoring")
 
         self._monitoring = False
+        self._status_cache = None
 
         if self._monitor_task:
             self._monitor_task.cancel()
@@ -320,25 +355,28 @@ class KillSwitch:
         """Background monitoring loop."""
         logger.info("Kill switch monitoring loop started")
 
-        try:
-            while self._monitoring:
+        while self._monitoring:
+            try:
                 await self._check_conditions()
                 await asyncio.sleep(self.check_interval_seconds)
 
-        except asyncio.CancelledError:
-            logger.info("Kill switch monitoring cancelled")
-            raise
+            except asyncio.CancelledError:
+                logger.info("Kill switch monitoring cancelled")
+                raise
 
-        except Exception as e:
-            logger.error(f"Kill switch monitoring error: {e}")
-            # Continue monitoring despite errors
-            if self._monitoring:
+            except Exception as e:
+                logger.error(f"Kill switch monitoring error: {e}")
+                # Continue monitoring despite errors
                 await asyncio.sleep(self.check_interval_seconds)
-                await self._monitor_loop()
 
     async def _check_conditions(self) -> None:
         """
-        Check all kill switch trigger conditions.
+        Check polled kill switch trigger conditions.
+
+        Consecutive losses and API error rate are checked as they are
+        recorded (see record_trade_result and record_api_call), and network
+        failures by a timer from record_network_failure; this covers the
+        conditions that need polling.
 
         Activates kill switch if any condition is met.
         """
@@ -348,7 +386,20 @@ class KillSwitch:
         self.stats['conditions_checked'] += 1
 
         try:
-            # 1. Check daily loss limit
+            # 1. Check network failure duration (local state, no broker call).
+            # Normally handled by the timer from record_network_failure.
+            if self._network_failure_mono is not None and self._net_timer_handle is None:
+                duration = time.monotonic() - self._network_failure_mono
+
+                if duration >= self.network_timeout_seconds:
+                    self.activate(
+                        f"Network failure duration exceeded: {duration:.0f}s >= {self.network_timeout_seconds}s",
+                        message="Automatic activation due to prolonged network failure",
+                        condition=KillSwitchCondition.NETWORK_FAILURE
+                    )
+                    return
+
+            # 2. Check daily loss limit
             risk_status = await self.risk_manager.get_status()
 
             if risk_status.daily_pnl < 0:
@@ -362,39 +413,6 @@ class KillSwitch:
                     )
                     return
 
-            # 2. Check consecutive losses
-            if self._consecutive_losses >= self.consecutive_loss_threshold:
-                self.activate(
-                    f"Consecutive loss limit breached: {self._consecutive_losses} >= {self.consecutive_loss_threshold}",
-                    message="Automatic activation due to consecutive losses",
-                    condition=KillSwitchCondition.CONSECUTIVE_LOSSES
-                )
-                return
-
-            # 3. Check API error rate
-            if len(self._api_call_history) >= 20:  # Need minimum sample
-                error_rate = self._calculate_api_error_rate()
-
-                if error_rate >= self.api_error_rate_threshold:
-                    self.activate(
-                        f"API error rate exceeded: {error_rate:.1%} >= {self.api_error_rate_threshold:.1%}",
-                        message="Automatic activation due to high API error rate",
-                        condition=KillSwitchCondition.API_ERROR_RATE
-                    )
-                    return
-
-            # 4. Check network failure duration
-            if self._network_failure_start:
-                duration = (datetime.now() - self._network_failure_start).total_seconds()
-
-                if duration >= self.network_timeout_seconds:
-                    self.activate(
-                        f"Network failure duration exceeded: {duration:.0f}s >= {self.network_timeout_seconds}s",
-                        message="Automatic activation due to prolonged network failure",
-                        condition=KillSwitchCondition.NETWORK_FAILURE
-                    )
-                    return
-
         except Exception as e:
             logger.error(f"Error checking kill switch conditions: {e}")
 
@@ -402,35 +420,144 @@ class KillSwitch:
         """
         Record trade result for consecutive loss tracking.
 
+        Activates the kill switch immediately when the consecutive loss
+        threshold is reached.
+
         Args:
             profit: Trade profit (negative for loss)
         """
+        self._status_cache = None
+
         if profit < 0:
             self._consecutive_losses += 1
-            logger.debug(
-                "Consecutive loss recorded",
-                consecutive_losses=self._consecutive_losses,
-                threshold=self.consecutive_loss_threshold
-            )
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Consecutive loss recorded",
+                    consecutive_losses=self._consecutive_losses,
+                    threshold=self.consecutive_loss_threshold
+                )
+
+            if not self._active and self._consecutive_losses >= self.consecutive_loss_threshold:
+                self.activate(
+                    f"Consecutive loss limit breached: {self._consecutive_losses} >= {self.consecutive_loss_threshold}",
+                    message="Automatic activation due to consecutive losses",
+                    condition=KillSwitchCondition.CONSECUTIVE_LOSSES
+                )
         else:
-            if self._consecutive_losses > 0:
+            if self._consecutive_losses > 0 and _stdlib_logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     "Consecutive loss streak broken",
                     previous_streak=self._consecutive_losses
                 )
             self._consecutive_losses = 0
 
+    def record_trade_results(self, profits: Iterable[float]) -> None:
+        """
+        Record a batch of trade results, oldest first.
+
+        Equivalent to calling record_trade_result for each profit, including
+        activating at the point the threshold is reached, without the
+        per-trade debug logging.
+
+        Args:
+            profits: Trade profits (negative for loss)
+        """
+        self._status_cache = None
+
+        threshold = self.consecutive_loss_threshold
+        streak = self._consecutive_losses
+        for profit in profits:
+            if profit >= 0:
+                streak = 0
+                continue
+
+            streak += 1
+            if streak >= threshold and not self._active:
+                self._consecutive_losses = streak
+                self.activate(
+                    f"Consecutive loss limit breached: {streak} >= {threshold}",
+                    message="Automatic activation due to consecutive losses",
+                    condition=KillSwitchCondition.CONSECUTIVE_LOSSES
+                )
+
+        self._consecutive_losses = streak
+
     def record_api_call(self, success: bool) -> None:
         """
         Record API call result for error rate tracking.
 
+        Activates the kill switch immediately when the error rate over the
+        recent history reaches the threshold.
+
         Args:
             success: True if API call succeeded
         """
-        self._api_call_history.append({
-            'timestamp': datetime.now(),
-            'success': success
-        })
+        self._status_cache = None
+
+        failed = 0 if success else 1
+
+        # Keep the failure count in step with the window as the oldest call drops out
+        if self._api_calls_recorded == self.API_ERROR_WINDOW:
+            self._api_error_count -= self._api_failure_bits >> (self.API_ERROR_WINDOW - 1)
+        else:
+            self._api_calls_recorded += 1
+
+        self._api_failure_bits = ((self._api_failure_bits << 1) | failed) & self._API_WINDOW_MASK
+        self._api_error_count += failed
+
+        self._check_api_error_rate()
+
+    def record_api_calls(self, failures: int = 0, successes: int = 0) -> None:
+        """
+        Record a batch of API call results for error rate tracking.
+
+        Equivalent to calling record_api_call for each failure and then each
+        success, including activating at the point the threshold is reached,
+        but updates the window once per run instead of once per call.
+
+        Args:
+            failures: Number of failed calls (recorded first)
+            successes: Number of successful calls (recorded after failures)
+        """
+        self._status_cache = None
+
+        if failures:
+            self._push_api_results(failures, failed=True)
+            # The rate only rises while failures are added; check at the peak
+            self._check_api_error_rate()
+
+        if successes:
+            # The rate only falls while successes are added, so the one point
+            # worth checking is where the window first reaches the minimum sample
+            short = self.API_MIN_SAMPLE - self._api_calls_recorded
+            if 0 < short <= successes:
+                self._push_api_results(short, failed=False)
+                self._check_api_error_rate()
+                successes -= short
+            self._push_api_results(successes, failed=False)
+
+    def _push_api_results(self, count: int, failed: bool) -> None:
+        """Shift `count` identical results into the API failure window."""
+        if not count:
+            return
+
+        count = min(count, self.API_ERROR_WINDOW)
+        new_bits = (1 << count) - 1 if failed else 0
+        self._api_failure_bits = ((self._api_failure_bits << count) | new_bits) & self._API_WINDOW_MASK
+        self._api_calls_recorded = min(self._api_calls_recorded + count, self.API_ERROR_WINDOW)
+        self._api_error_count = bin(self._api_failure_bits).count("1")
+
+    def _check_api_error_rate(self) -> None:
+        """Activate if the API error rate is over threshold with a minimum sample."""
+        if not self._active and self._api_calls_recorded >= self.API_MIN_SAMPLE:
+            error_rate = self._calculate_api_error_rate()
+
+            if error_rate >= self.api_error_rate_threshold:
+                self.activate(
+                    f"API error rate exceeded: {error_rate:.1%} >= {self.api_error_rate_threshold:.1%}",
+                    message="Automatic activation due to high API error rate",
+                    condition=KillSwitchCondition.API_ERROR_RATE
+                )
 
     def record_network_failure(self, is_failure: bool) -> None:
         """
@@ -439,73 +566,133 @@ class KillSwitch:
         Args:
             is_failure: True if network is failing
         """
+        self._status_cache = None
+
         if is_failure:
-            if not self._network_failure_start:
-                self._network_failure_start = datetime.now()
+            if self._network_failure_mono is None:
+                self._network_failure_mono = time.monotonic()
                 logger.warning("Network failure detected")
+
+                try:
+                    loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    pass  # No loop to schedule on; _check_conditions polls instead
+                else:
+                    self._net_timer_handle = loop.call_later(
+                        self.network_timeout_seconds, self._trip_network_timeout
+                    )
         else:
-            if self._network_failure_start:
-                duration = (datetime.now() - self._network_failure_start).total_seconds()
+            if self._network_failure_mono is not None:
+                duration = time.monotonic() - self._network_failure_mono
                 logger.info(f"Network recovered after {duration:.0f}s")
-                self._network_failure_start = None
+                self._network_failure_mono = None
+                self._cancel_network_timer()
+
+    def _trip_network_timeout(self) -> None:
+        """Activate the kill switch once a network failure outlasts the timeout."""
+        self._net_timer_handle = None
+
+        if self._active or self._network_failure_mono is None:
+            return
+
+        duration = time.monotonic() - self._network_failure_mono
+        self.activate(
+            f"Network failure duration exceeded: {duration:.0f}s >= {self.network_timeout_seconds}s",
+            message="Automatic activation due to prolonged network failure",
+            condition=KillSwitchCondition.NETWORK_FAILURE
+        )
+
+    def _cancel_network_timer(self) -> None:
+        """Cancel the pending network timeout, if any."""
+        if self._net_timer_handle is not None:
+            self._net_timer_handle.cancel()
+            self._net_timer_handle = None
 
     def _calculate_api_error_rate(self) -> float:
         """
-        Calculate API error rate from recent history.
+        Calculate API error rate over the last API_ERROR_WINDOW calls.
 
         Returns:
             Error rate as decimal (0.0 to 1.0)
         """
-        if not self._api_call_history:
+        if not self._api_calls_recorded:
             return 0.0
 
-        # Look at last 50 calls
-        recent_calls = list(self._api_call_history)[-50:]
-        errors = sum(1 for call in recent_calls if not call['success'])
-
-        return errors / len(recent_calls)
+        return self._api_error_count / self._api_calls_recorded
 
     def get_status(self) -> Dict[str, Any]:
         """
         Get kill switch status.
 
+        The time-independent part is cached until the kill switch state
+        changes; elapsed/cooldown and network failure durations are added
+        per call when they apply. The returned dict may be shared, so
+        callers must not mutate it.
+
         Returns:
             Dictionary with status information
         """
-        status = {
-            'active': self._active,
-            'reason': self._reason,
-            'activated_at': self._activated_at.isoformat() if self._activated_at else None,
-            'activation_count': self._activation_count,
-            'monitoring': self._monitoring
-        }
+        if self._status_cache is None:
+            self._status_cache = self._build_status()
+
+        cached = self._status_cache
+        timed_activation = self._active and self._activated_mono is not None
+        network_failing = self._network_failure_mono is not None
 
-        if self._active and self._activated_at:
-            elapsed = datetime.now() - self._activated_at
-            cooldown_remaining = max(0, self.cooldown_minutes * 60 - elapsed.total_seconds())
+        if not timed_activation and not network_failing:
+            return cached
+
+        status = {key: value for key, value in cached.items() if key != 'conditions'}
+
+        if timed_activation:
+            elapsed = time.monotonic() - self._activated_mono
+            cooldown_remaining = max(0, self._cooldown_seconds - elapsed)
 
             status.update({
-                'elapsed_seconds': elapsed.total_seconds(),
+                'elapsed_seconds': elapsed,
                 'cooldown_remaining_seconds': cooldown_remaining,
                 'can_deactivate': cooldown_remaining == 0
             })
 
-        # Add current condition values
-        status.update({
+        conditions = dict(cached['conditions'])
+        if network_failing:
+            conditions['network_failure_duration'] = time.monotonic() - self._network_failure_mono
+
+        status['conditions'] = conditions
+
+        return status
+
+    def _build_status(self) -> Dict[str, Any]:
+        """
+        Build the time-independent part of get_status.
+
+        Returns:
+            Dictionary with status information
+        """
+        return {
+            'active': self._active,
+            'reason': self._reason,
+            'activated_at': self._activated_at_iso,
+            'activation_count': self._activation_count,
+            'monitoring': self._monitoring,
             'conditions': {
                 'consecutive_losses': self._consecutive_losses,
                 'consecutive_loss_threshold': self.consecutive_loss_threshold,
                 'api_error_rate': self._calculate_api_error_rate(),
                 'api_error_rate_threshold': self.api_error_rate_threshold,
-                'network_failure_duration': (
-                    (datetime.now() - self._network_failure_start).total_seconds()
-                    if self._network_failure_start else 0
-                ),
+                'network_failure_duration': 0,
                 'network_timeout_seconds': self.network_timeout_seconds
             }
-        })
+        }
 
-        return status
+    def get_counters(self) -> Dict[str, int]:
+        """
+        Get kill switch counters without building the status snapshot.
+
+        Returns:
+            Dictionary with activation and check counters
+        """
+        return dict(self.stats)
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -526,9 +713,15 @@ class KillSwitch:
         self._active = False
         self._reason = None
         self._activated_at = None
+        self._activated_at_iso = None
+        self._activated_mono = None
         self._consecutive_losses = 0
-        self._api_call_history.clear()
-        self._network_failure_start = None
+        self._api_failure_bits = 0
+        self._api_calls_recorded = 0
+        self._api_error_count = 0
+        self._network_failure_mono = None
+        self._cancel_network_timer()
+        self._status_cache = None
 
     def __repr__(self) -> str:
         """String representation."""
@@ -10,9 +10,14 @@ This module implements comprehensive risk management including:
 - Risk status monitoring
 """
 
+import asyncio
+import logging
+import time
+from collections import Counter, deque
 from datetime import datetime, date
-from typing import Optional, Dict, List, Any
-from pydantic import BaseModel
+from typing import Optional, Dict, List, Any, NamedTuple, Tuple, Deque, Iterable
+
+import numpy as np
 
 from ..api.models import Order, Position, RiskMetrics
 from ..api.exceptions import (
@@ -23,10 +28,16 @@ from ..core.logging_config import get_logger
 from ..core.config import get_config
 
 logger = get_logger(__name__)
+# Underlying stdlib logger; structlog's filter_by_level gates on its level
+_stdlib_logger = logging.getLogger(__name__)
+
 
+# Above this many positions, P&L and capital are aggregated with NumPy
+_VECTORIZE_MIN_POSITIONS = 16
 
-class OrderValidation(BaseModel):
-    """Order validation result."""
+
+class OrderValidation(NamedTuple):
+    """Order validation result (built on every order, so kept a plain tuple)."""
     approved: bool
     reason: Optional[str] = None
     limit_type: Optional[str] = None
@@ -34,6 +45,12 @@ class OrderValidation(BaseModel):
     limit_value: Optional[float] = None
 
 
+class OrderReservation(NamedTuple):
+    """Limit slots held by RiskManager.reserve_order until released."""
+    symbol: str
+    opens_position: bool  # BUY for a symbol not already held
+
+
 class RiskManager:
     """
     Risk management system.
@@ -60,25 +77,55 @@ class RiskManager:
 
         # Daily tracking (resets at market open)
         self._current_day: Optional[date] = None
+        # date.today() memo, refreshed at most once per monotonic second
+        self._last_today_check: int = -1
+        self._today_cached: Optional[date] = None
         self._daily_pnl: float = 0.0
         self._daily_order_count: int = 0
-        self._daily_orders: List[Order] = []
+        # Today's orders and their JSON-ready form (serialized once at record
+        # time), kept in step; both bounded in _load_limits
+        self._daily_orders: Deque[Order] = deque()
+        self._daily_orders_dumped: Deque[Dict[str, Any]] = deque()
 
         # Position tracking
         self._open_positions: Dict[str, Position] = {}
         self._position_count: int = 0
+        self._used_capital: float = 0.0  # Cost basis of _open_positions, set with them
 
-        # Statistics
-        self.stats = {
-            'orders_validated': 0,
-            'orders_approved': 0,
-            'orders_rejected': 0,
-            'rejection_reasons': {}
-        }
+        # Per-symbol locks for concurrent (batched) order placement
+        self._symbol_locks: Dict[str, asyncio.Lock] = {}
+
+        # Slots held by reserve_order: approved orders not yet counted, and
+        # symbols with a placed or in-flight opening BUY that the broker
+        # positions don't show yet (dropped on refresh or day rollover)
+        self._reserved_orders: int = 0
+        self._pending_positions: Counter = Counter()
+
+        # Background order recording (see start_recording)
+        self._record_queue: Optional[asyncio.Queue] = None
+        self._record_task: Optional[asyncio.Task] = None
+
+        # Statistics (plain counters; see the stats property)
+        self._n_validated: int = 0
+        self._n_approved: int = 0
+        self._n_rejected: int = 0
+        self._rejection_reasons: Counter = Counter()
 
         # Load limits from config
         self._load_limits()
 
+        # Validation pipelines, run in order until the first failure
+        self._price_validators = (
+            self._check_single_order_value,
+            self._check_position_size,
+        )
+        self._order_validators = (
+            self._check_daily_orders,
+            self._check_open_positions,
+            self._check_daily_loss,
+            self._check_forbidden,
+        )
+
         logger.info(
             "Risk manager initialized",
             max_portfolio_value=self.max_portfolio_value,
@@ -95,14 +142,38 @@ class RiskManager:
         self.max_position_size = risk_config.get('max_position_size', 5000)
         self.max_daily_loss = risk_config.get('max_daily_loss', 2000)
         self.max_open_positions = risk_config.get('max_open_positions', 3)
+        # Per-order INFO logs on the validation path
+        self._log_info_enabled = (
+            risk_config.get('log_every', True) and _stdlib_logger.isEnabledFor(logging.INFO)
+        )
 
         # Hard limits (non-overridable)
         hard_limits = self.config.hard_limits
         self.max_single_order_value = hard_limits.get('MAX_SINGLE_ORDER_VALUE', 10000)
         self.max_daily_orders = hard_limits.get('MAX_DAILY_ORDERS', 15)
+        # The daily order limit caps how many orders a day keeps; recording
+        # past it drops the oldest from both histories
+        self._daily_orders = deque(self._daily_orders, maxlen=self.max_daily_orders)
+        self._daily_orders_dumped = deque(self._daily_orders_dumped, maxlen=self.max_daily_orders)
         self.max_daily_loss_hard = hard_limits.get('MAX_DAILY_LOSS_HARD', 5000)
-        self.forbidden_segments = hard_limits.get('FORBIDDEN_SEGMENTS', [])
-        self.forbidden_products = hard_limits.get('FORBIDDEN_PRODUCTS', [])
+        self.forbidden_segments = frozenset(hard_limits.get('FORBIDDEN_SEGMENTS', ()))
+        self.forbidden_products = frozenset(hard_limits.get('FORBIDDEN_PRODUCTS', ()))
+        self._has_forbidden = bool(self.forbidden_segments or self.forbidden_products)
+
+        # Forbidden segment/product rejections carry no runtime values, so
+        # their _reject_order arguments and results are built once here
+        self._forbidden_segment_failures = {
+            segment: self._static_failure(
+                f"Segment '{segment}' is forbidden by hard limits", 'forbidden_segment', segment
+            )
+            for segment in self.forbidden_segments
+        }
+        self._forbidden_product_failures = {
+            product: self._static_failure(
+                f"Product '{product}' is forbidden by hard limits", 'forbidden_product', product
+            )
+            for product in self.forbidden_products
+        }
 
         logger.debug(
             "Risk limits loaded",
@@ -119,6 +190,112 @@ class RiskManager:
             }
         )
 
+    def symbol_lock(self, symbol: str) -> asyncio.Lock:
+        """
+        Get the lock serializing order placement for a symbol.
+
+        Batched order placement holds this lock from validation through
+        recording, so orders for the same symbol go out in input order while
+        orders for different symbols proceed concurrently. Limits shared
+        across symbols are enforced by reserve_order, not by this lock.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            asyncio.Lock for the symbol
+        """
+        lock = self._symbol_locks.get(symbol)
+        if lock is None:
+            lock = self._symbol_locks[symbol] = asyncio.Lock()
+        return lock
+
+    @property
+    def daily_order_count(self) -> int:
+        """Number of orders placed today (counted by record_order and enqueue_order)."""
+        return self._daily_order_count
+
+    def daily_order_limit_reached(self) -> bool:
+        """
+        Check whether the daily order count limit is exhausted.
+
+        Cheap pre-check for callers that can skip network calls (e.g. an
+        LTP fetch) when the order would be rejected anyway.
+
+        Returns:
+            True if no more orders can be placed today
+        """
+        self._check_day_rollover()
+        return self._daily_order_count + self._reserved_orders >= self.max_daily_orders
+
+    def reserve_order(
+        self,
+        symbol: str,
+        quantity: int,
+        price: float,
+        transaction_type: str,
+        order_type: str = "LIMIT",
+        exchange: str = "NSE",
+        product: str = "CNC",
+        segment: str = "CASH"
+    ) -> Tuple[OrderValidation, Optional[OrderReservation]]:
+        """
+        Validate an order and, if approved, hold its limit slots.
+
+        Validation and reservation run without yielding to the event loop, so
+        orders placed concurrently (e.g. a place_orders batch) each see the
+        slots the others hold: the order counts toward MAX_DAILY_ORDERS, and
+        a BUY for a symbol not already held counts toward max_open_positions.
+        Call release_reservation once the order has been placed and
+        recorded, or has failed.
+
+        Args:
+            symbol: Trading symbol
+            quantity: Order quantity
+            price: Order price
+            transaction_type: BUY or SELL
+            order_type: Order type
+            exchange: Exchange
+            product: Product type
+            segment: Market segment
+
+        Returns:
+            (validation, reservation); reservation is None if rejected
+        """
+        validation = self.validate_order_sync(
+            symbol, quantity, price, transaction_type,
+            order_type, exchange, product, segment
+        )
+        if not validation.approved:
+            return validation, None
+
+        opens_position = transaction_type == "BUY" and symbol not in self._open_positions
+
+        self._reserved_orders += 1
+        if opens_position:
+            self._pending_positions[symbol] += 1
+
+        return validation, OrderReservation(symbol, opens_position)
+
+    def release_reservation(self, reservation: OrderReservation, placed: bool) -> None:
+        """
+        Release the order slot held by reserve_order.
+
+        A placed order's new-position slot stays held until the broker
+        positions show the symbol; a failed order gives it back.
+
+        Args:
+            reservation: Reservation returned by reserve_order
+            placed: True if the order was placed and recorded
+        """
+        self._reserved_orders -= 1
+
+        if reservation.opens_position and not placed:
+            pending = self._pending_positions
+            pending[reservation.symbol] -= 1
+            if pending[reservation.symbol] <= 0:
+                del pending[reservation.symbol]
+
     async def validate_order(
         self,
         symbol: str,
@@ -133,6 +310,31 @@ class RiskManager:
         """
         Validate order against all risk constraints.
 
+        Async wrapper around validate_order_sync, which does not await
+        anything; hot paths (backtests, replays) can call that directly.
+
+        Returns:
+            OrderValidation with approval status and reason
+        """
+        return self.validate_order_sync(
+            symbol, quantity, price, transaction_type,
+            order_type, exchange, product, segment
+        )
+
+    def validate_order_sync(
+        self,
+        symbol: str,
+        quantity: int,
+        price: float,
+        transaction_type: str,
+        order_type: str = "LIMIT",
+        exchange: str = "NSE",
+        product: str = "CNC",
+        segment: str = "CASH"
+    ) -> OrderValidation:
+        """
+        Validate order against all risk constraints.
+
         Validation pipeline:
         1. Check day rollover (reset daily counters if new day)
         2. Check single order value vs MAX_SINGLE_ORDER_VALUE
@@ -155,7 +357,7 @@ class RiskManager:
         Returns:
             OrderValidation with approval status and reason
         """
-        self.stats['orders_validated'] += 1
+        self._n_validated += 1
 
         try:
             # 1. Check day rollover
@@ -163,123 +365,230 @@ class RiskManager:
 
             order_value = quantity * price
 
-            logger.info(
-                "Validating order",
-                symbol=symbol,
-                transaction_type=transaction_type,
-                quantity=quantity,
-                price=price,
-                order_value=order_value
+            if self._log_info_enabled:
+                logger.info(
+                    "Validating order",
+                    symbol=symbol,
+                    transaction_type=transaction_type,
+                    quantity=quantity,
+                    price=price,
+                    order_value=order_value
+                )
+
+            # 2-3. Price-dependent limits
+            rejection = self._check_price_limits(order_value, transaction_type)
+            if rejection:
+                return rejection
+
+            # 4-7. Price-independent limits
+            rejection = self._check_order_limits(symbol, transaction_type, product, segment)
+            if rejection:
+                return rejection
+
+            return self._approve_order(symbol, order_value)
+
+        except Exception as e:
+            logger.error(f"Error during order validation: {e}", symbol=symbol)
+            return self._reject_order(
+                f"Validation error: {str(e)}",
+                'validation_error',
+                None,
+                None
             )
 
-            # 2. Check single order value (HARD LIMIT)
-            if order_value > self.max_single_order_value:
-                reason = (
-                    f"Single order value ₹{order_value:.2f} exceeds "
-                    f"hard limit ₹{self.max_single_order_value}"
-                )
-                return self._reject_order(
-                    reason,
-                    'max_single_order_value',
-                    order_value,
-                    self.max_single_order_value
-                )
+    def _check_price_limits(
+        self,
+        order_value: float,
+        transaction_type: str
+    ) -> Optional[OrderValidation]:
+        """
+        Check limits that depend on the order value.
 
-            # 3. Check position size (for BUY orders)
-            if transaction_type == "BUY":
-                if order_value > self.max_position_size:
-                    reason = (
-                        f"Position size ₹{order_value:.2f} exceeds "
-                        f"limit ₹{self.max_position_size}"
-                    )
-                    return self._reject_order(
-                        reason,
-                        'max_position_size',
-                        order_value,
-                        self.max_position_size
-                    )
-
-            # 4. Check daily order count (HARD LIMIT)
-            if self._daily_order_count >= self.max_daily_orders:
-                reason = (
-                    f"Daily order limit reached: {self._daily_order_count}/"
-                    f"{self.max_daily_orders}"
-                )
-                return self._reject_order(
-                    reason,
-                    'max_daily_orders',
-                    self._daily_order_count,
-                    self.max_daily_orders
-                )
+        Args:
+            order_value: Order quantity * price
+            transaction_type: BUY or SELL
 
-            # 5. Check open positions (for BUY orders)
-            if transaction_type == "BUY":
-                # Check if opening a new position
-                if symbol not in self._open_positions:
-                    if self._position_count >= self.max_open_positions:
-                        reason = (
-                            f"Maximum open positions reached: {self._position_count}/"
-                            f"{self.max_open_positions}"
-                        )
-                        return self._reject_order(
-                            reason,
-                            'max_open_positions',
-                            self._position_count,
-                            self.max_open_positions
-                        )
-
-            # 6. Check daily loss limits
-            if self._daily_pnl < 0:
-                abs_loss = abs(self._daily_pnl)
-
-                # Check hard limit first
-                if abs_loss >= self.max_daily_loss_hard:
-                    reason = (
-                        f"Hard daily loss limit breached: ₹{abs_loss:.2f} >= "
-                        f"₹{self.max_daily_loss_hard} (KILL SWITCH TERRITORY)"
-                    )
-                    return self._reject_order(
-                        reason,
-                        'max_daily_loss_hard',
-                        abs_loss,
-                        self.max_daily_loss_hard
-                    )
-
-                # Check soft limit
-                if abs_loss >= self.max_daily_loss:
-                    reason = (
-                        f"Daily loss limit reached: ₹{abs_loss:.2f} >= "
-                        f"₹{self.max_daily_loss}"
-                    )
-                    return self._reject_order(
-                        reason,
-                        'max_daily_loss',
-                        abs_loss,
-                        self.max_daily_loss
-                    )
-
-            # 7. Check forbidden segments and products
-            if segment in self.forbidden_segments:
-                reason = f"Segment '{segment}' is forbidden by hard limits"
-                return self._reject_order(
-                    reason,
-                    'forbidden_segment',
-                    segment,
-                    None
-                )
+        Returns:
+            Rejection result, or None if all checks passed
+        """
+        for validator in self._price_validators:
+            failure = validator(order_value, transaction_type)
+            if failure:
+                return self._reject_order(*failure)
 
-            if product in self.forbidden_products:
-                reason = f"Product '{product}' is forbidden by hard limits"
-                return self._reject_order(
-                    reason,
-                    'forbidden_product',
-                    product,
-                    None
-                )
+        return None
 
-            # All checks passed
-            self.stats['orders_approved'] += 1
+    def _check_order_limits(
+        self,
+        symbol: str,
+        transaction_type: str,
+        product: str,
+        segment: str
+    ) -> Optional[OrderValidation]:
+        """
+        Check limits that do not depend on the order price.
 
+        Args:
+            symbol: Trading symbol
+            transaction_type: BUY or SELL
+            product: Product type
+            segment: Market segment
+
+        Returns:
+            Rejection result, or None if all checks passed
+        """
+        for validator in self._order_validators:
+            failure = validator(symbol, transaction_type, product, segment)
+            if failure:
+                return self._reject_order(*failure)
+
+        return None
+
+    # Validators return None on pass, or the _reject_order arguments
+    # (reason, limit_type, current_value, limit_value[, result]) on failure.
+
+    @staticmethod
+    def _static_failure(reason: str, limit_type: str, current_value: Any) -> Tuple[Any, ...]:
+        """Build _reject_order arguments with a prebuilt, shareable result."""
+        result = OrderValidation(
+            approved=False,
+            reason=reason,
+            limit_type=limit_type,
+            current_value=current_value,
+            limit_value=None
+        )
+        return reason, limit_type, current_value, None, result
+
+    def _check_single_order_value(
+        self,
+        order_value: float,
+        transaction_type: str
+    ) -> Optional[Tuple[str, str, Any, Any]]:
+        """Check single order value (HARD LIMIT)."""
+        limit = self.max_single_order_value
+        if order_value > limit:
+            reason = (
+                f"Single order value ₹{order_value:.2f} exceeds "
+                f"hard limit ₹{limit}"
+            )
+            return reason, 'max_single_order_value', order_value, limit
+
+        return None
+
+    def _check_position_size(
+        self,
+        order_value: float,
+        transaction_type: str
+    ) -> Optional[Tuple[str, str, Any, Any]]:
+        """Check position size (for BUY orders)."""
+        limit = self.max_position_size
+        if transaction_type == "BUY" and order_value > limit:
+            reason = (
+                f"Position size ₹{order_value:.2f} exceeds "
+                f"limit ₹{limit}"
+            )
+            return reason, 'max_position_size', order_value, limit
+
+        return None
+
+    def _check_daily_orders(
+        self,
+        symbol: str,
+        transaction_type: str,
+        product: str,
+        segment: str
+    ) -> Optional[Tuple[str, str, Any, Any]]:
+        """Check daily order count, including reserved orders (HARD LIMIT)."""
+        count = self._daily_order_count + self._reserved_orders
+        limit = self.max_daily_orders
+        if count >= limit:
+            reason = f"Daily order limit reached: {count}/{limit}"
+            return reason, 'max_daily_orders', count, limit
+
+        return None
+
+    def _check_open_positions(
+        self,
+        symbol: str,
+        transaction_type: str,
+        product: str,
+        segment: str
+    ) -> Optional[Tuple[str, str, Any, Any]]:
+        """Check open positions, including pending ones (for BUY orders opening a new position)."""
+        if transaction_type != "BUY":
+            return None
+
+        pending = self._pending_positions
+        count = self._position_count + len(pending)
+        limit = self.max_open_positions
+        if count >= limit and symbol not in self._open_positions and symbol not in pending:
+            reason = f"Maximum open positions reached: {count}/{limit}"
+            return reason, 'max_open_positions', count, limit
+
+        return None
+
+    def _check_daily_loss(
+        self,
+        symbol: str,
+        transaction_type: str,
+        product: str,
+        segment: str
+    ) -> Optional[Tuple[str, str, Any, Any]]:
+        """Check daily loss against the hard limit, then the soft limit."""
+        daily_pnl = self._daily_pnl
+        if daily_pnl >= 0:
+            return None
+
+        abs_loss = -daily_pnl
+
+        hard_limit = self.max_daily_loss_hard
+        if abs_loss >= hard_limit:
+            reason = (
+                f"Hard daily loss limit breached: ₹{abs_loss:.2f} >= "
+                f"₹{hard_limit} (KILL SWITCH TERRITORY)"
+            )
+            return reason, 'max_daily_loss_hard', abs_loss, hard_limit
+
+        limit = self.max_daily_loss
+        if abs_loss >= limit:
+            reason = (
+                f"Daily loss limit reached: ₹{abs_loss:.2f} >= "
+                f"₹{limit}"
+            )
+            return reason, 'max_daily_loss', abs_loss, limit
+
+        return None
+
+    def _check_forbidden(
+        self,
+        symbol: str,
+        transaction_type: str,
+        product: str,
+        segment: str
+    ) -> Optional[Tuple[Any, ...]]:
+        """Check forbidden segments and products."""
+        if not self._has_forbidden:
+            return None
+
+        return (
+            self._forbidden_segment_failures.get(segment)
+            or self._forbidden_product_failures.get(product)
+        )
+
+    def _approve_order(self, symbol: str, order_value: float) -> OrderValidation:
+        """
+        Approve order and log it.
+
+        Args:
+            symbol: Trading symbol
+            order_value: Order quantity * price
+
+        Returns:
+            Approved OrderValidation
+        """
+        self._n_approved += 1
+
+        if self._log_info_enabled:
             logger.info(
                 "Order approved by risk manager",
                 symbol=symbol,
@@ -289,28 +598,38 @@ class RiskManager:
                 daily_pnl=self._daily_pnl
             )
 
-            return OrderValidation(approved=True)
-
-        except Exception as e:
-            logger.error(f"Error during order validation: {e}", symbol=symbol)
-            return self._reject_order(
-                f"Validation error: {str(e)}",
-                'validation_error',
-                None,
-                None
-            )
+        return OrderValidation(approved=True)
 
     async def record_order(self, order: Order) -> None:
         """
         Record order for tracking.
 
+        Async wrapper around record_order_sync.
+
+        Args:
+            order: Order object to record
+        """
+        self.record_order_sync(order)
+
+    def record_order_sync(self, order: Order) -> None:
+        """
+        Record order for tracking.
+
         Args:
             order: Order object to record
         """
+        self._count_order()
+        self._store_order(order)
+
+    def _count_order(self) -> None:
+        """Count an order against today's order limit."""
         self._check_day_rollover()
+        self._daily_order_count += 1
 
+    def _store_order(self, order: Order) -> None:
+        """Add a counted order (and its JSON form) to today's order history."""
         self._daily_orders.append(order)
-        self._daily_order_count += 1
+        self._daily_orders_dumped.append(order.model_dump(mode='json'))
 
         logger.info(
             "Order recorded",
@@ -320,6 +639,106 @@ class RiskManager:
             daily_order_count=self._daily_order_count
         )
 
+    def record_orders_sync(self, orders: Iterable[Order]) -> None:
+        """
+        Record a batch of orders for tracking, oldest first.
+
+        Equivalent to calling record_order_sync for each order, with one
+        day-rollover check and one log line for the batch.
+
+        Args:
+            orders: Order objects to record
+        """
+        orders = list(orders)
+        if not orders:
+            return
+
+        self._check_day_rollover()
+
+        self._daily_orders.extend(orders)
+        self._daily_orders_dumped.extend(order.model_dump(mode='json') for order in orders)
+        self._daily_order_count += len(orders)
+
+        logger.info(
+            "Orders recorded",
+            count=len(orders),
+            daily_order_count=self._daily_order_count
+        )
+
+    async def start_recording(self, max_pending: int = 1024) -> None:
+        """
+        Start background order recording.
+
+        Once started, enqueue_order hands orders to a single worker task so
+        callers don't wait on bookkeeping; orders are recorded in the order
+        they were enqueued.
+
+        Args:
+            max_pending: Maximum queued orders before enqueue_order waits
+        """
+        if self._record_task:
+            logger.warning("Order recording already running")
+            return
+
+        self._record_queue = asyncio.Queue(maxsize=max_pending)
+        self._record_task = asyncio.create_task(self._record_worker())
+
+        logger.info("Background order recording started", max_pending=max_pending)
+
+    async def stop_recording(self) -> None:
+        """Record any pending orders and stop background order recording."""
+        if not self._record_task:
+            return
+
+        await self._record_queue.join()
+
+        self._record_task.cancel()
+        try:
+            await self._record_task
+        except asyncio.CancelledError:
+            pass
+
+        self._record_task = None
+        self._record_queue = None
+
+        logger.info("Background order recording stopped")
+
+    async def enqueue_order(self, order: Order) -> None:
+        """
+        Record order in the background.
+
+        The order is counted against the daily limit immediately, so limit
+        checks never lag behind placed orders; only storing it in the order
+        history is left to the worker. Falls back to recording immediately
+        when background recording is not running. Waits for a free slot if
+        the queue is full.
+
+        Args:
+            order: Order object to record
+        """
+        if self._record_queue is None:
+            self.record_order_sync(order)
+            return
+
+        self._count_order()
+
+        try:
+            self._record_queue.put_nowait(order)
+        except asyncio.QueueFull:
+            logger.warning("Order record queue full, waiting", order_id=order.order_id)
+            await self._record_queue.put(order)
+
+    async def _record_worker(self) -> None:
+        """Drain the order record queue (orders were counted by enqueue_order)."""
+        while True:
+            order = await self._record_queue.get()
+            try:
+                self._store_order(order)
+            except Exception as e:
+                logger.error(f"Failed to record order: {e}", order_id=order.order_id)
+            finally:
+                self._record_queue.task_done()
+
     async def update_daily_pnl(self) -> float:
         """
         Update daily P&L from current positions.
@@ -342,11 +761,35 @@ class RiskManager:
             }
             self._position_count = len(positions)
 
-            # Calculate daily P&L
-            daily_pnl = sum(
-                pos.pnl if pos.pnl is not None else 0.0
-                for pos in positions
-            )
+            # Pending opening BUYs that now show up as positions are counted there
+            pending = self._pending_positions
+            if pending:
+                for symbol in [sym for sym in pending if sym in self._open_positions]:
+                    del pending[symbol]
+
+            # Calculate used capital and daily P&L
+            if self._position_count > _VECTORIZE_MIN_POSITIONS:
+                count = self._position_count
+                pnl = np.fromiter(
+                    (pos.pnl if pos.pnl is not None else 0.0 for pos in positions),
+                    dtype=np.float64, count=count
+                )
+                qty = np.fromiter(
+                    (pos.quantity for pos in positions), dtype=np.float64, count=count
+                )
+                avg_price = np.fromiter(
+                    (pos.average_price for pos in positions), dtype=np.float64, count=count
+                )
+                self._used_capital = float(np.dot(qty, avg_price))
+                daily_pnl = float(pnl.sum())
+            else:
+                self._used_capital = sum(
+                    pos.quantity * pos.average_price for pos in positions
+                )
+                daily_pnl = sum(
+                    pos.pnl if pos.pnl is not None else 0.0
+                    for pos in positions
+                )
 
             self._daily_pnl = daily_pnl
 
@@ -379,11 +822,7 @@ class RiskManager:
             logger.warning(f"Could not update P&L for status: {e}")
 
         # Calculate available capital
-        used_capital = sum(
-            pos.quantity * pos.average_price
-            for pos in self._open_positions.values()
-        )
-        available_capital = self.max_portfolio_value - used_capital
+        available_capital = self.max_portfolio_value - self._used_capital
 
         # Check health
         warnings = []
@@ -418,7 +857,7 @@ class RiskManager:
             daily_pnl=self._daily_pnl,
             open_positions=self._position_count,
             max_positions=self.max_open_positions,
-            used_capital=used_capital,
+            used_capital=self._used_capital,
             available_capital=available_capital,
             daily_loss_limit=self.max_daily_loss,
             daily_order_count=self._daily_order_count,
@@ -430,7 +869,13 @@ class RiskManager:
 
     def _check_day_rollover(self) -> None:
         """Check if new trading day and reset counters."""
+        now_s = int(time.monotonic())
+        if now_s == self._last_today_check and self._today_cached == self._current_day:
+            return
+
         today = date.today()
+        self._last_today_check = now_s
+        self._today_cached = today
 
         if self._current_day != today:
             logger.info(
@@ -445,7 +890,10 @@ class RiskManager:
             self._current_day = today
             self._daily_pnl = 0.0
             self._daily_order_count = 0
-            self._daily_orders = []
+            self._daily_orders.clear()
+            self._daily_orders_dumped.clear()
+            # Unfilled day orders have expired; filled ones show up in positions
+            self._pending_positions.clear()
 
             # Keep position tracking but log it
             logger.info(
@@ -459,7 +907,8 @@ class RiskManager:
         reason: str,
         limit_type: str,
         current_value: Any,
-        limit_value: Any
+        limit_value: Any,
+        result: Optional[OrderValidation] = None
     ) -> OrderValidation:
         """
         Reject order and log reason.
@@ -469,16 +918,13 @@ class RiskManager:
             limit_type: Type of limit exceeded
             current_value: Current value
             limit_value: Limit value
+            result: Prebuilt rejection to return instead of building one
 
         Returns:
             OrderValidation with rejection details
         """
-        self.stats['orders_rejected'] += 1
-
-        # Track rejection reasons
-        if limit_type not in self.stats['rejection_reasons']:
-            self.stats['rejection_reasons'][limit_type] = 0
-        self.stats['rejection_reasons'][limit_type] += 1
+        self._n_rejected += 1
+        self._rejection_reasons[limit_type] += 1
 
         logger.warning(
             "Order rejected by risk manager",
@@ -489,6 +935,9 @@ class RiskManager:
             event_type="order_rejected"
         )
 
+        if result is not None:
+            return result
+
         return OrderValidation(
             approved=False,
             reason=reason,
@@ -497,6 +946,16 @@ class RiskManager:
             limit_value=limit_value
         )
 
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Validation counters as a dictionary."""
+        return {
+            'orders_validated': self._n_validated,
+            'orders_approved': self._n_approved,
+            'orders_rejected': self._n_rejected,
+            'rejection_reasons': dict(self._rejection_reasons)
+        }
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get risk manager statistics.
@@ -505,17 +964,17 @@ class RiskManager:
             Dictionary with statistics
         """
         approval_rate = (
-            (self.stats['orders_approved'] / self.stats['orders_validated'] * 100)
-            if self.stats['orders_validated'] > 0
+            (self._n_approved / self._n_validated * 100)
+            if self._n_validated > 0
             else 0
         )
 
         return {
-            'orders_validated': self.stats['orders_validated'],
-            'orders_approved': self.stats['orders_approved'],
-            'orders_rejected': self.stats['orders_rejected'],
+            'orders_validated': self._n_validated,
+            'orders_approved': self._n_approved,
+            'orders_rejected': self._n_rejected,
             'approval_rate': approval_rate,
-            'rejection_reasons': self.stats['rejection_reasons'],
+            'rejection_reasons': dict(self._rejection_reasons),
             'current_state': {
                 'current_day': str(self._current_day),
                 'daily_pnl': self._daily_pnl,
@@ -536,7 +995,9 @@ class RiskManager:
         self._current_day = date.today()
         self._daily_pnl = 0.0
         self._daily_order_count = 0
-        self._daily_orders = []
+        self._daily_orders.clear()
+        self._daily_orders_dumped.clear()
+        self._pending_positions.clear()
 
     def __repr__(self) -> str:
         """String representation."""
@@ -0,0 +1,55 @@
+"""
+Numeric kernels for per-bar strategy updates.
+
+Compiled with Numba when it is installed (optional, see the `speed`
+extra); otherwise they run as plain Python functions.
+"""
+
+import math
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback when Numba is not installed: return the function as-is."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True)
+def bband_step(new, old, count, mean, m2, period, num_std):
+    """
+    Advance rolling Bollinger Band state by one price.
+
+    Uses Welford's online update (extended to a sliding window), which
+    avoids the cancellation of a running sum of squares on large prices.
+
+    Args:
+        new: Price entering the window
+        old: Price leaving the window (ignored until the window is full)
+        count: Number of prices in the window before this one
+        mean: Running mean of the window
+        m2: Running sum of squared deviations from the mean
+        period: Window length
+        num_std: Number of standard deviations for the bands
+
+    Returns:
+        Tuple of (mean, m2, middle, upper, lower); bands are only meaningful
+        once the window holds `period` prices
+    """
+    if count >= period:
+        new_mean = mean + (new - old) / period
+        m2 += (new - old) * (new - new_mean + old - mean)
+        mean = new_mean
+    else:
+        delta = new - mean
+        mean += delta / (count + 1)
+        m2 += delta * (new - mean)
+
+    variance = m2 / (period - 1)
+    if variance < 0.0:
+        variance = 0.0
+
+    width = num_std * math.sqrt(variance)
+    return mean, m2, mean, mean + width, mean - width
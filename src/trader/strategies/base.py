@@ -5,8 +5,12 @@ All trading strategies should inherit from BaseStrategy and implement
 the required methods.
 """
 
+import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from collections import deque
+from typing import TYPE_CHECKING, Deque
+
+import numpy as np
 
 from ..api.models import OHLC
 from ..core.logging_config import get_logger
@@ -15,6 +19,8 @@ if TYPE_CHECKING:
     from ..backtesting.engine import BacktestEngine
 
 logger = get_logger(__name__)
+# Underlying stdlib logger; structlog's filter_by_level gates on its level
+_stdlib_logger = logging.getLogger(__name__)
 
 
 class BaseStrategy(ABC):
@@ -26,16 +32,22 @@ class BaseStrategy(ABC):
     - on_data(): Process new market data and generate signals
     """
 
-    def __init__(self, name: str = "BaseStrategy"):
+    def __init__(self, name: str = "BaseStrategy", history_size: int = 512):
         """
         Initialize strategy.
 
         Args:
             name: Strategy name for logging
+            history_size: Maximum bars kept in data_history; the oldest
+                bars are dropped once it is full
         """
         self.name = name
         self.engine: 'BacktestEngine' = None
-        self.data_history = []
+        self.data_history: Deque[OHLC] = deque(maxlen=history_size)
+
+        # log() prefix, and whether its INFO messages would be emitted
+        self._name_prefix = name + ": "
+        self._info_on = _stdlib_logger.isEnabledFor(logging.INFO)
 
         logger.info(f"Strategy initialized: {name}")
 
@@ -47,7 +59,14 @@ class BaseStrategy(ABC):
             engine: BacktestEngine instance
         """
         self.engine = engine
-        self.data_history = []
+        self.data_history.clear()
+        self._info_on = _stdlib_logger.isEnabledFor(logging.INFO)
+
+        # Bind position lookups straight to the engine; the class methods
+        # below remain the fallback before initialization
+        get_position = engine.get_position
+        self.get_position = get_position
+        self.has_position = lambda symbol: get_position(symbol) > 0
         logger.info(f"{self.name}: Strategy initialized with engine")
 
     @abstractmethod
@@ -65,6 +84,31 @@ class BaseStrategy(ABC):
         """
         pass
 
+    def precompute(self, close: np.ndarray) -> None:
+        """
+        Precompute indicators over a full price series before a backtest.
+
+        Strategies that can vectorize their indicators override this
+        together with on_bar(). The default does nothing.
+
+        Args:
+            close: Close prices for every bar in the backtest
+        """
+        pass
+
+    def on_bar(self, index: int, data: OHLC) -> None:
+        """
+        Called by the backtesting engine for each bar.
+
+        Strategies that override precompute() read their indicators for
+        bar `index` here. The default forwards to on_data().
+
+        Args:
+            index: Position of the bar in the precomputed series
+            data: OHLC data point for the bar
+        """
+        self.on_data(data)
+
     def get_position(self, symbol: str) -> int:
         """
         Get current position for a symbol.
@@ -97,4 +141,5 @@ class BaseStrategy(ABC):
             message: Log message
             **kwargs: Additional log context
         """
-        logger.info(f"{self.name}: {message}", **kwargs)
+        if self._info_on:
+            logger.info(self._name_prefix + message, **kwargs)
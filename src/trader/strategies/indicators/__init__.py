@@ -0,0 +1,13 @@
+"""
+Technical Indicators Package.
+
+Vectorized indicator calculations used to precompute strategy signals
+over a full price series.
+"""
+
+from .rolling import rolling_mean, rolling_std
+
+__all__ = [
+    "rolling_mean",
+    "rolling_std"
+]
@@ -0,0 +1,54 @@
+"""
+Vectorized rolling-window indicators.
+
+Each function takes a 1-D price array and returns an array of the same
+length, with NaN for the leading bars before the first full window.
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def _pad_leading(values: np.ndarray, period: int) -> np.ndarray:
+    """Prefix window results with NaN so index i lines up with bar i."""
+    out = np.full(len(values) + period - 1, np.nan)
+    out[period - 1:] = values
+    return out
+
+
+def rolling_mean(prices: np.ndarray, period: int) -> np.ndarray:
+    """
+    Calculate the simple moving average over a rolling window.
+
+    Args:
+        prices: 1-D array of prices
+        period: Window length in bars
+
+    Returns:
+        Array of moving averages (NaN until the first full window)
+    """
+    prices = np.asarray(prices, dtype=float)
+    if len(prices) < period:
+        return np.full(len(prices), np.nan)
+
+    windows = sliding_window_view(prices, period)
+    return _pad_leading(windows.mean(axis=1), period)
+
+
+def rolling_std(prices: np.ndarray, period: int) -> np.ndarray:
+    """
+    Calculate the sample standard deviation over a rolling window.
+
+    Args:
+        prices: 1-D array of prices
+        period: Window length in bars
+
+    Returns:
+        Array of standard deviations (NaN until the first full window)
+    """
+    prices = np.asarray(prices, dtype=float)
+    if len(prices) < period:
+        return np.full(len(prices), np.nan)
+
+    windows = sliding_window_view(prices, period)
+    return _pad_leading(windows.std(axis=1, ddof=1), period)
@@ -5,11 +5,14 @@ Buys when price is significantly below average and sells when it returns to aver
 Uses Bollinger Bands to identify overbought/oversold conditions.
 """
 
-from typing import Deque
+from typing import Deque, Optional
 from collections import deque
-import statistics
 
+import numpy as np
+
+from ._kernels import bband_step
 from .base import BaseStrategy
+from .indicators import rolling_mean, rolling_std
 from ..api.models import OHLC
 
 
@@ -45,9 +48,18 @@ class MeanReversionStrategy(BaseStrategy):
         # Price history for calculating bands
         self.prices: Deque[float] = deque(maxlen=period)
 
+        # Running mean and sum of squared deviations over the price window
+        self._mean: float = 0.0
+        self._m2: float = 0.0
+
         # Entry price for profit target
         self.entry_price = None
 
+        # Bands precomputed for a backtest (see precompute)
+        self._middle_series: Optional[np.ndarray] = None
+        self._upper_series: Optional[np.ndarray] = None
+        self._lower_series: Optional[np.ndarray] = None
+
     def on_data(self, data: OHLC) -> None:
         """
         Process new market data and execute mean reversion strategy.
@@ -55,19 +67,77 @@ class MeanReversionStrategy(BaseStrategy):
         Args:
             data: New OHLC data point
         """
-        # Add new price to history
-        self.prices.append(data.close)
+        # Add new price to history, dropping the price that leaves the window
+        new = data.close
+        count = len(self.prices)
+        old = self.prices[0] if count == self.period else 0.0
+
+        self.prices.append(new)
+
+        # Update Bollinger Bands (sample standard deviation)
+        self._mean, self._m2, middle_band, upper_band, lower_band = bband_step(
+            new, old, count, self._mean, self._m2, self.period, self.num_std
+        )
 
         # Need enough data for Bollinger Bands
         if len(self.prices) < self.period:
             return
 
-        # Calculate Bollinger Bands
-        middle_band = statistics.mean(self.prices)
-        std_dev = statistics.stdev(self.prices)
-        upper_band = middle_band + (self.num_std * std_dev)
-        lower_band = middle_band - (self.num_std * std_dev)
+        self._on_bands(data, middle_band, upper_band, lower_band)
+
+    def precompute(self, close: np.ndarray) -> None:
+        """
+        Precompute Bollinger Bands for every bar of a backtest.
+
+        Args:
+            close: Close prices for every bar in the backtest
+        """
+        middle = rolling_mean(close, self.period)
+        width = self.num_std * rolling_std(close, self.period)
+
+        self._middle_series = middle
+        self._upper_series = middle + width
+        self._lower_series = middle - width
+
+    def on_bar(self, index: int, data: OHLC) -> None:
+        """
+        Execute mean reversion strategy using the precomputed bands.
+
+        Args:
+            index: Position of the bar in the precomputed series
+            data: OHLC data point for the bar
+        """
+        if self._middle_series is None:
+            self.on_data(data)
+            return
+
+        # Need enough data for Bollinger Bands
+        if index < self.period - 1:
+            return
 
+        self._on_bands(
+            data,
+            float(self._middle_series[index]),
+            float(self._upper_series[index]),
+            float(self._lower_series[index])
+        )
+
+    def _on_bands(
+        self,
+        data: OHLC,
+        middle_band: float,
+        upper_band: float,
+        lower_band: float
+    ) -> None:
+        """
+        Trade on price relative to the Bollinger Bands.
+
+        Args:
+            data: Current OHLC data point
+            middle_band: Moving average at this bar
+            upper_band: Upper band at this bar
+            lower_band: Lower band at this bar
+        """
         current_position = self.get_position(data.symbol)
         current_price = data.close
 
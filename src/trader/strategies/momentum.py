@@ -5,10 +5,13 @@ Buys when price momentum is strong and sells when it weakens.
 Uses Simple Moving Average (SMA) crossover as the momentum indicator.
 """
 
-from typing import Deque
+from typing import Deque, Dict, List, Optional, Tuple
 from collections import deque
 
+import numpy as np
+
 from .base import BaseStrategy
+from .indicators import rolling_mean
 from ..api.models import OHLC
 
 
@@ -44,10 +47,20 @@ class MomentumStrategy(BaseStrategy):
         # Price history for calculating SMAs
         self.prices: Deque[float] = deque(maxlen=slow_period)
 
+        # Running sums over the fast and slow windows
+        self._fast_sum: float = 0.0
+        self._slow_sum: float = 0.0
+
         # Track previous SMAs for crossover detection
         self.prev_fast_sma = None
         self.prev_slow_sma = None
 
+        # SMAs precomputed for a backtest (see precompute)
+        self._fast_sma_series: Optional[np.ndarray] = None
+        self._slow_sma_series: Optional[np.ndarray] = None
+        self._bullish_at: Optional[np.ndarray] = None
+        self._bearish_at: Optional[np.ndarray] = None
+
     def on_data(self, data: OHLC) -> None:
         """
         Process new market data and execute momentum strategy.
@@ -55,32 +68,166 @@ class MomentumStrategy(BaseStrategy):
         Args:
             data: New OHLC data point
         """
-        # Add new price to history
+        # Add new price to history, dropping prices that leave each window
+        count = len(self.prices)
+        if count >= self.fast_period:
+            self._fast_sum -= self.prices[-self.fast_period]
+        if count == self.slow_period:
+            self._slow_sum -= self.prices[0]
+
         self.prices.append(data.close)
+        self._fast_sum += data.close
+        self._slow_sum += data.close
 
         # Need enough data for slow SMA
         if len(self.prices) < self.slow_period:
             return
 
         # Calculate SMAs
-        fast_sma = self._calculate_sma(self.fast_period)
-        slow_sma = self._calculate_sma(self.slow_period)
+        fast_sma = self._fast_sum / self.fast_period
+        slow_sma = self._slow_sum / self.slow_period
+
+        self._on_sma(data, fast_sma, slow_sma)
+
+    def precompute(self, close: np.ndarray) -> None:
+        """
+        Precompute SMAs and crossovers for every bar of a backtest.
+
+        Args:
+            close: Close prices for every bar in the backtest
+        """
+        self._fast_sma_series = rolling_mean(close, self.fast_period)
+        self._slow_sma_series = rolling_mean(close, self.slow_period)
+        self._bullish_at, self._bearish_at = self._crossovers(
+            self._fast_sma_series, self._slow_sma_series
+        )
+
+    def on_batch(self, bars: List[OHLC]) -> Dict[str, np.ndarray]:
+        """
+        Detect all SMA crossovers over a batch of bars in one pass.
+
+        Signals are not filtered by position; callers replaying them must
+        apply the same position checks as on_data.
+
+        Args:
+            bars: Consecutive OHLC bars
+
+        Returns:
+            Dictionary with bar indices and close prices of bullish and
+            bearish crossovers
+        """
+        close = np.fromiter((bar.close for bar in bars), dtype=np.float64, count=len(bars))
+        bullish_at, bearish_at = self._crossovers(
+            rolling_mean(close, self.fast_period),
+            rolling_mean(close, self.slow_period)
+        )
+        bullish_index = np.flatnonzero(bullish_at)
+        bearish_index = np.flatnonzero(bearish_at)
+
+        return {
+            'bullish_index': bullish_index,
+            'bullish_price': close[bullish_index],
+            'bearish_index': bearish_index,
+            'bearish_price': close[bearish_index]
+        }
+
+    @staticmethod
+    def _crossovers(
+        fast_sma: np.ndarray,
+        slow_sma: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find bars where the fast SMA crosses the slow SMA.
+
+        Args:
+            fast_sma: Fast SMA per bar (NaN during warm-up)
+            slow_sma: Slow SMA per bar (NaN during warm-up)
+
+        Returns:
+            Boolean arrays (bullish, bearish) aligned with the bars
+        """
+        bullish = np.zeros(len(fast_sma), dtype=bool)
+        bearish = np.zeros(len(fast_sma), dtype=bool)
+
+        # NaN comparisons are False, so warm-up bars never signal
+        prev_fast, prev_slow = fast_sma[:-1], slow_sma[:-1]
+        cur_fast, cur_slow = fast_sma[1:], slow_sma[1:]
+        bullish[1:] = (prev_fast <= prev_slow) & (cur_fast > cur_slow)
+        bearish[1:] = (prev_fast >= prev_slow) & (cur_fast < cur_slow)
+
+        return bullish, bearish
+
+    def on_bar(self, index: int, data: OHLC) -> None:
+        """
+        Execute momentum strategy using the precomputed crossovers.
+
+        Args:
+            index: Position of the bar in the precomputed series
+            data: OHLC data point for the bar
+        """
+        if self._slow_sma_series is None:
+            self.on_data(data)
+            return
+
+        # Need enough data for slow SMA
+        if index < self.slow_period - 1:
+            return
 
+        fast_sma = float(self._fast_sma_series[index])
+        slow_sma = float(self._slow_sma_series[index])
+
+        if self._bullish_at[index] or self._bearish_at[index]:
+            self._trade_crossover(data, fast_sma, slow_sma, bool(self._bullish_at[index]))
+
+        self.prev_fast_sma = fast_sma
+        self.prev_slow_sma = slow_sma
+
+    def _on_sma(self, data: OHLC, fast_sma: float, slow_sma: float) -> None:
+        """
+        Trade on SMA crossovers.
+
+        Args:
+            data: Current OHLC data point
+            fast_sma: Fast SMA at this bar
+            slow_sma: Slow SMA at this bar
+        """
         # Need previous values for crossover detection
         if self.prev_fast_sma is None or self.prev_slow_sma is None:
             self.prev_fast_sma = fast_sma
             self.prev_slow_sma = slow_sma
             return
 
-        # Check for crossovers
+        # Bullish crossover: Fast SMA crosses above Slow SMA
+        if self.prev_fast_sma <= self.prev_slow_sma and fast_sma > slow_sma:
+            self._trade_crossover(data, fast_sma, slow_sma, True)
+
+        # Bearish crossover: Fast SMA crosses below Slow SMA
+        elif self.prev_fast_sma >= self.prev_slow_sma and fast_sma < slow_sma:
+            self._trade_crossover(data, fast_sma, slow_sma, False)
+
+        # Update previous SMAs
+        self.prev_fast_sma = fast_sma
+        self.prev_slow_sma = slow_sma
+
+    def _trade_crossover(
+        self,
+        data: OHLC,
+        fast_sma: float,
+        slow_sma: float,
+        bullish: bool
+    ) -> None:
+        """
+        Buy on a bullish crossover when flat, sell on a bearish one when long.
+
+        Args:
+            data: Current OHLC data point
+            fast_sma: Fast SMA at this bar
+            slow_sma: Slow SMA at this bar
+            bullish: True for a bullish crossover, False for bearish
+        """
         current_position = self.get_position(data.symbol)
 
-        # Bullish crossover: Fast SMA crosses above Slow SMA
-        if (
-            self.prev_fast_sma <= self.prev_slow_sma
-            and fast_sma > slow_sma
-            and current_position == 0
-        ):
+        if bullish and current_position == 0:
             self.log(
                 "Bullish crossover detected - BUY signal",
                 fast_sma=fast_sma,
@@ -94,12 +241,7 @@ class MomentumStrategy(BaseStrategy):
                 timestamp=data.timestamp
             )
 
-        # Bearish crossover: Fast SMA crosses below Slow SMA
-        elif (
-            self.prev_fast_sma >= self.prev_slow_sma
-            and fast_sma < slow_sma
-            and current_position > 0
-        ):
+        elif not bullish and current_position > 0:
             self.log(
                 "Bearish crossover detected - SELL signal",
                 fast_sma=fast_sma,
@@ -112,23 +254,3 @@ class MomentumStrategy(BaseStrategy):
                 price=data.close,
                 timestamp=data.timestamp
             )
-
-        # Update previous SMAs
-        self.prev_fast_sma = fast_sma
-        self.prev_slow_sma = slow_sma
-
-    def _calculate_sma(self, period: int) -> float:
-        """
-        Calculate Simple Moving Average.
-
-        Args:
-            period: Number of periods for SMA
-
-        Returns:
-            SMA value
-        """
-        if len(self.prices) < period:
-            return sum(self.prices) / len(self.prices)
-
-        recent_prices = list(self.prices)[-period:]
-        return sum(recent_prices) / period
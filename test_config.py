@@ -1,57 +1,83 @@
 #!/usr/bin/env python
 """Quick configuration test script."""
 
+import sys
+
 from src.trader.core.config import get_config
 
+# Dotted keys printed below, resolved once up front
+KEYS = (
+    'trading.mode',
+    'trading.default_exchange',
+    'risk.max_portfolio_value',
+    'risk.max_position_size',
+    'risk.max_daily_loss',
+    'risk.max_open_positions',
+    'api.rate_limits.orders_per_second',
+    'api.rate_limits.live_data_per_second',
+    'api.rate_limits.non_trading_per_second',
+    'gtt.monitor_interval_seconds',
+    'gtt.max_active_gtt',
+)
+
 def main():
     c = get_config()
+    cfg = {key: c.get(key) for key in KEYS}
+    hard_limits = c.hard_limits
+
+    # Collect the report and write it in one go
+    out = []
+
+    out.append("=" * 50)
+    out.append("CONFIGURATION VERIFIED [OK]")
+    out.append("=" * 50)
+    out.append("")
+
+    out.append("Trading Settings:")
+    out.append(f"  Mode: {cfg['trading.mode']}")
+    out.append(f"  Paper mode enforced: {c.is_paper_mode()}")
+    out.append(f"  Default exchange: {cfg['trading.default_exchange']}")
+    out.append("")
+
+    out.append("Risk Limits (Configurable):")
+    out.append(f"  Max portfolio: Rs {cfg['risk.max_portfolio_value']:,}")
+    out.append(f"  Max position: Rs {cfg['risk.max_position_size']:,}")
+    out.append(f"  Max daily loss: Rs {cfg['risk.max_daily_loss']:,}")
+    out.append(f"  Max open positions: {cfg['risk.max_open_positions']}")
+    out.append("")
+
+    out.append("Hard Limits (NON-OVERRIDABLE):")
+    out.append(f"  Max single order: Rs {hard_limits.MAX_SINGLE_ORDER_VALUE:,}")
+    out.append(f"  Max daily orders: {hard_limits.MAX_DAILY_ORDERS}")
+    out.append(f"  Max portfolio (hard): Rs {hard_limits.MAX_PORTFOLIO_VALUE:,}")
+    out.append(f"  Kill switch at loss: Rs {hard_limits.MAX_DAILY_LOSS_HARD:,}")
+    out.append(f"  Forbidden segments: {hard_limits.FORBIDDEN_SEGMENTS}")
+    out.append(f"  Forbidden products: {hard_limits.FORBIDDEN_PRODUCTS}")
+    out.append("")
+
+    out.append("API Rate Limits (Conservative):")
+    out.append(f"  Orders/sec: {cfg['api.rate_limits.orders_per_second']} (API allows 15)")
+    out.append(f"  Live data/sec: {cfg['api.rate_limits.live_data_per_second']} (API allows 10)")
+    out.append(f"  Non-trading/sec: {cfg['api.rate_limits.non_trading_per_second']} (API allows 20)")
+    out.append("")
+
+    out.append("GTT Configuration:")
+    out.append(f"  Monitor interval: {cfg['gtt.monitor_interval_seconds']} seconds")
+    out.append(f"  Max active GTTs: {cfg['gtt.max_active_gtt']}")
+    out.append("")
+
+    out.append("Kill Switch Conditions:")
+    out.extend(
+        f"  {i}. {cond.description}"
+        for i, cond in enumerate(c.kill_switch_conditions, 1)
+    )
+    out.append("")
+
+    out.append("=" * 50)
+    out.append("[OK] All configuration loaded successfully!")
+    out.append("=" * 50)
 
-    print("=" * 50)
-    print("CONFIGURATION VERIFIED [OK]")
-    print("=" * 50)
-    print()
-
-    print("Trading Settings:")
-    print(f"  Mode: {c.get('trading.mode')}")
-    print(f"  Paper mode enforced: {c.is_paper_mode()}")
-    print(f"  Default exchange: {c.get('trading.default_exchange')}")
-    print()
-
-    print("Risk Limits (Configurable):")
-    print(f"  Max portfolio: Rs {c.get('risk.max_portfolio_value'):,}")
-    print(f"  Max position: Rs {c.get('risk.max_position_size'):,}")
-    print(f"  Max daily loss: Rs {c.get('risk.max_daily_loss'):,}")
-    print(f"  Max open positions: {c.get('risk.max_open_positions')}")
-    print()
-
-    print("Hard Limits (NON-OVERRIDABLE):")
-    print(f"  Max single order: Rs {c.hard_limits.MAX_SINGLE_ORDER_VALUE:,}")
-    print(f"  Max daily orders: {c.hard_limits.MAX_DAILY_ORDERS}")
-    print(f"  Max portfolio (hard): Rs {c.hard_limits.MAX_PORTFOLIO_VALUE:,}")
-    print(f"  Kill switch at loss: Rs {c.hard_limits.MAX_DAILY_LOSS_HARD:,}")
-    print(f"  Forbidden segments: {c.hard_limits.FORBIDDEN_SEGMENTS}")
-    print(f"  Forbidden products: {c.hard_limits.FORBIDDEN_PRODUCTS}")
-    print()
-
-    print("API Rate Limits (Conservative):")
-    print(f"  Orders/sec: {c.get('api.rate_limits.orders_per_second')} (API allows 15)")
-    print(f"  Live data/sec: {c.get('api.rate_limits.live_data_per_second')} (API allows 10)")
-    print(f"  Non-trading/sec: {c.get('api.rate_limits.non_trading_per_second')} (API allows 20)")
-    print()
-
-    print("GTT Configuration:")
-    print(f"  Monitor interval: {c.get('gtt.monitor_interval_seconds')} seconds")
-    print(f"  Max active GTTs: {c.get('gtt.max_active_gtt')}")
-    print()
-
-    print("Kill Switch Conditions:")
-    for i, cond in enumerate(c.kill_switch_conditions, 1):
-        print(f"  {i}. {cond.description}")
-    print()
-
-    print("=" * 50)
-    print("[OK] All configuration loaded successfully!")
-    print("=" * 50)
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     main()
@@ -12,12 +12,73 @@ Run with: python test_mcp_server.py
 
 import os
 import sys
+import traceback
+from collections import defaultdict
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 
+# Tool name keyword -> category, checked in order (first match wins)
+_TOOL_KEYWORDS = (
+    ('quote', 'Market Data'),
+    ('ltp', 'Market Data'),
+    ('ohlc', 'Market Data'),
+    ('historical', 'Market Data'),
+    ('market', 'Market Data'),
+    ('order', 'Orders'),
+    ('risk', 'Orders'),
+    ('kill', 'Orders'),
+    ('position', 'Portfolio'),
+    ('holding', 'Portfolio'),
+    ('portfolio', 'Portfolio'),
+    ('allocation', 'Portfolio'),
+    ('gtt', 'GTT'),
+)
+_CATEGORY_ORDER = tuple(dict.fromkeys(category for _, category in _TOOL_KEYWORDS))
+
+# Tools listed when none are registered yet, by category
+_EXPECTED_TOOLS = (
+    ('Market Data', (
+        'get_quote', 'get_ltp', 'get_ohlc', 'get_historical_data',
+        'get_multiple_ltps', 'get_market_status'
+    )),
+    ('Orders', (
+        'place_order', 'place_orders', 'cancel_order', 'get_order_status',
+        'get_risk_status', 'activate_kill_switch',
+        'deactivate_kill_switch', 'get_order_book'
+    )),
+    ('Portfolio', (
+        'get_positions', 'get_holdings', 'get_portfolio_summary',
+        'get_position_by_symbol', 'get_holding_by_symbol',
+        'calculate_portfolio_allocation'
+    )),
+    ('GTT', (
+        'create_gtt', 'list_gtts', 'get_gtt', 'cancel_gtt',
+        'get_gtt_statistics', 'trigger_gtt_manually',
+        'pause_gtt_monitoring', 'resume_gtt_monitoring',
+        'check_gtt_trigger_condition'
+    )),
+)
+
+# Environment variables checked by check_environment(), and which to mask
+REQUIRED_ENV_VARS = {
+    'GROWW_API_KEY': 'Groww API Key',
+    'GROWW_SECRET': 'Groww Secret',
+    'FORCE_PAPER_MODE': 'Paper Mode Flag'
+}
+SENSITIVE_VARS = frozenset({'GROWW_API_KEY', 'GROWW_SECRET'})
+
+
+def _count_exports(module):
+    """Count a module's public names, preferring its __all__ if defined."""
+    exported = getattr(module, '__all__', None)
+    if exported is not None:
+        return len(exported)
+    return sum(1 for name in vars(module) if not name.startswith('_'))
+
+
 def test_imports():
     """Test that all modules can be imported."""
     print("=" * 60)
@@ -34,10 +95,10 @@ def test_imports():
     try:
         from trader.mcp.tools import market_data, orders, portfolio, gtt
         print("✅ All tool modules imported successfully")
-        print(f"   - market_data: {len([x for x in dir(market_data) if not x.startswith('_')])} exports")
-        print(f"   - orders: {len([x for x in dir(orders) if not x.startswith('_')])} exports")
-        print(f"   - portfolio: {len([x for x in dir(portfolio) if not x.startswith('_')])} exports")
-        print(f"   - gtt: {len([x for x in dir(gtt) if not x.startswith('_')])} exports")
+        print(f"   - market_data: {_count_exports(market_data)} exports")
+        print(f"   - orders: {_count_exports(orders)} exports")
+        print(f"   - portfolio: {_count_exports(portfolio)} exports")
+        print(f"   - gtt: {_count_exports(gtt)} exports")
     except Exception as e:
         print(f"❌ Failed to import tool modules: {e}")
         return False
@@ -108,24 +169,16 @@ def list_available_tools():
             print(f"\n✅ Found {len(tools)} registered tools:\n")
 
             # Group tools by category
-            categories = {
-                'Market Data': [],
-                'Orders': [],
-                'Portfolio': [],
-                'GTT': []
-            }
-
-            for tool_name in sorted(tools.keys()):
-                if any(x in tool_name for x in ['quote', 'ltp', 'ohlc', 'historical', 'market']):
-                    categories['Market Data'].append(tool_name)
-                elif any(x in tool_name for x in ['order', 'risk', 'kill']):
-                    categories['Orders'].append(tool_name)
-                elif any(x in tool_name for x in ['position', 'holding', 'portfolio', 'allocation']):
-                    categories['Portfolio'].append(tool_name)
-                elif 'gtt' in tool_name:
-                    categories['GTT'].append(tool_name)
-
-            for category, tool_list in categories.items():
+            categories = defaultdict(list)
+
+            for tool_name in sorted(tools):
+                for keyword, category in _TOOL_KEYWORDS:
+                    if keyword in tool_name:
+                        categories[category].append(tool_name)
+                        break
+
+            for category in _CATEGORY_ORDER:
+                tool_list = categories.get(category)
                 if tool_list:
                     print(f"{category} ({len(tool_list)} tools):")
                     for tool in tool_list:
@@ -137,30 +190,7 @@ def list_available_tools():
             print("⚠️  No tools registered yet (tools may register on server start)")
             print("\nExpected tools:")
 
-            expected_tools = {
-                'Market Data': [
-                    'get_quote', 'get_ltp', 'get_ohlc', 'get_historical_data',
-                    'get_multiple_ltps', 'get_market_status'
-                ],
-                'Orders': [
-                    'place_order', 'cancel_order', 'get_order_status',
-                    'get_risk_status', 'activate_kill_switch',
-                    'deactivate_kill_switch', 'get_order_book'
-                ],
-                'Portfolio': [
-                    'get_positions', 'get_holdings', 'get_portfolio_summary',
-                    'get_position_by_symbol', 'get_holding_by_symbol',
-                    'calculate_portfolio_allocation'
-                ],
-                'GTT': [
-                    'create_gtt', 'list_gtts', 'get_gtt', 'cancel_gtt',
-                    'get_gtt_statistics', 'trigger_gtt_manually',
-                    'pause_gtt_monitoring', 'resume_gtt_monitoring',
-                    'check_gtt_trigger_condition'
-                ]
-            }
-
-            for category, tool_list in expected_tools.items():
+            for category, tool_list in _EXPECTED_TOOLS:
                 print(f"\n{category} ({len(tool_list)} tools):")
                 for tool in tool_list:
                     print(f"  - {tool}")
@@ -169,7 +199,6 @@ def list_available_tools():
 
     except Exception as e:
         print(f"❌ Error listing tools: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -191,20 +220,18 @@ def check_environment():
         print("   Create .env from .env.example and add your Groww API credentials")
 
     # Check required environment variables
-    required_vars = {
-        'GROWW_API_KEY': 'Groww API Key',
-        'GROWW_SECRET': 'Groww Secret',
-        'FORCE_PAPER_MODE': 'Paper Mode Flag'
-    }
+    required_vars = REQUIRED_ENV_VARS
 
     print("\nEnvironment Variables:")
     all_set = True
+    env = os.environ
     for var, description in required_vars.items():
-        value = os.getenv(var)
+        value = env.get(var)
         if value:
-            if var in ['GROWW_API_KEY', 'GROWW_SECRET']:
+            if var in SENSITIVE_VARS:
                 # Mask sensitive values
-                masked = value[:4] + '*' * (len(value) - 8) + value[-4:] if len(value) > 8 else '***'
+                n = len(value)
+                masked = f"{value[:4]}{'*' * (n - 8)}{value[-4:]}" if n > 8 else '***'
                 print(f"  ✅ {var}: {masked}")
             else:
                 print(f"  ✅ {var}: {value}")
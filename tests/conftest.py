@@ -0,0 +1,14 @@
+"""
+Shared pytest configuration for the test suite.
+"""
+
+import asyncio
+
+# Run async tests on uvloop when it is installed (optional, see the `speed`
+# extra); pytest-asyncio builds its loops from the current policy
+try:
+    import uvloop
+except ImportError:
+    pass
+else:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -10,8 +10,9 @@ Tests cover:
 """
 
 import pytest
-import asyncio
+import itertools
 from datetime import datetime, timedelta
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 
 from src.trader.api.client import GrowwClient
@@ -22,98 +23,130 @@ from src.trader.api.exceptions import (
 )
 
 
-@pytest.fixture
+# GrowwAPI methods the client calls
+_API_METHODS = (
+    'place_order', 'cancel_order', 'get_order_status', 'get_quote', 'get_ltp',
+    'get_ohlc', 'get_historical_data', 'get_positions', 'get_holdings'
+)
+
+
+def _api_stub():
+    """Plain stand-in for GrowwAPI that records the names of called methods."""
+    api = SimpleNamespace(calls=[])
+
+    def method(name):
+        def call(*args, **kwargs):
+            api.calls.append(name)
+        return call
+
+    for name in _API_METHODS:
+        setattr(api, name, method(name))
+    return api
+
+
+# Values served by the mocked config (built once, read-only)
+_CONFIG_TABLE = MappingProxyType({
+    'api.rate_limits': MappingProxyType({
+        'orders_per_second': 10,
+        'live_data_per_second': 8,
+        'non_trading_per_second': 15
+    }),
+    'risk.max_portfolio_value': 50000,
+    'risk.max_position_size': 5000
+})
+
+_HARD_LIMITS = {
+    'MAX_SINGLE_ORDER_VALUE': 10000,
+    'MAX_DAILY_ORDERS': 15,
+    'FORBIDDEN_SEGMENTS': ['FNO'],
+    'FORBIDDEN_PRODUCTS': ['MIS']
+}
+
+
+@pytest.fixture(scope='session')
 def mock_config():
     """Mock configuration."""
     config = Mock()
     config.is_paper_mode.return_value = True
-    config.get.side_effect = lambda key, default=None: {
-        'api.rate_limits': {
-            'orders_per_second': 10,
-            'live_data_per_second': 8,
-            'non_trading_per_second': 15
-        },
-        'risk.max_portfolio_value': 50000,
-        'risk.max_position_size': 5000
-    }.get(key, default)
-    config.hard_limits = {
-        'MAX_SINGLE_ORDER_VALUE': 10000,
-        'MAX_DAILY_ORDERS': 15,
-        'FORBIDDEN_SEGMENTS': ['FNO'],
-        'FORBIDDEN_PRODUCTS': ['MIS']
-    }
+    config.get.side_effect = _CONFIG_TABLE.get
+    config.hard_limits = _HARD_LIMITS
     return config
 
 
+@pytest.fixture(scope='module', autouse=True)
+def _patch_client_deps(mock_config):
+    """Patch the client's config and auth dependencies once per module."""
+    with patch('src.trader.api.client.get_config', return_value=mock_config), \
+            patch('src.trader.api.client.AuthManager') as mock_auth:
+        yield mock_auth
+
+
 @pytest.fixture
-def mock_auth_manager():
-    """Mock authentication manager."""
-    with patch('src.trader.api.client.AuthManager') as mock:
-        instance = mock.return_value
-        instance.get_access_token = AsyncMock(return_value='test_token')
-        instance.get_token_info.return_value = {
-            'has_token': True,
-            'is_valid': True
-        }
-        yield instance
+def mock_auth_manager(_patch_client_deps):
+    """Mock authentication manager, reset for each test."""
+    instance = _patch_client_deps.return_value
+    instance.reset_mock()
+    instance.get_access_token = AsyncMock(return_value='test_token')
+    instance.get_token_info.return_value = {
+        'has_token': True,
+        'is_valid': True
+    }
+    return instance
+
+
+@pytest.fixture(scope='module')
+def shared_client(mock_config, _patch_client_deps):
+    """Create one test client for the module."""
+    return GrowwClient(api_key='test_key', secret='test_secret', config=mock_config)
 
 
 @pytest.fixture
-async def client(mock_config, mock_auth_manager):
-    """Create test client."""
-    with patch('src.trader.api.client.get_config', return_value=mock_config):
-        client = GrowwClient(api_key='test_key', secret='test_secret', config=mock_config)
+def client(shared_client, mock_auth_manager):
+    """Test client with its per-test state reset."""
+    shared_client._paper_mode = True
+    shared_client.stats = dict.fromkeys(shared_client.stats, 0)
 
-        # Mock the GrowwAPI
-        client._api = Mock()
-        client._initialized = True
+    # Stub the GrowwAPI; tests needing return values swap in a Mock per method
+    shared_client._api = _api_stub()
+    shared_client._initialized = True
 
-        yield client
+    return shared_client
 
 
 class TestClientInitialization:
     """Test client initialization."""
 
-    def test_client_creation(self, mock_config):
+    def test_client_creation(self):
         """Test client is created with correct defaults."""
-        with patch('src.trader.api.client.get_config', return_value=mock_config):
-            with patch('src.trader.api.client.AuthManager'):
-                client = GrowwClient(api_key='test_key', secret='test_secret')
+        client = GrowwClient(api_key='test_key', secret='test_secret')
 
-                assert client._paper_mode is True
-                assert client._initialized is False
-                assert client.stats['orders_placed'] == 0
+        assert client._paper_mode is True
+        assert client._initialized is False
+        assert client.stats['orders_placed'] == 0
 
-    @pytest.mark.asyncio
     async def test_initialize_success(self, mock_config, mock_auth_manager):
         """Test successful initialization."""
-        with patch('src.trader.api.client.get_config', return_value=mock_config):
-            client = GrowwClient(api_key='test_key', secret='test_secret', config=mock_config)
+        client = GrowwClient(api_key='test_key', secret='test_secret', config=mock_config)
 
-            with patch('src.trader.api.client.GrowwAPI') as mock_api:
-                await client.initialize()
+        with patch('src.trader.api.client.GrowwAPI') as mock_api:
+            await client.initialize()
 
-                assert client._initialized is True
-                mock_auth_manager.get_access_token.assert_called_once()
+            assert client._initialized is True
+            mock_auth_manager.get_access_token.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_initialize_failure(self, mock_config):
+    async def test_initialize_failure(self, mock_config, mock_auth_manager):
         """Test initialization failure."""
-        with patch('src.trader.api.client.get_config', return_value=mock_config):
-            with patch('src.trader.api.client.AuthManager') as mock_auth:
-                instance = mock_auth.return_value
-                instance.get_access_token = AsyncMock(side_effect=Exception("Auth failed"))
+        mock_auth_manager.get_access_token = AsyncMock(side_effect=Exception("Auth failed"))
 
-                client = GrowwClient(api_key='test_key', secret='test_secret', config=mock_config)
+        client = GrowwClient(api_key='test_key', secret='test_secret', config=mock_config)
 
-                with pytest.raises(AuthenticationError):
-                    await client.initialize()
+        with pytest.raises(AuthenticationError):
+            await client.initialize()
 
 
 class TestPaperMode:
     """Test paper trading mode."""
 
-    @pytest.mark.asyncio
     async def test_place_order_paper_mode(self, client):
         """Test order placement in paper mode doesn't hit API."""
         order = await client.place_order(
@@ -133,130 +166,67 @@ class TestPaperMode:
         assert 'PAPER MODE' in order.message
 
         # Verify API was NOT called
-        assert not client._api.place_order.called
+        assert 'place_order' not in client._api.calls
 
         # Verify stats
         assert client.stats['paper_mode_orders'] == 1
 
-    @pytest.mark.asyncio
     async def test_cancel_order_paper_mode(self, client):
         """Test order cancellation in paper mode."""
         result = await client.cancel_order('PAPER_123')
 
         assert result is True
-        assert not client._api.cancel_order.called
+        assert 'cancel_order' not in client._api.calls
 
-    @pytest.mark.asyncio
     async def test_get_positions_paper_mode(self, client):
         """Test getting positions in paper mode returns empty."""
         positions = await client.get_positions()
 
         assert positions == []
-        assert not client._api.get_positions.called
+        assert 'get_positions' not in client._api.calls
 
 
 class TestOrderValidation:
     """Test order validation."""
 
-    @pytest.mark.asyncio
-    async def test_validate_empty_symbol(self, client):
-        """Test empty symbol raises error."""
-        with pytest.raises(InvalidOrderError) as exc_info:
-            await client.place_order(
-                symbol='',
-                exchange='NSE',
-                transaction_type='BUY',
-                quantity=1,
-                order_type='LIMIT',
-                price=100
-            )
-
-        assert 'Symbol cannot be empty' in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_validate_negative_quantity(self, client):
-        """Test negative quantity raises error."""
-        with pytest.raises(InvalidOrderError) as exc_info:
-            await client.place_order(
-                symbol='RELIANCE',
-                exchange='NSE',
-                transaction_type='BUY',
-                quantity=-1,
-                order_type='LIMIT',
-                price=100
-            )
-
-        assert 'positive' in str(exc_info.value).lower()
-
-    @pytest.mark.asyncio
-    async def test_validate_limit_order_without_price(self, client):
-        """Test LIMIT order without price raises error."""
-        with pytest.raises(InvalidOrderError) as exc_info:
-            await client.place_order(
-                symbol='RELIANCE',
-                exchange='NSE',
-                transaction_type='BUY',
-                quantity=1,
-                order_type='LIMIT',
-                price=None
-            )
-
-        assert 'price' in str(exc_info.value).lower()
-
-    @pytest.mark.asyncio
-    async def test_validate_forbidden_segment(self, client):
-        """Test forbidden segment raises error."""
-        with pytest.raises(InvalidOrderError) as exc_info:
-            await client.place_order(
-                symbol='RELIANCE',
-                exchange='NSE',
-                transaction_type='BUY',
-                quantity=1,
-                order_type='LIMIT',
-                price=100,
-                segment='FNO'
-            )
-
-        assert 'forbidden' in str(exc_info.value).lower()
-        assert 'FNO' in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_validate_forbidden_product(self, client):
-        """Test forbidden product raises error."""
-        with pytest.raises(InvalidOrderError) as exc_info:
-            await client.place_order(
-                symbol='RELIANCE',
-                exchange='NSE',
-                transaction_type='BUY',
-                quantity=1,
-                order_type='LIMIT',
-                price=100,
-                product='MIS'
-            )
-
-        assert 'forbidden' in str(exc_info.value).lower()
-        assert 'MIS' in str(exc_info.value)
+    @pytest.mark.parametrize('overrides,needle,exact', [
+        ({'symbol': ''}, 'symbol cannot be empty', 'Symbol cannot be empty'),
+        ({'quantity': -1}, 'positive', None),
+        ({'price': None}, 'price', None),
+        ({'segment': 'FNO'}, 'forbidden', 'FNO'),
+        ({'product': 'MIS'}, 'forbidden', 'MIS'),
+        ({'quantity': 100, 'price': 500}, 'hard limit', None),  # 50000 > 10000 limit
+    ], ids=[
+        'empty_symbol',
+        'negative_quantity',
+        'limit_order_without_price',
+        'forbidden_segment',
+        'forbidden_product',
+        'exceeds_hard_limit',
+    ])
+    async def test_validate_rejects(self, client, overrides, needle, exact):
+        """Test invalid orders raise InvalidOrderError with a clear message."""
+        kwargs = {
+            'symbol': 'RELIANCE',
+            'exchange': 'NSE',
+            'transaction_type': 'BUY',
+            'quantity': 1,
+            'order_type': 'LIMIT',
+            'price': 100
+        }
+        kwargs.update(overrides)
 
-    @pytest.mark.asyncio
-    async def test_validate_exceeds_hard_limit(self, client):
-        """Test order exceeding hard limit raises error."""
         with pytest.raises(InvalidOrderError) as exc_info:
-            await client.place_order(
-                symbol='RELIANCE',
-                exchange='NSE',
-                transaction_type='BUY',
-                quantity=100,
-                order_type='LIMIT',
-                price=500  # 100 * 500 = 50000 > 10000 limit
-            )
+            await client.place_order(**kwargs)
 
-        assert 'hard limit' in str(exc_info.value).lower()
+        assert needle in str(exc_info.value).lower()
+        if exact:
+            assert exact in str(exc_info.value)
 
 
 class TestRateLimiting:
     """Test rate limiting."""
 
-    @pytest.mark.asyncio
     async def test_rate_limiter_applied(self, client, mock_config):
         """Test rate limiter is applied to API calls."""
         # Disable paper mode for this test
@@ -291,7 +261,6 @@ class TestRateLimiting:
 class TestMarketData:
     """Test market data methods."""
 
-    @pytest.mark.asyncio
     async def test_get_quote(self, client):
         """Test getting quote."""
         # Mock API response
@@ -311,7 +280,6 @@ class TestMarketData:
         assert quote.ltp == 2500.50
         assert client.stats['quotes_fetched'] == 1
 
-    @pytest.mark.asyncio
     async def test_get_ltp(self, client):
         """Test getting LTP."""
         client._api.get_ltp = Mock(return_value={'ltp': 2500.50})
@@ -324,18 +292,16 @@ class TestMarketData:
 class TestErrorHandling:
     """Test error handling."""
 
-    @pytest.mark.asyncio
     async def test_retry_on_failure(self, client):
         """Test API call retries on failure."""
         # Disable paper mode
         client._paper_mode = False
 
         # Mock API to fail twice then succeed
-        call_count = [0]
+        calls = itertools.count(1)
 
         def mock_place_order(**kwargs):
-            call_count[0] += 1
-            if call_count[0] < 3:
+            if next(calls) < 3:
                 raise Exception("Temporary error")
             return {
                 'order_id': 'TEST123',
@@ -360,9 +326,8 @@ class TestErrorHandling:
         )
 
         assert order.order_id == 'TEST123'
-        assert call_count[0] == 3  # Failed twice, succeeded third time
+        assert next(calls) == 4  # Failed twice, succeeded third time
 
-    @pytest.mark.asyncio
     async def test_no_retry_on_invalid_order(self, client):
         """Test no retry on InvalidOrderError."""
         # Should immediately raise without retrying
@@ -380,7 +345,6 @@ class TestErrorHandling:
 class TestClientStats:
     """Test client statistics."""
 
-    @pytest.mark.asyncio
     async def test_get_stats(self, client):
         """Test getting client stats."""
         # Place a paper mode order
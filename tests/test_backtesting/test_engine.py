@@ -3,32 +3,47 @@ Tests for Backtesting Engine.
 """
 
 import pytest
+import statistics
+from unittest.mock import patch
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 
+from src.trader.api.models import OHLC
 from src.trader.backtesting.engine import BacktestEngine, OrderSide
+from src.trader.strategies.base import BaseStrategy
 from src.trader.strategies.momentum import MomentumStrategy
 from src.trader.strategies.mean_reversion import MeanReversionStrategy
+from src.trader.strategies.indicators import rolling_mean, rolling_std
+from src.trader.strategies._kernels import bband_step
 
 
-@pytest.fixture
-def sample_data():
-    """Create sample OHLC data for testing."""
-    dates = pd.date_range(start='2024-01-01', periods=100, freq='D')
-    data = pd.DataFrame({
-        'timestamp': dates,
-        'open': [100 + i * 0.5 for i in range(100)],
-        'high': [102 + i * 0.5 for i in range(100)],
-        'low': [98 + i * 0.5 for i in range(100)],
-        'close': [100 + i * 0.5 for i in range(100)],
-        'volume': [1000000] * 100
-    })
-    return data
+# Sample OHLC columns, built once at import and made read-only
+_DATES = pd.date_range(start='2024-01-01', periods=100, freq='D')
+_CLOSE = 100.0 + 0.5 * np.arange(100, dtype=np.float64)
+_HIGH = _CLOSE + 2.0
+_LOW = _CLOSE - 2.0
+_VOLUME = np.full(100, 1000000, dtype=np.int64)
+for _column in (_CLOSE, _HIGH, _LOW, _VOLUME):
+    _column.flags.writeable = False
 
 
-@pytest.fixture
-def engine():
-    """Create a backtesting engine."""
+@pytest.fixture(scope="module")
+def sample_data():
+    """Create sample OHLC data for testing (shared; tests copy before changing it)."""
+    return pd.DataFrame({
+        'timestamp': _DATES,
+        'open': pd.Series(_CLOSE, copy=False),
+        'high': pd.Series(_HIGH, copy=False),
+        'low': pd.Series(_LOW, copy=False),
+        'close': pd.Series(_CLOSE, copy=False),
+        'volume': pd.Series(_VOLUME, copy=False)
+    }, copy=False)
+
+
+@pytest.fixture(scope="module")
+def shared_engine():
+    """Create one backtesting engine for the module."""
     return BacktestEngine(
         initial_capital=100000,
         commission=0.0003,
@@ -36,6 +51,13 @@ def engine():
     )
 
 
+@pytest.fixture
+def engine(shared_engine):
+    """Backtesting engine with its state reset for each test."""
+    shared_engine._reset()
+    return shared_engine
+
+
 def test_engine_initialization(engine):
     """Test engine initializes correctly."""
     assert engine.initial_capital == 100000
@@ -122,11 +144,8 @@ def test_mean_reversion_strategy(engine, sample_data):
     """Test mean reversion strategy on sample data."""
     # Create data with some volatility
     volatile_data = sample_data.copy()
-    for i in range(len(volatile_data)):
-        if i % 10 < 5:
-            volatile_data.loc[i, 'close'] = 100 + (i % 10) * 2
-        else:
-            volatile_data.loc[i, 'close'] = 100 - (i % 10) * 2
+    phase = np.arange(len(volatile_data)) % 10
+    volatile_data['close'] = np.where(phase < 5, 100 + phase * 2, 100 - phase * 2).astype(float)
 
     strategy = MeanReversionStrategy(period=20, num_std=2.0, position_size=1)
 
@@ -156,17 +175,25 @@ def test_commission_and_slippage(engine):
     assert engine.cash == pytest.approx(100000 - expected_total, rel=1e-6)
 
 
-def test_equity_curve(engine, sample_data):
-    """Test equity curve generation."""
-    strategy = MomentumStrategy(fast_period=5, slow_period=10)
-
-    engine.run_backtest(
-        strategy=strategy,
+@pytest.fixture(scope="module")
+def momentum_backtest(sample_data):
+    """Run the default momentum backtest once and share its results."""
+    engine = BacktestEngine(
+        initial_capital=100000,
+        commission=0.0003,
+        slippage=0.0001
+    )
+    metrics = engine.run_backtest(
+        strategy=MomentumStrategy(fast_period=5, slow_period=10),
         data=sample_data,
         symbol="TESTSTOCK"
     )
+    return metrics, engine.get_equity_curve_df(), engine.get_trades_df()
 
-    equity_df = engine.get_equity_curve_df()
+
+def test_equity_curve(momentum_backtest):
+    """Test equity curve generation."""
+    _, equity_df, _ = momentum_backtest
 
     assert len(equity_df) > 0
     assert 'timestamp' in equity_df.columns
@@ -174,17 +201,9 @@ def test_equity_curve(engine, sample_data):
     assert 'cash' in equity_df.columns
 
 
-def test_trades_dataframe(engine, sample_data):
+def test_trades_dataframe(momentum_backtest):
     """Test trades DataFrame generation."""
-    strategy = MomentumStrategy(fast_period=5, slow_period=10)
-
-    engine.run_backtest(
-        strategy=strategy,
-        data=sample_data,
-        symbol="TESTSTOCK"
-    )
-
-    trades_df = engine.get_trades_df()
+    _, _, trades_df = momentum_backtest
 
     assert 'entry_time' in trades_df.columns
     assert 'exit_time' in trades_df.columns
@@ -195,11 +214,8 @@ def test_max_drawdown_calculation(engine, sample_data):
     """Test max drawdown calculation."""
     # Create declining price data
     declining_data = sample_data.copy()
-    for i in range(len(declining_data)):
-        if i < 50:
-            declining_data.loc[i, 'close'] = 150 - i
-        else:
-            declining_data.loc[i, 'close'] = 100 + (i - 50) * 0.5
+    i = np.arange(len(declining_data))
+    declining_data['close'] = np.where(i < 50, 150 - i, 100 + (i - 50) * 0.5)
 
     strategy = MomentumStrategy(fast_period=5, slow_period=10)
 
@@ -213,15 +229,9 @@ def test_max_drawdown_calculation(engine, sample_data):
     assert metrics.max_drawdown >= 0
 
 
-def test_metrics_calculation(engine, sample_data):
+def test_metrics_calculation(momentum_backtest):
     """Test all metrics are calculated correctly."""
-    strategy = MomentumStrategy(fast_period=5, slow_period=10)
-
-    metrics = engine.run_backtest(
-        strategy=strategy,
-        data=sample_data,
-        symbol="TESTSTOCK"
-    )
+    metrics, _, _ = momentum_backtest
 
     # Check all metrics exist
     assert hasattr(metrics, 'total_trades')
@@ -239,3 +249,181 @@ def test_metrics_calculation(engine, sample_data):
 
     # Winning + losing trades should equal total trades
     assert metrics.winning_trades + metrics.losing_trades == metrics.total_trades
+
+
+def test_momentum_running_sma(engine):
+    """Test running SMAs match SMAs recomputed over the price window."""
+    strategy = MomentumStrategy(fast_period=5, slow_period=10)
+    strategy.initialize(engine)
+
+    closes = [100 + i * 0.7 + (i % 4) * 0.3 for i in range(40)]
+    for close in closes:
+        strategy.on_data(OHLC(
+            symbol="TESTSTOCK", exchange="NSE",
+            open=close, high=close, low=close, close=close
+        ))
+
+    assert strategy.prev_fast_sma == pytest.approx(sum(closes[-5:]) / 5)
+    assert strategy.prev_slow_sma == pytest.approx(sum(closes[-10:]) / 10)
+
+
+def test_mean_reversion_running_bands(engine):
+    """Test running mean and std dev match statistics over the price window."""
+    strategy = MeanReversionStrategy(period=20, num_std=2.0)
+    strategy.initialize(engine)
+
+    closes = [100 + i * 0.5 + (i % 3) for i in range(60)]
+    for close in closes:
+        strategy.on_data(OHLC(
+            symbol="TESTSTOCK", exchange="NSE",
+            open=close, high=close, low=close, close=close
+        ))
+
+    window = closes[-20:]
+    variance = strategy._m2 / (strategy.period - 1)
+
+    assert strategy._mean == pytest.approx(statistics.mean(window))
+    assert variance == pytest.approx(statistics.variance(window))
+
+
+def test_mean_reversion_bands_stable_for_large_prices(engine):
+    """Test the running variance stays accurate when prices dwarf their spread."""
+    strategy = MeanReversionStrategy(period=20, num_std=2.0)
+    strategy.initialize(engine)
+
+    closes = [1e8 + (i % 5) * 0.01 for i in range(200)]
+    for close in closes:
+        strategy.on_data(OHLC(
+            symbol="TESTSTOCK", exchange="NSE",
+            open=close, high=close, low=close, close=close
+        ))
+
+    variance = strategy._m2 / (strategy.period - 1)
+    assert variance == pytest.approx(statistics.variance(closes[-20:]), rel=1e-3)
+
+
+def test_rolling_indicators(sample_data):
+    """Test vectorized rolling indicators match pandas rolling windows."""
+    close = sample_data['close'].to_numpy(dtype=float)
+
+    np.testing.assert_allclose(
+        rolling_mean(close, 10), sample_data['close'].rolling(10).mean().to_numpy()
+    )
+    np.testing.assert_allclose(
+        rolling_std(close, 10), sample_data['close'].rolling(10).std().to_numpy()
+    )
+    assert np.isnan(rolling_mean(close[:5], 10)).all()
+
+
+def test_momentum_precomputed_matches_on_data(engine):
+    """Test precomputed SMAs drive the same state as bar-by-bar updates."""
+    closes = [100 + i * 0.7 + (i % 4) * 0.3 for i in range(40)]
+    bars = [
+        OHLC(symbol="TESTSTOCK", exchange="NSE", open=c, high=c, low=c, close=c)
+        for c in closes
+    ]
+
+    streaming = MomentumStrategy(fast_period=5, slow_period=10)
+    streaming.initialize(engine)
+    for bar in bars:
+        streaming.on_data(bar)
+
+    batched = MomentumStrategy(fast_period=5, slow_period=10)
+    batched.initialize(engine)
+    batched.precompute(np.array(closes))
+    for index, bar in enumerate(bars):
+        batched.on_bar(index, bar)
+
+    assert batched.prev_fast_sma == pytest.approx(streaming.prev_fast_sma)
+    assert batched.prev_slow_sma == pytest.approx(streaming.prev_slow_sma)
+
+
+def test_bband_step_matches_statistics():
+    """Test the Bollinger Band kernel against statistics over the window."""
+    closes = [100 + i * 0.5 + (i % 3) for i in range(30)]
+    period, num_std = 20, 2.0
+    mean = m2 = 0.0
+
+    for i, close in enumerate(closes):
+        count = min(i, period)
+        old = closes[i - period] if i >= period else 0.0
+        mean, m2, middle, upper, lower = bband_step(close, old, count, mean, m2, period, num_std)
+
+    window = closes[-period:]
+    std_dev = statistics.stdev(window)
+
+    assert middle == pytest.approx(statistics.mean(window))
+    assert upper == pytest.approx(middle + num_std * std_dev)
+    assert lower == pytest.approx(middle - num_std * std_dev)
+
+
+def test_strategy_data_history_bounded(engine, sample_data):
+    """Test strategy data history keeps only the most recent bars."""
+    class RecordingStrategy(BaseStrategy):
+        def on_data(self, data):
+            self.data_history.append(data)
+
+    strategy = RecordingStrategy(history_size=5)
+    engine.run_backtest(strategy=strategy, data=sample_data, symbol="TESTSTOCK")
+
+    assert len(strategy.data_history) == 5
+    assert strategy.data_history[-1].close == sample_data['close'].iloc[-1]
+
+    strategy.initialize(engine)
+    assert len(strategy.data_history) == 0
+
+
+def test_momentum_on_batch_crossovers():
+    """Test batch crossover detection matches a bar-by-bar scan."""
+    closes = [100 + 10 * np.sin(i / 4) for i in range(80)]
+    bars = [
+        OHLC(symbol="TESTSTOCK", exchange="NSE", open=c, high=c, low=c, close=c)
+        for c in closes
+    ]
+    strategy = MomentumStrategy(fast_period=3, slow_period=8)
+
+    signals = strategy.on_batch(bars)
+
+    expected_bullish, expected_bearish = [], []
+    for i in range(8, len(closes)):
+        prev_fast = sum(closes[i - 3:i]) / 3
+        prev_slow = sum(closes[i - 8:i]) / 8
+        fast = sum(closes[i - 2:i + 1]) / 3
+        slow = sum(closes[i - 7:i + 1]) / 8
+        if prev_fast <= prev_slow and fast > slow:
+            expected_bullish.append(i)
+        elif prev_fast >= prev_slow and fast < slow:
+            expected_bearish.append(i)
+
+    assert expected_bullish and expected_bearish
+    assert signals['bullish_index'].tolist() == expected_bullish
+    assert signals['bearish_index'].tolist() == expected_bearish
+    assert signals['bullish_price'].tolist() == [closes[i] for i in expected_bullish]
+
+
+def test_strategy_position_lookup_bound_to_engine(engine):
+    """Test position lookups go to the engine once the strategy is initialized."""
+    strategy = MomentumStrategy(fast_period=5, slow_period=10)
+    assert strategy.get_position("TESTSTOCK") == 0
+
+    strategy.initialize(engine)
+    engine.buy("TESTSTOCK", 10, 100.0, datetime.now())
+
+    assert strategy.get_position("TESTSTOCK") == 10
+    assert strategy.has_position("TESTSTOCK") is True
+    assert strategy.has_position("OTHER") is False
+
+
+def test_strategy_log_skipped_when_info_disabled(engine):
+    """Test strategy log messages are not built when INFO is disabled."""
+    strategy = MomentumStrategy(fast_period=5, slow_period=10)
+    strategy.initialize(engine)
+    strategy._info_on = False
+
+    with patch("src.trader.strategies.base.logger") as mock_logger:
+        strategy.log("signal")
+        mock_logger.info.assert_not_called()
+
+        strategy._info_on = True
+        strategy.log("signal")
+        mock_logger.info.assert_called_once_with("Momentum(5,10): signal")
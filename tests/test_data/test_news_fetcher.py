@@ -4,10 +4,34 @@ Tests for News Fetcher.
 
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 from src.trader.data.news_fetcher import NewsFetcher, NewsArticle
 
+# Reference time for article timestamps, read once for the whole module
+NOW = datetime.now()
+
+# Entries served by the stubbed feedparser.parse, keyed by feed URL
+_FEED_ENTRIES = {}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _stub_feedparser():
+    """Serve feedparser.parse from _FEED_ENTRIES for the whole module."""
+    def parse(url, **kwargs):
+        return SimpleNamespace(entries=_FEED_ENTRIES.get(url, []))
+
+    with patch('feedparser.parse', parse):
+        yield
+
+
+@pytest.fixture
+def feed_entries():
+    """Feed entries by URL for the stubbed parser, emptied after each test."""
+    yield _FEED_ENTRIES
+    _FEED_ENTRIES.clear()
+
 
 @pytest.fixture
 def news_fetcher():
@@ -15,15 +39,20 @@ def news_fetcher():
     return NewsFetcher(cache_duration_minutes=15)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def stateless_fetcher():
+    """Shared news fetcher for tests that don't touch its cache."""
+    return NewsFetcher()
+
+
+@pytest.fixture(scope="module")
 def sample_articles():
     """Create sample news articles."""
-    now = datetime.now()
     return [
         NewsArticle(
             title="Reliance Industries Q4 results beat expectations",
             link="https://example.com/1",
-            published=now - timedelta(hours=1),
+            published=NOW - timedelta(hours=1),
             summary="Reliance Industries reported strong Q4 results...",
             source="MoneyControl",
             symbols=["RELIANCE"]
@@ -31,7 +60,7 @@ def sample_articles():
         NewsArticle(
             title="TCS announces share buyback",
             link="https://example.com/2",
-            published=now - timedelta(hours=2),
+            published=NOW - timedelta(hours=2),
             summary="Tata Consultancy Services announces buyback...",
             source="Economic Times",
             symbols=["TCS"]
@@ -39,7 +68,7 @@ def sample_articles():
         NewsArticle(
             title="Indian markets reach new high",
             link="https://example.com/3",
-            published=now - timedelta(hours=3),
+            published=NOW - timedelta(hours=3),
             summary="Indian equity markets touched new highs...",
             source="LiveMint",
             symbols=[]
@@ -70,9 +99,9 @@ def test_add_custom_source(news_fetcher):
     assert "CustomSource" in sources
 
 
-def test_extract_symbols():
+def test_extract_symbols(stateless_fetcher):
     """Test symbol extraction from text."""
-    fetcher = NewsFetcher()
+    fetcher = stateless_fetcher
 
     text = "RELIANCE reported strong results. TCS and INFY also performed well."
     symbols = fetcher._extract_symbols(text)
@@ -82,9 +111,19 @@ def test_extract_symbols():
     assert "INFY" in symbols
 
 
-def test_article_mentions_symbol(sample_articles):
+def test_patterns_compiled_once(news_fetcher, stateless_fetcher):
+    """Test the tag and symbol patterns are shared class-level constants."""
+    assert news_fetcher._TAG_RE is NewsFetcher._TAG_RE
+    assert stateless_fetcher._SYMBOL_RE is NewsFetcher._SYMBOL_RE
+
+    # Whole words only, reported in COMMON_SYMBOLS order without duplicates
+    symbols = stateless_fetcher._extract_symbols("hdfcbank, TCS and tcs; RELIANCEX ltd LT.")
+    assert symbols == ["TCS", "HDFCBANK", "LT"]
+
+
+def test_article_mentions_symbol(stateless_fetcher, sample_articles):
     """Test checking if article mentions a symbol."""
-    fetcher = NewsFetcher()
+    fetcher = stateless_fetcher
 
     article = sample_articles[0]
     assert fetcher._article_mentions_symbol(article, "RELIANCE") is True
@@ -121,20 +160,16 @@ def test_cache_validation(news_fetcher, sample_articles):
     assert news_fetcher._is_cache_valid(source) is False
 
 
-@patch('feedparser.parse')
-def test_fetch_from_source(mock_parse, news_fetcher):
+def test_fetch_from_source(news_fetcher, feed_entries):
     """Test fetching from a specific source."""
-    # Mock feedparser response
-    mock_parse.return_value = Mock(
-        entries=[
-            {
-                'title': 'Test Article',
-                'link': 'https://example.com/test',
-                'summary': 'Test summary with RELIANCE mentioned',
-                'published_parsed': None
-            }
-        ]
-    )
+    feed_entries[NewsFetcher.RSS_FEEDS["MoneyControl"]] = [
+        {
+            'title': 'Test Article',
+            'link': 'https://example.com/test',
+            'summary': 'Test summary with RELIANCE mentioned',
+            'published_parsed': None
+        }
+    ]
 
     articles = news_fetcher._fetch_from_source("MoneyControl")
 
@@ -143,9 +178,9 @@ def test_fetch_from_source(mock_parse, news_fetcher):
     assert articles[0].source == "MoneyControl"
 
 
-def test_parse_published_date():
+def test_parse_published_date(stateless_fetcher):
     """Test date parsing from feed entry."""
-    fetcher = NewsFetcher()
+    fetcher = stateless_fetcher
 
     # Entry with no date
     entry = {}
@@ -154,26 +189,24 @@ def test_parse_published_date():
 
     # Entry with published_parsed
     import time
-    now = datetime.now()
     entry_with_date = {
-        'published_parsed': time.struct_time(now.timetuple())
+        'published_parsed': time.struct_time(NOW.timetuple())
     }
     parsed_date = fetcher._parse_published_date(entry_with_date)
     assert isinstance(parsed_date, datetime)
 
 
-def test_news_summary_structure():
+def test_news_summary_structure(stateless_fetcher):
     """Test news summary structure."""
-    fetcher = NewsFetcher()
+    fetcher = stateless_fetcher
 
     # Mock fetch_latest_news to return sample data
     with patch.object(fetcher, 'fetch_latest_news') as mock_fetch:
-        now = datetime.now()
         mock_fetch.return_value = [
             NewsArticle(
                 title="Test 1",
                 link="http://example.com/1",
-                published=now,
+                published=NOW,
                 summary="Test",
                 source="Source1",
                 symbols=["RELIANCE", "TCS"]
@@ -181,7 +214,7 @@ def test_news_summary_structure():
             NewsArticle(
                 title="Test 2",
                 link="http://example.com/2",
-                published=now - timedelta(hours=1),
+                published=NOW - timedelta(hours=1),
                 summary="Test",
                 source="Source2",
                 symbols=["RELIANCE"]
@@ -202,17 +235,16 @@ def test_news_summary_structure():
         assert 'mentions' in top_symbol
 
 
-def test_fetch_news_for_symbol():
+def test_fetch_news_for_symbol(stateless_fetcher):
     """Test fetching news for specific symbol."""
-    fetcher = NewsFetcher()
+    fetcher = stateless_fetcher
 
     with patch.object(fetcher, 'fetch_latest_news') as mock_fetch:
-        now = datetime.now()
         mock_fetch.return_value = [
             NewsArticle(
                 title="Reliance results",
                 link="http://example.com/1",
-                published=now,
+                published=NOW,
                 summary="RELIANCE reported strong results",
                 source="Source1",
                 symbols=["RELIANCE"]
@@ -220,7 +252,7 @@ def test_fetch_news_for_symbol():
             NewsArticle(
                 title="TCS buyback",
                 link="http://example.com/2",
-                published=now,
+                published=NOW,
                 summary="TCS announces buyback",
                 source="Source2",
                 symbols=["TCS"]
@@ -233,24 +265,21 @@ def test_fetch_news_for_symbol():
         assert all("RELIANCE" in article.symbols for article in reliance_news)
 
 
-def test_html_tag_removal():
+def test_html_tag_removal(stateless_fetcher, feed_entries):
     """Test HTML tag removal from summary."""
-    fetcher = NewsFetcher()
-
-    with patch('feedparser.parse') as mock_parse:
-        mock_parse.return_value = Mock(
-            entries=[
-                {
-                    'title': 'Test',
-                    'link': 'http://example.com',
-                    'summary': '<p>This is a <strong>test</strong> summary</p>',
-                    'published_parsed': None
-                }
-            ]
-        )
+    fetcher = stateless_fetcher
+
+    feed_entries[NewsFetcher.RSS_FEEDS["MoneyControl"]] = [
+        {
+            'title': 'Test',
+            'link': 'http://example.com',
+            'summary': '<p>This is a <strong>test</strong> summary</p>',
+            'published_parsed': None
+        }
+    ]
 
-        articles = fetcher._fetch_from_source("TestSource")
-        assert len(articles) > 0
-        # HTML tags should be removed
-        assert '<' not in articles[0].summary
-        assert '>' not in articles[0].summary
+    articles = fetcher._fetch_from_source("MoneyControl")
+    assert len(articles) > 0
+    # HTML tags should be removed
+    assert '<' not in articles[0].summary
+    assert '>' not in articles[0].summary
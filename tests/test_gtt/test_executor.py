@@ -16,12 +16,26 @@ from src.trader.gtt.executor import GTTExecutor
 from src.trader.api.models import GTTOrder, GTTStatus, Order
 from src.trader.api.exceptions import GTTExecutionError, KillSwitchActive, OrderError
 
+# All tests in this module share one event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest.fixture
-def mock_groww_client():
-    """Mock Groww client."""
-    client = Mock()
-    client.place_order = AsyncMock(return_value=Order(
+
+class _Contains(str):
+    """Mock argument matcher: equal to any string containing this one."""
+
+    def __eq__(self, other):
+        return isinstance(other, str) and str(self) in other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = str.__hash__
+
+
+@pytest.fixture(scope="module")
+def placed_order():
+    """Order returned by the mocked client (built once, never modified)."""
+    return Order(
         order_id="TEST123",
         symbol="RELIANCE",
         exchange="NSE",
@@ -29,7 +43,14 @@ def mock_groww_client():
         transaction_type="BUY",
         order_type="LIMIT",
         price=2490.0
-    ))
+    )
+
+
+@pytest.fixture
+def mock_groww_client(placed_order):
+    """Mock Groww client."""
+    client = Mock()
+    client.place_order = AsyncMock(return_value=placed_order)
     client.get_ltp = AsyncMock(return_value=2495.0)
     return client
 
@@ -64,9 +85,9 @@ def executor(mock_groww_client, mock_storage, mock_risk_manager):
     return GTTExecutor(mock_groww_client, mock_storage, mock_risk_manager)
 
 
-@pytest.fixture
-def sample_gtt():
-    """Create sample GTT order."""
+@pytest.fixture(scope="module")
+def gtt_template():
+    """Sample GTT order, validated once per module."""
     return GTTOrder(
         id=1,
         symbol="RELIANCE",
@@ -81,10 +102,15 @@ def sample_gtt():
     )
 
 
+@pytest.fixture
+def sample_gtt(gtt_template):
+    """Create sample GTT order (a copy tests may modify)."""
+    return gtt_template.model_copy()
+
+
 class TestGTTExecution:
     """Test GTT execution."""
 
-    @pytest.mark.asyncio
     async def test_execute_successful(self, executor, sample_gtt, mock_risk_manager, mock_storage):
         """Test successful GTT execution."""
         # Setup validation to pass
@@ -100,7 +126,6 @@ class TestGTTExecution:
         # Verify storage updated
         mock_storage.update_gtt_status.assert_called()
 
-    @pytest.mark.asyncio
     async def test_execute_with_market_order(self, executor, mock_risk_manager, mock_storage, mock_groww_client):
         """Test executing MARKET order GTT."""
         from src.trader.risk.manager import OrderValidation
@@ -129,7 +154,6 @@ class TestGTTExecution:
 class TestKillSwitchIntegration:
     """Test kill switch integration."""
 
-    @pytest.mark.asyncio
     async def test_kill_switch_blocks_execution(self, executor, sample_gtt, mock_risk_manager, mock_storage):
         """Test kill switch blocks execution."""
         # Setup kill switch to raise
@@ -147,7 +171,7 @@ class TestKillSwitchIntegration:
         mock_storage.update_gtt_status.assert_called_with(
             sample_gtt.id,
             GTTStatus.FAILED.value,
-            error_message=pytest.approx("Kill switch active", rel=1e-1),
+            error_message=_Contains("Kill switch active"),
             trigger_ltp=2495.0
         )
 
@@ -155,7 +179,6 @@ class TestKillSwitchIntegration:
 class TestRiskValidation:
     """Test risk validation integration."""
 
-    @pytest.mark.asyncio
     async def test_risk_validation_rejection(self, executor, sample_gtt, mock_risk_manager, mock_storage):
         """Test risk validation rejection."""
         from src.trader.risk.manager import OrderValidation
@@ -176,7 +199,7 @@ class TestRiskValidation:
         mock_storage.update_gtt_status.assert_called_with(
             sample_gtt.id,
             GTTStatus.FAILED.value,
-            error_message=pytest.approx("Risk validation failed: Daily loss limit exceeded", rel=1e-1),
+            error_message=_Contains("Risk validation failed: Daily loss limit exceeded"),
             trigger_ltp=2495.0
         )
 
@@ -184,7 +207,6 @@ class TestRiskValidation:
 class TestErrorHandling:
     """Test error handling."""
 
-    @pytest.mark.asyncio
     async def test_order_placement_failure(self, executor, sample_gtt, mock_risk_manager, mock_storage, mock_groww_client):
         """Test handling order placement failure."""
         from src.trader.risk.manager import OrderValidation
@@ -198,7 +220,6 @@ class TestErrorHandling:
 
         assert executor.stats['executions_failed'] == 1
 
-    @pytest.mark.asyncio
     async def test_unexpected_error(self, executor, sample_gtt, mock_risk_manager, mock_storage):
         """Test handling unexpected error."""
         from src.trader.risk.manager import OrderValidation
@@ -214,7 +235,6 @@ class TestErrorHandling:
 class TestRetry:
     """Test retry functionality."""
 
-    @pytest.mark.asyncio
     async def test_retry_failed_gtt(self, executor, mock_storage, mock_groww_client, mock_risk_manager):
         """Test retrying failed GTT."""
         from src.trader.risk.manager import OrderValidation
@@ -244,7 +264,6 @@ class TestRetry:
         assert order is not None
         assert order.order_id == "TEST123"
 
-    @pytest.mark.asyncio
     async def test_retry_non_failed_gtt_fails(self, executor, mock_storage):
         """Test retrying non-FAILED GTT fails."""
         active_gtt = GTTOrder(
@@ -271,7 +290,6 @@ class TestRetry:
 class TestStatistics:
     """Test statistics tracking."""
 
-    @pytest.mark.asyncio
     async def test_stats_tracking(self, executor, sample_gtt, mock_risk_manager):
         """Test statistics are tracked."""
         from src.trader.risk.manager import OrderValidation
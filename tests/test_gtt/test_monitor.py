@@ -11,6 +11,7 @@ Tests cover:
 
 import pytest
 import asyncio
+import itertools
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime, time
 
@@ -18,30 +19,70 @@ from src.trader.gtt.monitor import GTTMonitor
 from src.trader.api.models import GTTOrder, GTTStatus
 
 
-@pytest.fixture
-def mock_groww_client():
-    """Mock Groww client."""
+def _grouped_from(storage):
+    """Group whatever the test put in get_active_gtts, like the SQL query does."""
+    async def get_active_gtts_grouped():
+        grouped = {}
+        for gtt in storage.get_active_gtts.return_value:
+            grouped.setdefault(f"{gtt.symbol}:{gtt.exchange}", []).append(gtt.model_dump())
+        return grouped
+
+    return get_active_gtts_grouped
+
+
+@pytest.fixture(scope="module")
+def shared_groww_client():
+    """Mock Groww client, shared across the module."""
     client = Mock()
-    client.get_ltp = AsyncMock(return_value=2495.0)
+    client.get_ltp = AsyncMock()
     return client
 
 
 @pytest.fixture
-def mock_storage():
-    """Mock GTT storage."""
+def mock_groww_client(shared_groww_client):
+    """Mock Groww client with its per-test state reset."""
+    shared_groww_client.reset_mock(return_value=True, side_effect=True)
+    shared_groww_client.get_ltp.return_value = 2495.0
+    return shared_groww_client
+
+
+@pytest.fixture(scope="module")
+def shared_storage():
+    """Mock GTT storage, shared across the module."""
     storage = Mock()
-    storage.get_active_gtts = AsyncMock(return_value=[])
+    storage.get_active_gtts = AsyncMock()
+    storage.get_active_gtts_grouped = AsyncMock()
+    storage.get_generation = AsyncMock()
     return storage
 
 
 @pytest.fixture
-def mock_executor():
-    """Mock GTT executor."""
+def mock_storage(shared_storage):
+    """Mock GTT storage with its per-test state reset."""
+    shared_storage.reset_mock(return_value=True, side_effect=True)
+    shared_storage.get_active_gtts.return_value = []
+    shared_storage.get_active_gtts_grouped.side_effect = _grouped_from(shared_storage)
+
+    # A new generation on every call, so each check reloads the active set
+    shared_storage.get_generation.side_effect = itertools.count()
+    return shared_storage
+
+
+@pytest.fixture(scope="module")
+def shared_executor():
+    """Mock GTT executor, shared across the module."""
     executor = Mock()
     executor.execute_gtt = AsyncMock()
     return executor
 
 
+@pytest.fixture
+def mock_executor(shared_executor):
+    """Mock GTT executor with its per-test state reset."""
+    shared_executor.reset_mock(return_value=True, side_effect=True)
+    return shared_executor
+
+
 @pytest.fixture
 def monitor(mock_groww_client, mock_storage, mock_executor):
     """Create test monitor."""
@@ -132,6 +173,30 @@ class TestMonitorLifecycle:
 
         await monitor.stop()
 
+    @pytest.mark.asyncio
+    async def test_loop_sleep_excludes_check_time(self, monitor):
+        """Test the loop waits out the rest of the interval, not a full interval."""
+        import time as time_module
+
+        async def slow_check():
+            time_module.sleep(0.3)  # Blocking, so loop time advances
+
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+            monitor._running = False
+
+        monitor._running = True
+        with patch.object(monitor, '_check_gtts', side_effect=slow_check), \
+                patch.object(monitor, '_is_trading_hours', return_value=True), \
+                patch('src.trader.gtt.monitor.asyncio.sleep', side_effect=fake_sleep):
+            await monitor._monitor_loop()
+
+        # check_interval is 1s and the check took ~0.3s
+        assert len(delays) == 1
+        assert 0.5 < delays[0] < 0.8
+
 
 class TestTriggerDetection:
     """Test trigger condition detection."""
@@ -238,6 +303,140 @@ class TestGTTChecking:
         # Should trigger only gtt2
         assert mock_executor.execute_gtt.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_executions_overlap_across_symbols_only(self, monitor, mock_storage, mock_groww_client, mock_executor):
+        """Test triggered GTTs execute concurrently across symbols, in order within one."""
+        gtts = [
+            GTTOrder(
+                id=i,
+                symbol=symbol,
+                exchange="NSE",
+                trigger_price=2500.0,
+                order_type="MARKET",
+                action="BUY",
+                quantity=1,
+                status=GTTStatus.ACTIVE.value,
+                created_at=datetime.now()
+            )
+            for i, symbol in enumerate(["RELIANCE", "RELIANCE", "TCS"], 1)
+        ]
+        mock_storage.get_active_gtts.return_value = gtts
+        mock_groww_client.get_ltp.return_value = 2490.0
+
+        events = []
+
+        async def execute_gtt(gtt, ltp):
+            events.append(("start", gtt.id))
+            await asyncio.sleep(0.01)
+            events.append(("end", gtt.id))
+
+        mock_executor.execute_gtt.side_effect = execute_gtt
+
+        await monitor._check_gtts()
+
+        assert monitor.stats['gtts_triggered'] == 3
+        # TCS starts before the first RELIANCE finishes...
+        assert events.index(("start", 3)) < events.index(("end", 1))
+        # ...but the second RELIANCE waits for the first
+        assert events.index(("end", 1)) < events.index(("start", 2))
+
+    @pytest.mark.asyncio
+    async def test_large_active_set_evaluated_off_loop(self, monitor, mock_storage, mock_groww_client, mock_executor):
+        """Test large active sets are evaluated in a worker thread with the same result."""
+        from src.trader.gtt import monitor as monitor_module
+
+        count = monitor_module._OFFLOAD_MIN_GTTS
+        mock_storage.get_active_gtts.return_value = [
+            GTTOrder(
+                id=i,
+                symbol="RELIANCE",
+                exchange="NSE",
+                trigger_price=2400.0 + i,
+                order_type="MARKET",
+                action="BUY",
+                quantity=1,
+                status=GTTStatus.ACTIVE.value,
+                created_at=datetime.now()
+            )
+            for i in range(1, count + 1)
+        ]
+        mock_groww_client.get_ltp.return_value = 2400.0 + count // 2
+
+        with patch('src.trader.gtt.monitor.asyncio.to_thread', wraps=asyncio.to_thread) as to_thread:
+            await monitor._check_gtts()
+
+        to_thread.assert_called_once()
+        executed = [call.args[0].id for call in mock_executor.execute_gtt.call_args_list]
+        assert executed == list(range(count // 2, count + 1))
+
+    @pytest.mark.asyncio
+    async def test_check_reloads_only_on_new_generation(self, monitor, mock_storage, mock_groww_client, mock_executor, sample_gtt_buy, sample_gtt_sell):
+        """Test the active set is reloaded only when the storage generation changes."""
+        mock_storage.get_generation.side_effect = None
+        mock_storage.get_generation.return_value = (1, 1)
+        mock_storage.get_active_gtts.return_value = [sample_gtt_buy, sample_gtt_sell]
+        mock_groww_client.get_ltp.return_value = 2490.0  # BUY triggers, SELL does not
+
+        await monitor._check_gtts()
+        monitor.clear_price_cache()
+        await monitor._check_gtts()
+
+        assert mock_storage.get_active_gtts_grouped.call_count == 1
+        assert mock_executor.execute_gtt.call_count == 2
+        assert all(call.args[0].id == sample_gtt_buy.id for call in mock_executor.execute_gtt.call_args_list)
+
+        # Cancelling the BUY bumps the generation and empties the active set
+        mock_storage.get_generation.return_value = (2, 1)
+        mock_storage.get_active_gtts.return_value = [sample_gtt_sell]
+        await monitor._check_gtts()
+
+        assert mock_storage.get_active_gtts_grouped.call_count == 2
+        assert mock_executor.execute_gtt.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_check_fetches_symbols_concurrently(self, monitor, mock_storage, mock_groww_client, mock_executor):
+        """Test LTPs for different symbols are fetched concurrently, up to the limit."""
+        from src.trader.api.exceptions import DataFetchError
+
+        symbols = ["RELIANCE", "TCS", "INFY", "HDFC", "ITC", "SBIN", "WIPRO"]
+        mock_storage.get_active_gtts.return_value = [
+            GTTOrder(
+                id=i,
+                symbol=symbol,
+                exchange="NSE",
+                trigger_price=2500.0,
+                order_type="LIMIT",
+                action="BUY",
+                quantity=1,
+                limit_price=2490.0,
+                status=GTTStatus.ACTIVE.value,
+                created_at=datetime.now()
+            )
+            for i, symbol in enumerate(symbols, 1)
+        ]
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get_ltp(symbol, exchange):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if symbol == "TCS":
+                raise DataFetchError("API error")
+            return 2490.0
+
+        mock_groww_client.get_ltp.side_effect = get_ltp
+
+        await monitor._check_gtts()
+
+        assert max_in_flight == monitor.max_concurrent_ltp
+        assert monitor.stats['api_errors'] == 1
+        assert monitor.stats['symbols_checked'] == len(symbols) - 1
+        assert mock_executor.execute_gtt.call_count == len(symbols) - 1
+
 
 class TestPriceCaching:
     """Test price caching."""
@@ -271,40 +470,71 @@ class TestPriceCaching:
 
         assert mock_groww_client.get_ltp.call_count == 2
 
-    def test_clear_price_cache(self, monitor):
-        """Test clearing price cache."""
-        monitor._price_cache["RELIANCE:NSE"] = (2500.0, datetime.now())
+    @pytest.mark.asyncio
+    async def test_concurrent_fetches_coalesce(self, monitor, mock_groww_client):
+        """Test concurrent cache misses for one symbol share a single API call."""
+        async def slow_ltp(symbol, exchange):
+            await asyncio.sleep(0.01)
+            return 2495.0
 
-        monitor.clear_price_cache()
+        mock_groww_client.get_ltp.side_effect = slow_ltp
 
-        assert len(monitor._price_cache) == 0
+        ltps = await asyncio.gather(*(monitor._get_ltp("RELIANCE", "NSE") for _ in range(3)))
 
+        assert ltps == [2495.0, 2495.0, 2495.0]
+        assert mock_groww_client.get_ltp.call_count == 1
+        assert monitor._inflight == {}
 
-class TestGrouping:
-    """Test GTT grouping."""
+    @pytest.mark.asyncio
+    async def test_concurrent_fetch_error_shared(self, monitor, mock_groww_client):
+        """Test callers joining a failed fetch all see its error."""
+        from src.trader.api.exceptions import DataFetchError
 
-    def test_group_by_symbol(self, monitor, sample_gtt_buy, sample_gtt_sell):
-        """Test grouping GTTs by symbol."""
-        gtt_reliance_2 = GTTOrder(
-            id=3,
-            symbol="RELIANCE",
-            exchange="NSE",
-            trigger_price=2600.0,
-            order_type="LIMIT",
-            action="SELL",
-            quantity=1,
-            limit_price=2610.0,
-            status=GTTStatus.ACTIVE.value,
-            created_at=datetime.now()
+        async def failing_ltp(symbol, exchange):
+            await asyncio.sleep(0.01)
+            raise DataFetchError("API error")
+
+        mock_groww_client.get_ltp.side_effect = failing_ltp
+
+        results = await asyncio.gather(
+            *(monitor._get_ltp("RELIANCE", "NSE") for _ in range(2)),
+            return_exceptions=True
         )
 
-        gtts = [sample_gtt_buy, sample_gtt_sell, gtt_reliance_2]
+        assert all(isinstance(result, DataFetchError) for result in results)
+        assert mock_groww_client.get_ltp.call_count == 1
+        assert monitor._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_fetch(self, monitor, mock_groww_client):
+        """Test cancelling the caller that started a fetch leaves the others joined to it."""
+        async def slow_ltp(symbol, exchange):
+            await asyncio.sleep(0.01)
+            return 2495.0
 
-        grouped = monitor._group_by_symbol(gtts)
+        mock_groww_client.get_ltp.side_effect = slow_ltp
 
-        assert len(grouped) == 2  # RELIANCE and TCS
-        assert len(grouped["RELIANCE:NSE"]) == 2
-        assert len(grouped["TCS:NSE"]) == 1
+        first = asyncio.create_task(monitor._get_ltp("RELIANCE", "NSE"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(monitor._get_ltp("RELIANCE", "NSE"))
+        await asyncio.sleep(0)
+
+        first.cancel()
+
+        assert await second == 2495.0
+        assert first.cancelled()
+        assert mock_groww_client.get_ltp.call_count == 1
+        assert monitor._inflight == {}
+
+    def test_clear_price_cache(self, monitor):
+        """Test clearing price cache."""
+        monitor._cache_price["RELIANCE:NSE"] = 2500.0
+        monitor._cache_expiry["RELIANCE:NSE"] = float("inf")
+
+        monitor.clear_price_cache()
+
+        assert len(monitor._cache_price) == 0
+        assert len(monitor._cache_expiry) == 0
 
 
 class TestTradingHours:
@@ -334,6 +564,52 @@ class TestTradingHours:
             # Should be False (weekend)
             assert result is False
 
+    def test_seconds_until_market_open(self, monitor):
+        """Test off-hours sleep runs until the next weekday 9:15 AM."""
+        cases = [
+            (datetime(2024, 1, 1, 8, 0), 75 * 60),  # Monday morning
+            (datetime(2024, 1, 1, 16, 0), (17 * 60 + 15) * 60),  # Monday evening
+            (datetime(2024, 1, 5, 16, 0), ((2 * 24 + 17) * 60 + 15) * 60),  # Friday evening
+            (datetime(2024, 1, 6, 10, 0), ((1 * 24 + 23) * 60 + 15) * 60),  # Saturday
+        ]
+
+        with patch('src.trader.gtt.monitor.datetime') as mock_datetime:
+            for now, expected in cases:
+                mock_datetime.now.return_value = now
+
+                assert monitor._seconds_until_market_open() == expected, now
+
+    def test_is_trading_hours_cached(self, monitor):
+        """Test trading hours result is reused within the cache window."""
+        with patch('src.trader.gtt.monitor.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime(2024, 1, 1, 10, 0)  # Monday
+
+            assert monitor._is_trading_hours() is True
+
+            mock_datetime.now.return_value = datetime(2024, 1, 6, 10, 0)  # Saturday
+            assert monitor._is_trading_hours() is True
+            assert mock_datetime.now.call_count == 1
+
+            # Expire the cache
+            monitor._th_cache = (float('-inf'), True)
+            assert monitor._is_trading_hours() is False
+
+    def test_is_trading_hours_session_bounds(self, monitor):
+        """Test session opens at 9:15 and closes at 3:30."""
+        cases = [
+            (datetime(2024, 1, 1, 9, 14), False),
+            (datetime(2024, 1, 1, 9, 15), True),
+            (datetime(2024, 1, 1, 15, 29), True),
+            (datetime(2024, 1, 1, 15, 30), False),
+        ]
+
+        with patch('src.trader.gtt.monitor.datetime') as mock_datetime:
+            for now, expected in cases:
+                monitor._th_cache = (float('-inf'), False)
+                mock_datetime.now.return_value = now
+
+                assert monitor._is_trading_hours() is expected, now
+
 
 class TestManualCheck:
     """Test manual GTT check."""
@@ -347,6 +623,17 @@ class TestManualCheck:
 
         assert monitor.stats['checks_performed'] == 1
 
+    @pytest.mark.asyncio
+    async def test_concurrent_checks_count_every_increment(self, monitor, mock_storage, mock_groww_client, sample_gtt_buy):
+        """Test overlapping checks (e.g. check_now during a loop tick) lose no stats."""
+        mock_storage.get_active_gtts.return_value = [sample_gtt_buy]
+        mock_groww_client.get_ltp.return_value = 2510.0  # No trigger
+
+        await asyncio.gather(*(monitor.check_now() for _ in range(5)))
+
+        assert monitor.stats['checks_performed'] == 5
+        assert monitor.get_stats()['checks_performed'] == 5
+
 
 class TestErrorHandling:
     """Test error handling."""
@@ -364,6 +651,41 @@ class TestErrorHandling:
 
         assert monitor.stats['api_errors'] == 1
 
+    @pytest.mark.asyncio
+    async def test_cancelled_fetch_counts_as_api_error(self, monitor, mock_storage, mock_groww_client, sample_gtt_buy):
+        """Test a cancelled LTP fetch fails that symbol instead of cancelling the check."""
+        mock_storage.get_active_gtts.return_value = [sample_gtt_buy]
+        mock_groww_client.get_ltp.side_effect = asyncio.CancelledError()
+
+        # Should not raise
+        await monitor._check_gtts()
+
+        assert monitor.stats['api_errors'] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_check_now_keeps_loop_running(self, monitor, mock_storage, mock_groww_client, sample_gtt_buy):
+        """Test cancelling a manual check does not end a loop tick sharing its fetch."""
+        async def slow_ltp(symbol, exchange):
+            await asyncio.sleep(0.05)
+            return 2510.0  # No trigger
+
+        mock_storage.get_active_gtts.return_value = [sample_gtt_buy]
+        mock_groww_client.get_ltp.side_effect = slow_ltp
+
+        with patch.object(monitor, '_is_trading_hours', return_value=True):
+            manual = asyncio.create_task(monitor.check_now())
+            await asyncio.sleep(0.01)  # The manual check owns the fetch
+            await monitor.start()
+            await asyncio.sleep(0.01)  # The loop tick joins it
+
+            manual.cancel()
+            await asyncio.sleep(0.1)
+
+            assert not monitor._monitor_task.done()
+            assert monitor.stats['symbols_checked'] == 1
+
+            await monitor.stop()
+
     @pytest.mark.asyncio
     async def test_execution_error_handling(self, monitor, mock_storage, mock_groww_client, mock_executor, sample_gtt_buy):
         """Test handling execution errors gracefully."""
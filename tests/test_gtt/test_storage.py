@@ -11,38 +11,58 @@ Tests cover:
 """
 
 import pytest
-import tempfile
-from pathlib import Path
+import uuid
 from datetime import datetime
 
 from src.trader.gtt.storage import GTTStorage
-from src.trader.api.models import GTTStatus
+from src.trader.api.models import GTTOrder, GTTStatus
 from src.trader.api.exceptions import GTTNotFoundError, GTTError
 
 
+@pytest.fixture(scope="module")
+async def shared_storage():
+    """Create one test storage with an in-memory database for the module."""
+    storage = GTTStorage(f"file:gtt_{uuid.uuid4().hex}?mode=memory&cache=shared")
+
+    # Wait for initialization
+    await storage._initialize_db()
+
+    yield storage
+
+    # Cleanup
+    await storage.close()
+
+
 @pytest.fixture
-async def storage():
-    """Create test storage with temporary database."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test_gtt.db"
-        storage = GTTStorage(db_path)
+async def disk_storage(tmp_path):
+    """Create test storage with an on-disk database, for file-level behavior."""
+    storage = GTTStorage(tmp_path / "test_gtt.db")
+    await storage._initialize_db()
 
-        # Wait for initialization
-        await storage._initialize_db()
+    yield storage
 
-        yield storage
+    await storage.close()
 
-        # Cleanup
-        await storage.close()
+
+@pytest.fixture
+async def storage(shared_storage):
+    """Test storage with its GTT table emptied."""
+    conn = await shared_storage._get_connection()
+    conn.executescript("""
+        DELETE FROM gtt_orders;
+        DELETE FROM sqlite_sequence WHERE name = 'gtt_orders';
+    """)
+
+    return shared_storage
 
 
 class TestStorageInitialization:
     """Test storage initialization."""
 
     @pytest.mark.asyncio
-    async def test_database_creation(self, storage):
+    async def test_database_creation(self, disk_storage):
         """Test database file is created."""
-        assert storage.db_path.exists()
+        assert disk_storage.db_path.exists()
 
     @pytest.mark.asyncio
     async def test_schema_creation(self, storage):
@@ -57,6 +77,59 @@ class TestStorageInitialization:
 
         assert cursor.fetchone() is not None
 
+    @pytest.mark.asyncio
+    async def test_connection_uses_wal(self, disk_storage):
+        """Test the shared connection runs in WAL mode with relaxed sync."""
+        conn = await disk_storage._get_connection()
+
+        assert conn is await disk_storage._get_connection()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+
+class TestGeneration:
+    """Test change tracking for the active GTT set."""
+
+    @pytest.mark.asyncio
+    async def test_generation_changes_on_write(self, storage):
+        """Test writes through this instance change the generation."""
+        start = await storage.get_generation()
+        assert await storage.get_generation() == start
+
+        gtt = await storage.create_gtt(
+            symbol="RELIANCE",
+            exchange="NSE",
+            trigger_price=2500.0,
+            order_type="MARKET",
+            action="BUY",
+            quantity=1
+        )
+        created = await storage.get_generation()
+        assert created != start
+
+        await storage.cancel_gtt(gtt.id)
+        assert await storage.get_generation() != created
+
+    @pytest.mark.asyncio
+    async def test_generation_sees_other_connections(self, storage):
+        """Test commits from another storage instance change the generation."""
+        start = await storage.get_generation()
+
+        other = GTTStorage(storage.db_path)
+        try:
+            await other.create_gtt(
+                symbol="TCS",
+                exchange="NSE",
+                trigger_price=3500.0,
+                order_type="MARKET",
+                action="SELL",
+                quantity=1
+            )
+        finally:
+            await other.close()
+
+        assert await storage.get_generation() != start
+
 
 class TestGTTCreation:
     """Test GTT creation."""
@@ -111,6 +184,63 @@ class TestGTTCreation:
 
         assert gtt.id is not None
 
+    @pytest.mark.asyncio
+    async def test_create_gtts_bulk(self, storage):
+        """Test creating several GTTs in one transaction."""
+        gtts = await storage.create_gtts_bulk([
+            {
+                'symbol': "RELIANCE",
+                'exchange': "NSE",
+                'trigger_price': 2500.0,
+                'order_type': "LIMIT",
+                'action': "BUY",
+                'quantity': 1,
+                'limit_price': 2490.0
+            },
+            {
+                'symbol': "TCS",
+                'exchange': "NSE",
+                'trigger_price': 3500.0,
+                'order_type': "MARKET",
+                'action': "SELL",
+                'quantity': 2,
+                'notes': "Take profit"
+            }
+        ])
+
+        assert [gtt.symbol for gtt in gtts] == ["RELIANCE", "TCS"]
+        assert gtts[1].id == gtts[0].id + 1
+        assert gtts[0].limit_price == 2490.0
+        assert gtts[1].limit_price is None
+        assert all(gtt.status == GTTStatus.ACTIVE.value for gtt in gtts)
+
+        assert await storage.create_gtts_bulk([]) == []
+
+    @pytest.mark.asyncio
+    async def test_create_gtts_bulk_is_atomic(self, storage):
+        """Test a failing order rolls back the whole batch."""
+        with pytest.raises(GTTError):
+            await storage.create_gtts_bulk([
+                {
+                    'symbol': "RELIANCE",
+                    'exchange': "NSE",
+                    'trigger_price': 2500.0,
+                    'order_type': "MARKET",
+                    'action': "BUY",
+                    'quantity': 1
+                },
+                {
+                    'symbol': "TCS",
+                    'exchange': "NSE",
+                    'trigger_price': None,  # NOT NULL column
+                    'order_type': "MARKET",
+                    'action': "BUY",
+                    'quantity': 1
+                }
+            ])
+
+        assert await storage.get_all_gtts() == []
+
 
 class TestGTTRetrieval:
     """Test GTT retrieval."""
@@ -169,6 +299,80 @@ class TestGTTRetrieval:
         assert len(active) == 2
         assert all(gtt.status == GTTStatus.ACTIVE.value for gtt in active)
 
+    @pytest.mark.asyncio
+    async def test_get_active_gtts_grouped(self, storage):
+        """Test active GTTs are grouped by symbol in SQL."""
+        first = await storage.create_gtt(
+            symbol="RELIANCE",
+            exchange="NSE",
+            trigger_price=2500.0,
+            order_type="LIMIT",
+            action="BUY",
+            quantity=1,
+            limit_price=2490.0
+        )
+
+        second = await storage.create_gtt(
+            symbol="RELIANCE",
+            exchange="NSE",
+            trigger_price=2600.0,
+            order_type="MARKET",
+            action="SELL",
+            quantity=2
+        )
+
+        cancelled = await storage.create_gtt(
+            symbol="TCS",
+            exchange="NSE",
+            trigger_price=3500.0,
+            order_type="MARKET",
+            action="BUY",
+            quantity=1
+        )
+        await storage.cancel_gtt(cancelled.id)
+
+        grouped = await storage.get_active_gtts_grouped()
+
+        assert list(grouped) == ["RELIANCE:NSE"]
+        assert [row['id'] for row in grouped["RELIANCE:NSE"]] == [first.id, second.id]
+
+        # Rows hydrate to the same orders get_gtt returns
+        for row in grouped["RELIANCE:NSE"]:
+            assert GTTOrder(**row) == await storage.get_gtt(row['id'])
+
+    @pytest.mark.asyncio
+    async def test_get_active_gtts_grouped_oldest_first(self, storage):
+        """Test grouped rows are ordered by creation time, then id."""
+        gtts = [
+            await storage.create_gtt(
+                symbol="RELIANCE",
+                exchange="NSE",
+                trigger_price=2500.0 + i,
+                order_type="MARKET",
+                action="BUY",
+                quantity=1
+            )
+            for i in range(3)
+        ]
+
+        # The first GTT created last, the other two tied on created_at
+        conn = await storage._get_connection()
+        conn.execute(
+            "UPDATE gtt_orders SET created_at = ? WHERE id = ?",
+            ("2030-01-02 00:00:00", gtts[0].id)
+        )
+        conn.execute(
+            "UPDATE gtt_orders SET created_at = ? WHERE id IN (?, ?)",
+            ("2030-01-01 00:00:00", gtts[2].id, gtts[1].id)
+        )
+        conn.commit()
+
+        grouped = await storage.get_active_gtts_grouped()
+
+        assert [row['id'] for row in grouped["RELIANCE:NSE"]] == [
+            gtts[1].id, gtts[2].id, gtts[0].id
+        ]
+
     @pytest.mark.asyncio
     async def test_get_gtts_by_symbol(self, storage):
         """Test retrieving GTTs by symbol."""
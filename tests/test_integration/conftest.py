@@ -0,0 +1,37 @@
+"""
+Shared fixtures for integration tests.
+"""
+
+import importlib
+
+import pytest
+
+
+# Heavy modules imported by the integration tests
+_WARM_MODULES = (
+    "src.trader.core.config",
+    "src.trader.core.logging_config",
+    "src.trader.api.client",
+    "src.trader.api.models",
+    "src.trader.risk.manager",
+    "src.trader.risk.kill_switch",
+    "src.trader.gtt.storage",
+    "src.trader.gtt.executor",
+    "src.trader.gtt.monitor",
+    "src.trader.backtesting.engine",
+    "src.trader.strategies.momentum",
+    "src.trader.strategies.mean_reversion",
+    "src.trader.data.news_fetcher",
+    "src.trader.mcp.server",
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports():
+    """Import the heavy modules once, outside any test body."""
+    for name in _WARM_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            # Leave import errors to the tests that exercise the module
+            pass
@@ -6,9 +6,10 @@ Tests the integration of multiple components working together.
 
 import pytest
 import asyncio
+import uuid
 from datetime import datetime
 
-from src.trader.core.config import get_config
+from src.trader.core.config import Config, get_config
 from src.trader.api.client import GrowwClient
 from src.trader.risk.manager import RiskManager
 from src.trader.risk.kill_switch import KillSwitch
@@ -31,6 +32,21 @@ async def test_config_loading(config):
     assert 'MAX_SINGLE_ORDER_VALUE' in config.hard_limits
 
 
+def test_config_get_cache_invalidated_on_set():
+    """Test cached dotted-key lookups are refreshed after set()."""
+    config = Config()
+
+    assert config.get('gtt.max_active_gtt') == config.get('gtt.max_active_gtt')
+    assert config.get('missing.key', 'fallback') == 'fallback'
+    assert config.get('missing.key') is None
+
+    config.set('gtt.max_active_gtt', 7)
+    config.set('missing.key', 'present')
+
+    assert config.get('gtt.max_active_gtt') == 7
+    assert config.get('missing.key', 'fallback') == 'present'
+
+
 @pytest.mark.asyncio
 async def test_client_initialization(config):
     """Test Groww client initializes in paper mode."""
@@ -78,9 +94,9 @@ async def test_kill_switch_activation(config):
 
 
 @pytest.mark.asyncio
-async def test_gtt_storage_operations(tmp_path):
+async def test_gtt_storage_operations():
     """Test GTT storage CRUD operations."""
-    db_path = tmp_path / "test_gtt.db"
+    db_path = f"file:gtt_{uuid.uuid4().hex}?mode=memory&cache=shared"
     storage = GTTStorage(db_path=db_path)
 
     # Create GTT
@@ -117,9 +133,9 @@ async def test_gtt_storage_operations(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_gtt_executor_validation(config, tmp_path):
+async def test_gtt_executor_validation(config):
     """Test GTT executor validates with risk manager."""
-    db_path = tmp_path / "test_gtt.db"
+    db_path = f"file:gtt_{uuid.uuid4().hex}?mode=memory&cache=shared"
     storage = GTTStorage(db_path=db_path)
 
     client = GrowwClient(config=config)
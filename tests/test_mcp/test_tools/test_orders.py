@@ -0,0 +1,231 @@
+"""
+Tests for the order MCP tools.
+
+Tests cover:
+- Batch placement against limits shared across symbols
+- Concurrent single-order placement
+- Order parameters reaching risk validation
+- Reservations released on failed placement
+"""
+
+import asyncio
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from src.trader.api.exceptions import RiskManagementError
+from src.trader.api.models import Order
+from src.trader.risk.manager import RiskManager
+
+try:
+    from src.trader.mcp.tools import orders as order_tools
+except Exception as exc:  # The server module builds FastMCP at import time
+    pytest.skip(f"MCP server unavailable: {exc}", allow_module_level=True)
+
+
+# Values served by the stub config (built once, read-only)
+_CONFIG_TABLE = {
+    'risk': {
+        'max_portfolio_value': 50000,
+        'max_position_size': 5000,
+        'max_daily_loss': 2000,
+        'max_open_positions': 3
+    }
+}
+
+_CONFIG = SimpleNamespace(
+    get=_CONFIG_TABLE.get,
+    hard_limits={
+        'MAX_SINGLE_ORDER_VALUE': 10000,
+        'MAX_DAILY_ORDERS': 15,
+        'MAX_DAILY_LOSS_HARD': 5000,
+        'FORBIDDEN_SEGMENTS': ['FNO'],
+        'FORBIDDEN_PRODUCTS': ['MIS']
+    },
+    is_paper_mode=lambda: True
+)
+
+
+class _StubGrowwClient:
+    """Groww client stand-in whose order placement yields to the event loop."""
+
+    def __init__(self):
+        self.placed = []
+        self.fail_symbols = set()
+
+    async def get_positions(self):
+        return []
+
+    async def get_ltp(self, symbol, exchange):
+        return 100.0
+
+    async def place_order(self, **params):
+        # Let every concurrent placement reach the broker call first
+        await asyncio.sleep(0)
+
+        if params['symbol'] in self.fail_symbols:
+            raise RuntimeError("broker unavailable")
+
+        self.placed.append(params['symbol'])
+        return Order(
+            order_id=f"ORD{len(self.placed)}",
+            symbol=params['symbol'],
+            exchange=params['exchange'],
+            quantity=params['quantity'],
+            price=params['price'],
+            transaction_type=params['transaction_type'],
+            order_type=params['order_type'],
+            product=params['product']
+        )
+
+
+@pytest.fixture
+def groww_client():
+    """Stub Groww client."""
+    return _StubGrowwClient()
+
+
+@pytest.fixture
+def risk_manager(groww_client):
+    """Risk manager on the current trading day."""
+    manager = RiskManager(groww_client, config=_CONFIG)
+    manager._current_day = date.today()
+    return manager
+
+
+@pytest.fixture
+def ctx(groww_client, risk_manager):
+    """Tool context with an inactive kill switch."""
+    return SimpleNamespace(request_context=SimpleNamespace(
+        groww_client=groww_client,
+        risk_manager=risk_manager,
+        kill_switch=SimpleNamespace(is_active=lambda: False),
+        config=_CONFIG
+    ))
+
+
+def _order(symbol, transaction_type='BUY', **overrides):
+    order = {
+        'symbol': symbol,
+        'transaction_type': transaction_type,
+        'quantity': 1,
+        'order_type': 'LIMIT',
+        'price': 100.0
+    }
+    order.update(overrides)
+    return order
+
+
+class TestPlaceOrders:
+    """Test batched order placement."""
+
+    @pytest.mark.asyncio
+    async def test_batch_respects_open_position_limit(self, ctx, groww_client):
+        """Test BUYs for different symbols stop at max_open_positions."""
+        batch = [_order(f'STOCK{i}') for i in range(25)]
+
+        results = await order_tools.place_orders(orders=batch, ctx=ctx)
+
+        succeeded = [r for r in results if r['success']]
+        assert len(succeeded) == 3
+        assert len(groww_client.placed) == 3
+        assert all(
+            'Maximum open positions' in r['error'] for r in results if not r['success']
+        )
+
+    @pytest.mark.asyncio
+    async def test_batch_respects_daily_order_limit(self, ctx, groww_client, risk_manager):
+        """Test orders for different symbols stop at MAX_DAILY_ORDERS."""
+        batch = [_order(f'STOCK{i}', 'SELL') for i in range(25)]
+
+        results = await order_tools.place_orders(orders=batch, ctx=ctx)
+
+        assert sum(r['success'] for r in results) == 15
+        assert len(groww_client.placed) == 15
+        assert risk_manager.daily_order_count == 15
+        assert risk_manager.daily_order_limit_reached() is True
+
+    @pytest.mark.asyncio
+    async def test_batch_failed_placement_frees_slot(self, ctx, groww_client, risk_manager):
+        """Test a broker failure gives its position slot to the next order."""
+        groww_client.fail_symbols.add('STOCK0')
+        batch = [_order(f'STOCK{i}') for i in range(5)]
+
+        results = await order_tools.place_orders(orders=batch, ctx=ctx)
+
+        assert results[0]['success'] is False
+        assert 'broker unavailable' in results[0]['error']
+        assert risk_manager._reserved_orders == 0
+        assert 'STOCK0' not in risk_manager._pending_positions
+
+        # The freed slot is available to a later order
+        results = await order_tools.place_orders(orders=[_order('WIPRO')], ctx=ctx)
+        assert results[0]['success'] is True
+
+    @pytest.mark.asyncio
+    async def test_batch_passes_product_and_segment_to_validation(self, ctx, groww_client):
+        """Test forbidden products and segments are rejected per order."""
+        batch = [
+            _order('RELIANCE', product='MIS'),
+            _order('TCS', segment='FNO'),
+            _order('INFY')
+        ]
+
+        results = await order_tools.place_orders(orders=batch, ctx=ctx)
+
+        assert "Product 'MIS' is forbidden" in results[0]['error']
+        assert "Segment 'FNO' is forbidden" in results[1]['error']
+        assert results[2]['success'] is True
+        assert groww_client.placed == ['INFY']
+
+    @pytest.mark.asyncio
+    async def test_batch_market_orders_use_ltp(self, ctx, groww_client):
+        """Test MARKET orders are validated and placed at the fetched LTP."""
+        results = await order_tools.place_orders(
+            orders=[_order('RELIANCE', order_type='MARKET', price=None)],
+            ctx=ctx
+        )
+
+        assert results[0]['success'] is True
+        assert results[0]['price'] == 100.0
+
+
+class TestPlaceOrder:
+    """Test single order placement."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_respect_open_position_limit(self, ctx, groww_client):
+        """Test concurrent place_order calls share the open position limit."""
+        results = await asyncio.gather(
+            *[
+                order_tools.place_order(
+                    symbol=f'STOCK{i}',
+                    transaction_type='BUY',
+                    quantity=1,
+                    price=100.0,
+                    ctx=ctx
+                )
+                for i in range(5)
+            ],
+            return_exceptions=True
+        )
+
+        assert sum(isinstance(r, dict) for r in results) == 3
+        assert sum(isinstance(r, RiskManagementError) for r in results) == 2
+        assert len(groww_client.placed) == 3
+
+    @pytest.mark.asyncio
+    async def test_forbidden_product_rejected(self, ctx, groww_client):
+        """Test the product reaches risk validation."""
+        with pytest.raises(RiskManagementError, match="forbidden"):
+            await order_tools.place_order(
+                symbol='RELIANCE',
+                transaction_type='BUY',
+                quantity=1,
+                price=100.0,
+                product='MIS',
+                ctx=ctx
+            )
+
+        assert groww_client.placed == []
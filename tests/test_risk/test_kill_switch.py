@@ -8,63 +8,146 @@ Tests cover:
 - Approval code validation
 """
 
+import copy
 import pytest
 import asyncio
-from datetime import datetime, timedelta
-from unittest.mock import Mock, AsyncMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 from src.trader.risk.kill_switch import KillSwitch, KillSwitchCondition
 from src.trader.api.exceptions import KillSwitchActive
 from src.trader.api.models import RiskMetrics
 
 
-@pytest.fixture
-def mock_config():
-    """Mock configuration."""
-    config = Mock()
-    config.get.side_effect = lambda key, default=None: {
-        'kill_switch': {
-            'consecutive_loss_threshold': 5,
-            'api_error_rate_threshold': 0.3,
-            'network_timeout_seconds': 60,
-            'check_interval_seconds': 30,
-            'recovery_protocol': {
-                'cooldown_period_minutes': 60,
-                'approval_code': 'TEST_CODE_123'
-            }
+# Values served by the mocked config (built once, read-only)
+_CONFIG_TABLE = {
+    'kill_switch': {
+        'consecutive_loss_threshold': 5,
+        'api_error_rate_threshold': 0.3,
+        'network_timeout_seconds': 60,
+        'check_interval_seconds': 30,
+        'recovery_protocol': {
+            'cooldown_period_minutes': 60,
+            'approval_code': 'TEST_CODE_123'
         }
-    }.get(key, default)
-    config.hard_limits = {
-        'MAX_DAILY_LOSS_HARD': 5000
     }
-    return config
+}
+
+
+@pytest.fixture(scope="module")
+def mock_config():
+    """Stub configuration (plain dict lookups, read-only), shared across the module."""
+    return SimpleNamespace(
+        get=_CONFIG_TABLE.get,
+        hard_limits={
+            'MAX_DAILY_LOSS_HARD': 5000
+        }
+    )
+
+
+# Risk status served by the mocked risk manager unless a test overrides it
+_HEALTHY_STATUS = RiskMetrics(
+    daily_pnl=0,
+    open_positions=0,
+    max_positions=3,
+    used_capital=0,
+    available_capital=50000,
+    daily_loss_limit=2000,
+    daily_order_count=0,
+    max_daily_orders=15,
+    kill_switch_active=False,
+    is_healthy=True,
+    warnings=[]
+)
+
+# Risk status past the hard daily loss limit
+_LOSS_STATUS = RiskMetrics(
+    daily_pnl=-5500,  # Exceeds 5000 limit
+    open_positions=1,
+    max_positions=3,
+    used_capital=5000,
+    available_capital=45000,
+    daily_loss_limit=2000,
+    daily_order_count=5,
+    max_daily_orders=15,
+    kill_switch_active=False,
+    is_healthy=False,
+    warnings=["Daily loss exceeded"]
+)
+
+
+class _StubRiskManager:
+    """Risk manager stand-in: get_status is a plain coroutine returning `status`."""
+
+    def __init__(self):
+        self.status = _HEALTHY_STATUS
+        self.status_calls = 0
+
+    async def get_status(self) -> RiskMetrics:
+        self.status_calls += 1
+        return self.status
+
+
+@pytest.fixture(scope="module")
+def shared_risk_manager():
+    """Stub risk manager, shared across the module."""
+    return _StubRiskManager()
 
 
 @pytest.fixture
-def mock_risk_manager():
-    """Mock risk manager."""
-    manager = Mock()
-    manager.get_status = AsyncMock(return_value=RiskMetrics(
-        daily_pnl=0,
-        open_positions=0,
-        max_positions=3,
-        used_capital=0,
-        available_capital=50000,
-        daily_loss_limit=2000,
-        daily_order_count=0,
-        max_daily_orders=15,
-        kill_switch_active=False,
-        is_healthy=True,
-        warnings=[]
-    ))
-    return manager
+def mock_risk_manager(shared_risk_manager):
+    """Stub risk manager with its per-test state reset."""
+    shared_risk_manager.status = _HEALTHY_STATUS
+    shared_risk_manager.status_calls = 0
+    return shared_risk_manager
+
+
+# Clock offsets (seconds) either side of the configured 60-minute cooldown
+# and past the 60-second network timeout
+_WITHIN_COOLDOWN = 59 * 60
+_PAST_COOLDOWN = 61 * 60
+_PAST_NETWORK_TIMEOUT = 70
+
+
+class _FrozenClock:
+    """Stand-in for the kill switch's `time` module with a settable clock."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
 
 
 @pytest.fixture
-def kill_switch(mock_risk_manager, mock_config):
-    """Create test kill switch."""
-    with patch('src.trader.risk.kill_switch.get_config', return_value=mock_config):
-        return KillSwitch(mock_risk_manager, config=mock_config)
+def frozen_clock():
+    """Freeze the kill switch's monotonic clock; advance it via `.now`."""
+    clock = _FrozenClock()
+    with patch('src.trader.risk.kill_switch.time', clock):
+        yield clock
+
+
+@pytest.fixture(scope="module")
+def kill_switch_prototype(shared_risk_manager, mock_config):
+    """Kill switch built (and its config loaded) once per module."""
+    return KillSwitch(shared_risk_manager, config=mock_config)
+
+
+@pytest.fixture
+def kill_switch(kill_switch_prototype, mock_risk_manager):
+    """Create test kill switch as a fresh copy of the module prototype."""
+    # Every other attribute is immutable, so a shallow copy isolates tests
+    ks = copy.copy(kill_switch_prototype)
+    ks.stats = dict(kill_switch_prototype.stats)
+    return ks
+
+
+@pytest.fixture
+async def monitored_kill_switch(kill_switch):
+    """Kill switch whose monitor task is always stopped on teardown."""
+    yield kill_switch
+    # The event loop is shared across tests; leave no monitor task behind
+    await kill_switch.stop_monitoring()
 
 
 class TestKillSwitchInitialization:
@@ -134,10 +217,10 @@ class TestDeactivation:
         assert "Invalid approval code" in str(exc_info.value)
         assert kill_switch._active is True
 
-    def test_deactivate_during_cooldown(self, kill_switch):
+    def test_deactivate_during_cooldown(self, kill_switch, frozen_clock):
         """Test deactivation during cooldown fails."""
         kill_switch.activate("Testing")
-        kill_switch._activated_at = datetime.now()  # Just activated
+        frozen_clock.now += _WITHIN_COOLDOWN
 
         with pytest.raises(KillSwitchActive) as exc_info:
             kill_switch.deactivate("TEST_CODE_123")
@@ -145,11 +228,10 @@ class TestDeactivation:
         assert "Cooldown period not elapsed" in str(exc_info.value)
         assert kill_switch._active is True
 
-    def test_deactivate_after_cooldown(self, kill_switch):
+    def test_deactivate_after_cooldown(self, kill_switch, frozen_clock):
         """Test successful deactivation after cooldown."""
         kill_switch.activate("Testing")
-        # Simulate cooldown elapsed
-        kill_switch._activated_at = datetime.now() - timedelta(minutes=61)
+        frozen_clock.now += _PAST_COOLDOWN
 
         result = kill_switch.deactivate("TEST_CODE_123")
 
@@ -158,6 +240,17 @@ class TestDeactivation:
         assert kill_switch._reason is None
         assert kill_switch.stats['deactivations'] == 1
 
+    def test_cooldown_ignores_wall_clock(self, kill_switch):
+        """Test cooldown is measured on the monotonic clock, not activated_at."""
+        kill_switch.activate("Testing")
+        # A wall clock jump must not shorten the cooldown
+        kill_switch._activated_at = kill_switch._activated_at.replace(year=2000)
+
+        with pytest.raises(KillSwitchActive):
+            kill_switch.deactivate("TEST_CODE_123")
+
+        assert kill_switch._active is True
+
     def test_deactivate_when_not_active(self, kill_switch):
         """Test deactivating when not active."""
         result = kill_switch.deactivate("TEST_CODE_123")
@@ -171,20 +264,7 @@ class TestConditionMonitoring:
     @pytest.mark.asyncio
     async def test_daily_loss_limit_trigger(self, kill_switch, mock_risk_manager):
         """Test kill switch triggers on daily loss limit."""
-        # Mock risk status with excessive loss
-        mock_risk_manager.get_status = AsyncMock(return_value=RiskMetrics(
-            daily_pnl=-5500,  # Exceeds 5000 limit
-            open_positions=1,
-            max_positions=3,
-            used_capital=5000,
-            available_capital=45000,
-            daily_loss_limit=2000,
-            daily_order_count=5,
-            max_daily_orders=15,
-            kill_switch_active=False,
-            is_healthy=False,
-            warnings=["Daily loss exceeded"]
-        ))
+        mock_risk_manager.status = _LOSS_STATUS
 
         await kill_switch._check_conditions()
 
@@ -193,55 +273,84 @@ class TestConditionMonitoring:
         assert kill_switch.stats['auto_triggers'] == 1
 
     @pytest.mark.asyncio
-    async def test_consecutive_losses_trigger(self, kill_switch):
-        """Test kill switch triggers on consecutive losses."""
-        # Record 5 consecutive losses
-        for _ in range(5):
-            kill_switch.record_trade_result(-100)
-
+    @pytest.mark.parametrize("pnls,expected_streak,expected_active", [
+        ([-100] * 5, 5, True),
+        ([-100] * 4, 4, False),
+        ([-100] * 3 + [50], 0, False),
+        ([-100] * 4 + [50] + [-100] * 4, 4, False),
+    ])
+    async def test_consecutive_losses(self, kill_switch, pnls, expected_streak, expected_active):
+        """Test the loss streak trips on record at the limit and resets on profit."""
+        kill_switch.record_trade_results(pnls)
+
+        assert kill_switch._consecutive_losses == expected_streak
+        assert kill_switch._active is expected_active
+
+        # A later condition check agrees and does not trigger a second time
         await kill_switch._check_conditions()
 
-        assert kill_switch._active is True
-        assert "Consecutive loss limit breached" in kill_switch._reason
+        assert kill_switch._active is expected_active
+        assert kill_switch.stats['auto_triggers'] == int(expected_active)
+        if expected_active:
+            assert "Consecutive loss limit breached" in kill_switch._reason
 
     @pytest.mark.asyncio
-    async def test_consecutive_losses_reset_on_profit(self, kill_switch):
-        """Test consecutive losses reset on profitable trade."""
-        # Record 3 losses
-        for _ in range(3):
-            kill_switch.record_trade_result(-100)
+    @pytest.mark.parametrize("failures,successes,expected_active", [
+        (19, 0, False),  # Below the minimum sample
+        (20, 0, True),
+        (30, 20, True),  # 60% > 30% threshold
+        (5, 45, False),  # 10%
+    ])
+    async def test_api_error_rate(self, kill_switch, failures, successes, expected_active):
+        """Test API error rate trips once the minimum sample is over threshold."""
+        kill_switch.record_api_calls(failures=failures, successes=successes)
+
+        assert kill_switch._active is expected_active
 
-        assert kill_switch._consecutive_losses == 3
-
-        # Record profit
-        kill_switch.record_trade_result(50)
+        await kill_switch._check_conditions()
 
-        assert kill_switch._consecutive_losses == 0
+        assert kill_switch._active is expected_active
+        if expected_active:
+            assert "API error rate exceeded" in kill_switch._reason
 
     @pytest.mark.asyncio
-    async def test_api_error_rate_trigger(self, kill_switch):
-        """Test kill switch triggers on high API error rate."""
-        # Record 30 errors out of 50 calls (60% error rate > 30% threshold)
-        for _ in range(30):
-            kill_switch.record_api_call(success=False)
-        for _ in range(20):
-            kill_switch.record_api_call(success=True)
+    async def test_network_failure_trigger(self, kill_switch, frozen_clock):
+        """Test kill switch triggers on network failure."""
+        kill_switch._network_failure_mono = frozen_clock.now - _PAST_NETWORK_TIMEOUT
 
         await kill_switch._check_conditions()
 
         assert kill_switch._active is True
-        assert "API error rate exceeded" in kill_switch._reason
+        assert "Network failure duration exceeded" in kill_switch._reason
+        # Tripped on local state without a broker round-trip
+        assert kill_switch.risk_manager.status_calls == 0
 
     @pytest.mark.asyncio
-    async def test_network_failure_trigger(self, kill_switch):
-        """Test kill switch triggers on network failure."""
-        # Simulate network failure starting 70 seconds ago
-        kill_switch._network_failure_start = datetime.now() - timedelta(seconds=70)
+    async def test_network_failure_timer_trigger(self, kill_switch):
+        """Test network failure trips at the timeout without polling."""
+        kill_switch.network_timeout_seconds = 0.01
 
-        await kill_switch._check_conditions()
+        kill_switch.record_network_failure(is_failure=True)
+        assert kill_switch._net_timer_handle is not None
+
+        await asyncio.sleep(0.05)
 
         assert kill_switch._active is True
         assert "Network failure duration exceeded" in kill_switch._reason
+        assert kill_switch._net_timer_handle is None
+
+    @pytest.mark.asyncio
+    async def test_network_recovery_cancels_timer(self, kill_switch):
+        """Test network recovery cancels the pending timeout."""
+        kill_switch.network_timeout_seconds = 0.01
+
+        kill_switch.record_network_failure(is_failure=True)
+        kill_switch.record_network_failure(is_failure=False)
+        assert kill_switch._net_timer_handle is None
+
+        await asyncio.sleep(0.05)
+
+        assert kill_switch._active is False
 
 
 class TestConditionTracking:
@@ -252,64 +361,124 @@ class TestConditionTracking:
         kill_switch.record_api_call(success=True)
         kill_switch.record_api_call(success=False)
 
-        assert len(kill_switch._api_call_history) == 2
+        assert kill_switch._api_calls_recorded == 2
+        assert kill_switch._api_error_count == 1
 
     def test_calculate_api_error_rate(self, kill_switch):
         """Test calculating API error rate."""
         # Record 7 errors out of 10 calls
-        for _ in range(7):
-            kill_switch.record_api_call(success=False)
-        for _ in range(3):
-            kill_switch.record_api_call(success=True)
+        kill_switch.record_api_calls(failures=7, successes=3)
 
         error_rate = kill_switch._calculate_api_error_rate()
 
         assert error_rate == 0.7  # 70% error rate
 
+    @pytest.mark.parametrize("batches", [
+        [(7, 3)],
+        [(0, 15), (10, 0)],
+        [(10, 40), (5, 60)],
+        [(3, 16), (1, 30)],
+        [(10, 30)],
+        [(120, 0), (0, 35)],
+    ])
+    def test_record_api_calls_matches_single_calls(self, kill_switch, mock_risk_manager, mock_config, batches):
+        """Test bulk recording leaves the same window and activation as one call at a time."""
+        single = KillSwitch(mock_risk_manager, config=mock_config)
+        for failures, successes in batches:
+            kill_switch.record_api_calls(failures=failures, successes=successes)
+            for _ in range(failures):
+                single.record_api_call(success=False)
+            for _ in range(successes):
+                single.record_api_call(success=True)
+
+            assert kill_switch._api_failure_bits == single._api_failure_bits
+            assert kill_switch._api_calls_recorded == single._api_calls_recorded
+            assert kill_switch._api_error_count == single._api_error_count
+            assert kill_switch._active is single._active
+
+    @pytest.mark.parametrize("pnls", [
+        [-100] * 3 + [50] + [-100] * 2,
+        [-100] * 7,
+        [-100] * 5 + [0] + [-100] * 5,
+    ])
+    def test_record_trade_results_matches_single_calls(self, kill_switch, mock_risk_manager, mock_config, pnls):
+        """Test bulk trade recording leaves the same streak and activation as one call at a time."""
+        single = KillSwitch(mock_risk_manager, config=mock_config)
+        kill_switch.record_trade_results(pnls)
+        for pnl in pnls:
+            single.record_trade_result(pnl)
+
+        assert kill_switch._consecutive_losses == single._consecutive_losses
+        assert kill_switch._active is single._active
+        assert kill_switch._reason == single._reason
+        assert kill_switch.stats == single.stats
+
+    def test_api_error_rate_window(self, kill_switch):
+        """Test error rate only counts calls still inside the window."""
+        for _ in range(10):
+            kill_switch.record_api_call(success=False)
+        for _ in range(KillSwitch.API_ERROR_WINDOW):
+            kill_switch.record_api_call(success=True)
+
+        assert kill_switch._calculate_api_error_rate() == 0.0
+
     def test_record_network_failure(self, kill_switch):
         """Test recording network failure."""
         # Start failure
         kill_switch.record_network_failure(is_failure=True)
-        assert kill_switch._network_failure_start is not None
+        assert kill_switch._network_failure_mono is not None
 
         # End failure
         kill_switch.record_network_failure(is_failure=False)
-        assert kill_switch._network_failure_start is None
+        assert kill_switch._network_failure_mono is None
 
 
 class TestMonitoring:
     """Test monitoring loop."""
 
     @pytest.mark.asyncio
-    async def test_start_monitoring(self, kill_switch):
+    async def test_start_monitoring(self, monitored_kill_switch):
         """Test starting monitoring."""
+        kill_switch = monitored_kill_switch
         await kill_switch.start_monitoring()
 
         assert kill_switch._monitoring is True
         assert kill_switch._monitor_task is not None
 
-        # Stop monitoring
-        await kill_switch.stop_monitoring()
-
     @pytest.mark.asyncio
-    async def test_stop_monitoring(self, kill_switch):
+    async def test_stop_monitoring(self, monitored_kill_switch):
         """Test stopping monitoring."""
+        kill_switch = monitored_kill_switch
         await kill_switch.start_monitoring()
         await kill_switch.stop_monitoring()
 
         assert kill_switch._monitoring is False
 
     @pytest.mark.asyncio
-    async def test_monitoring_idempotent(self, kill_switch):
+    async def test_monitoring_continues_after_errors(self, monitored_kill_switch):
+        """Test monitoring keeps polling when condition checks fail."""
+        kill_switch = monitored_kill_switch
+        kill_switch.check_interval_seconds = 0
+        kill_switch._check_conditions = AsyncMock(side_effect=RuntimeError("boom"))
+
+        await kill_switch.start_monitoring()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        await kill_switch.stop_monitoring()
+
+        assert kill_switch._check_conditions.await_count >= 3
+        assert kill_switch._monitor_task.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_monitoring_idempotent(self, monitored_kill_switch):
         """Test starting monitoring multiple times is idempotent."""
+        kill_switch = monitored_kill_switch
         await kill_switch.start_monitoring()
         await kill_switch.start_monitoring()
 
         # Should only have one monitoring task
         assert kill_switch._monitoring is True
 
-        await kill_switch.stop_monitoring()
-
 
 class TestStatus:
     """Test status reporting."""
@@ -334,10 +503,22 @@ class TestStatus:
         assert 'elapsed_seconds' in status
         assert 'cooldown_remaining_seconds' in status
 
-    def test_get_stats(self, kill_switch):
+    def test_get_status_cached_until_state_changes(self, kill_switch):
+        """Test status is reused while idle and rebuilt after a change."""
+        status = kill_switch.get_status()
+
+        assert kill_switch.get_status() is status
+
+        kill_switch.record_trade_result(-100)
+        updated = kill_switch.get_status()
+
+        assert updated is not status
+        assert updated['conditions']['consecutive_losses'] == 1
+
+    def test_get_stats(self, kill_switch, frozen_clock):
         """Test getting statistics."""
         kill_switch.activate("Test 1")
-        kill_switch._activated_at = datetime.now() - timedelta(minutes=61)
+        frozen_clock.now += _PAST_COOLDOWN
         kill_switch.deactivate("TEST_CODE_123")
 
         kill_switch.activate("Test 2")
@@ -348,6 +529,20 @@ class TestStatus:
         assert stats['deactivations'] == 1
         assert 'current_status' in stats
 
+    def test_get_counters(self, kill_switch):
+        """Test getting counters without status."""
+        kill_switch.activate("Test")
+
+        counters = kill_switch.get_counters()
+
+        assert counters['activations'] == 1
+        assert counters['manual_triggers'] == 1
+        assert 'current_status' not in counters
+
+        # Returned dict is a copy
+        counters['activations'] = 99
+        assert kill_switch.stats['activations'] == 1
+
 
 class TestUtilities:
     """Test utility methods."""
@@ -369,4 +564,5 @@ class TestUtilities:
 
         assert kill_switch._active is False
         assert kill_switch._consecutive_losses == 0
-        assert len(kill_switch._api_call_history) == 0
+        assert kill_switch._api_calls_recorded == 0
+        assert kill_switch._api_error_count == 0
@@ -10,48 +10,132 @@ Tests cover:
 """
 
 import pytest
-from datetime import date, datetime
-from unittest.mock import Mock, AsyncMock, patch
+from datetime import date
+from types import SimpleNamespace
+from typing import List
+from unittest.mock import patch
 
-from src.trader.risk.manager import RiskManager, OrderValidation
+from src.trader.risk.manager import RiskManager
 from src.trader.api.models import Position, Order
 
 
-@pytest.fixture
-def mock_config():
-    """Mock configuration."""
-    config = Mock()
-    config.get.side_effect = lambda key, default=None: {
-        'risk': {
-            'max_portfolio_value': 50000,
-            'max_position_size': 5000,
-            'max_daily_loss': 2000,
-            'max_open_positions': 3
-        }
-    }.get(key, default)
-    config.hard_limits = {
-        'MAX_SINGLE_ORDER_VALUE': 10000,
-        'MAX_DAILY_ORDERS': 15,
-        'MAX_DAILY_LOSS_HARD': 5000,
-        'FORBIDDEN_SEGMENTS': ['FNO'],
-        'FORBIDDEN_PRODUCTS': ['MIS']
+# Values served by the mocked config (built once, read-only)
+_CONFIG_TABLE = {
+    'risk': {
+        'max_portfolio_value': 50000,
+        'max_position_size': 5000,
+        'max_daily_loss': 2000,
+        'max_open_positions': 3
     }
-    return config
+}
+
+
+# Placeholder position for tests that only need symbols to count as open
+_POSITION = object()
+
+
+# Broker positions served by the stub client (read-only, shared by tests)
+_PNL_POSITIONS = [
+    Position(
+        symbol='RELIANCE',
+        exchange='NSE',
+        product='CNC',
+        quantity=1,
+        average_price=2500,
+        pnl=100
+    ),
+    Position(
+        symbol='TCS',
+        exchange='NSE',
+        product='CNC',
+        quantity=1,
+        average_price=3500,
+        pnl=-50
+    )
+]
+
+_PROFIT_POSITIONS = [
+    Position(symbol='RELIANCE', exchange='NSE', product='CNC', quantity=1, average_price=2500, pnl=300),
+    Position(symbol='TCS', exchange='NSE', product='CNC', quantity=1, average_price=3500, pnl=200)
+]
+
+_LOSS_POSITIONS = [
+    Position(symbol='RELIANCE', exchange='NSE', product='CNC', quantity=1, average_price=2500, pnl=-1000),
+    Position(symbol='TCS', exchange='NSE', product='CNC', quantity=1, average_price=3500, pnl=-500),
+    Position(symbol='INFY', exchange='NSE', product='CNC', quantity=1, average_price=1500, pnl=-300)
+]
+
+# Large enough to take the vectorized P&L path
+_MANY_POSITIONS = [
+    Position(
+        symbol=f'STOCK{i}',
+        exchange='NSE',
+        product='CNC',
+        quantity=i + 1,
+        average_price=100 + i,
+        pnl=(i - 10) * 1.5 if i % 5 else None
+    )
+    for i in range(40)
+]
+
+
+@pytest.fixture(scope="module")
+def shared_config():
+    """Stub configuration (plain dict lookups, no call recording), shared across the module."""
+    return SimpleNamespace(
+        get=_CONFIG_TABLE.get,
+        hard_limits={
+            'MAX_SINGLE_ORDER_VALUE': 10000,
+            'MAX_DAILY_ORDERS': 15,
+            'MAX_DAILY_LOSS_HARD': 5000,
+            'FORBIDDEN_SEGMENTS': ['FNO'],
+            'FORBIDDEN_PRODUCTS': ['MIS']
+        }
+    )
+
+
+@pytest.fixture
+def mock_config(shared_config):
+    """Stub configuration with the default values restored."""
+    shared_config.get = _CONFIG_TABLE.get
+    return shared_config
+
+
+class _StubGrowwClient:
+    """Groww client stand-in: get_positions is a plain coroutine returning `positions`."""
+
+    def __init__(self):
+        self.positions: List[Position] = []
+
+    async def get_positions(self) -> List[Position]:
+        return self.positions
+
+
+@pytest.fixture(scope="module")
+def shared_groww_client():
+    """Stub Groww client, shared across the module."""
+    return _StubGrowwClient()
 
 
 @pytest.fixture
-def mock_groww_client():
-    """Mock Groww client."""
-    client = Mock()
-    client.get_positions = AsyncMock(return_value=[])
-    return client
+def mock_groww_client(shared_groww_client):
+    """Stub Groww client with no open positions."""
+    shared_groww_client.positions = []
+    return shared_groww_client
 
 
 @pytest.fixture
 def risk_manager(mock_groww_client, mock_config):
     """Create test risk manager."""
-    with patch('src.trader.risk.manager.get_config', return_value=mock_config):
-        return RiskManager(mock_groww_client, config=mock_config)
+    return RiskManager(mock_groww_client, config=mock_config)
+
+
+@pytest.fixture
+async def recording_risk_manager(risk_manager):
+    """Risk manager whose background recorder is always stopped on teardown."""
+    yield risk_manager
+    # The event loop is shared across tests; leave no recorder task behind
+    await risk_manager.stop_recording()
 
 
 class TestRiskManagerInitialization:
@@ -83,6 +167,25 @@ class TestOrderValidation:
         assert result.approved is True
         assert result.reason is None
 
+    def test_validate_order_sync(self, risk_manager):
+        """Test synchronous validation runs the same pipeline."""
+        approved = risk_manager.validate_order_sync(
+            symbol='RELIANCE',
+            quantity=1,
+            price=2500,
+            transaction_type='BUY'
+        )
+        rejected = risk_manager.validate_order_sync(
+            symbol='RELIANCE',
+            quantity=100,
+            price=200,
+            transaction_type='BUY'
+        )
+
+        assert approved.approved is True
+        assert rejected.limit_type == 'max_single_order_value'
+        assert risk_manager.stats['orders_validated'] == 2
+
     @pytest.mark.asyncio
     async def test_validate_exceeds_single_order_limit(self, risk_manager):
         """Test order exceeding single order limit is rejected."""
@@ -155,6 +258,25 @@ class TestOrderValidation:
         assert 'forbidden' in result.reason.lower()
         assert 'MIS' in result.reason
 
+    @pytest.mark.asyncio
+    async def test_forbidden_rejection_reused(self, risk_manager):
+        """Test repeated forbidden-segment rejections share one result and still count."""
+        results = [
+            await risk_manager.validate_order(
+                symbol='RELIANCE',
+                quantity=1,
+                price=100,
+                transaction_type='BUY',
+                segment='FNO'
+            )
+            for _ in range(2)
+        ]
+
+        assert results[0] is results[1]
+        assert results[0].limit_type == 'forbidden_segment'
+        assert results[0].current_value == 'FNO'
+        assert risk_manager.stats['rejection_reasons'] == {'forbidden_segment': 2}
+
 
 class TestDailyLimits:
     """Test daily limits."""
@@ -217,11 +339,7 @@ class TestPositionTracking:
     async def test_max_open_positions_limit(self, risk_manager):
         """Test maximum open positions limit."""
         # Simulate 3 open positions
-        risk_manager._open_positions = {
-            'RELIANCE': Mock(),
-            'TCS': Mock(),
-            'INFY': Mock()
-        }
+        risk_manager._open_positions = dict.fromkeys(('RELIANCE', 'TCS', 'INFY'), _POSITION)
         risk_manager._position_count = 3
 
         # Try to open a 4th position
@@ -239,11 +357,7 @@ class TestPositionTracking:
     async def test_add_to_existing_position_allowed(self, risk_manager):
         """Test adding to existing position is allowed."""
         # Simulate 3 open positions
-        risk_manager._open_positions = {
-            'RELIANCE': Mock(),
-            'TCS': Mock(),
-            'INFY': Mock()
-        }
+        risk_manager._open_positions = dict.fromkeys(('RELIANCE', 'TCS', 'INFY'), _POSITION)
         risk_manager._position_count = 3
 
         # Try to add to existing position
@@ -287,6 +401,25 @@ class TestDayRollover:
             assert risk_manager._daily_order_count == 0
             assert result.approved is True
 
+    def test_day_rollover_check_cached_within_second(self, risk_manager):
+        """Test repeated rollover checks reuse today's date within a second."""
+        with patch('src.trader.risk.manager.date') as mock_date, \
+                patch('src.trader.risk.manager.time.monotonic', return_value=1000.2):
+            mock_date.today.return_value = date(2024, 1, 2)
+
+            risk_manager._check_day_rollover()
+            risk_manager._check_day_rollover()
+
+            assert mock_date.today.call_count == 1
+            assert risk_manager._current_day == date(2024, 1, 2)
+
+            # A changed _current_day bypasses the cache
+            risk_manager._current_day = date(2024, 1, 1)
+            risk_manager._check_day_rollover()
+
+            assert mock_date.today.call_count == 2
+            assert risk_manager._current_day == date(2024, 1, 2)
+
 
 class TestPnLTracking:
     """Test P&L tracking."""
@@ -294,42 +427,40 @@ class TestPnLTracking:
     @pytest.mark.asyncio
     async def test_update_daily_pnl(self, risk_manager, mock_groww_client):
         """Test daily P&L update from positions."""
-        # Mock positions with P&L
-        mock_groww_client.get_positions = AsyncMock(return_value=[
-            Position(
-                symbol='RELIANCE',
-                exchange='NSE',
-                product='CNC',
-                quantity=1,
-                average_price=2500,
-                pnl=100
-            ),
-            Position(
-                symbol='TCS',
-                exchange='NSE',
-                product='CNC',
-                quantity=1,
-                average_price=3500,
-                pnl=-50
-            )
-        ])
+        mock_groww_client.positions = _PNL_POSITIONS
 
         daily_pnl = await risk_manager.update_daily_pnl()
 
         assert daily_pnl == 50  # 100 - 50
         assert risk_manager._daily_pnl == 50
         assert risk_manager._position_count == 2
+        assert risk_manager._used_capital == 6000  # 2500 + 3500
+
+    @pytest.mark.asyncio
+    async def test_update_daily_pnl_many_positions(self, risk_manager, mock_groww_client):
+        """Test P&L aggregation over a large portfolio matches per-position sums."""
+        positions = _MANY_POSITIONS
+        mock_groww_client.positions = positions
+
+        daily_pnl = await risk_manager.update_daily_pnl()
+
+        assert daily_pnl == pytest.approx(sum(p.pnl or 0.0 for p in positions))
+        assert risk_manager._used_capital == pytest.approx(
+            sum(p.quantity * p.average_price for p in positions)
+        )
+        assert risk_manager._position_count == 40
 
 
 class TestRiskStatus:
     """Test risk status."""
 
     @pytest.mark.asyncio
-    async def test_get_status_healthy(self, risk_manager):
+    async def test_get_status_healthy(self, risk_manager, mock_groww_client):
         """Test getting status when system is healthy."""
-        risk_manager._daily_pnl = 500  # Profitable
+        # get_status refreshes P&L and positions from the broker
+        mock_groww_client.positions = _PROFIT_POSITIONS
+        risk_manager._current_day = date.today()
         risk_manager._daily_order_count = 5
-        risk_manager._position_count = 2
 
         status = await risk_manager.get_status()
 
@@ -338,14 +469,16 @@ class TestRiskStatus:
         assert status.daily_pnl == 500
         assert status.daily_order_count == 5
         assert status.open_positions == 2
+        assert status.used_capital == 6000
+        assert status.available_capital == 44000
 
     @pytest.mark.asyncio
-    async def test_get_status_warnings(self, risk_manager):
+    async def test_get_status_warnings(self, risk_manager, mock_groww_client):
         """Test getting status with warnings."""
         # Set up warning conditions
-        risk_manager._daily_pnl = -1800  # 90% of 2000 limit
+        mock_groww_client.positions = _LOSS_POSITIONS  # -1800, 90% of 2000 limit; 3 at max
+        risk_manager._current_day = date.today()
         risk_manager._daily_order_count = 13  # 87% of 15 limit
-        risk_manager._position_count = 3  # At max
 
         status = await risk_manager.get_status()
 
@@ -372,8 +505,60 @@ class TestRecordOrder:
         await risk_manager.record_order(order)
 
         assert risk_manager._daily_order_count == 1
+        assert risk_manager.daily_order_count == 1
         assert len(risk_manager._daily_orders) == 1
         assert risk_manager._daily_orders[0].order_id == 'TEST123'
+        assert list(risk_manager._daily_orders_dumped) == [order.model_dump(mode='json')]
+
+    def test_daily_orders_bounded_by_limit(self, risk_manager):
+        """Test the daily order buffer holds at most max_daily_orders."""
+        assert risk_manager._daily_orders.maxlen == risk_manager.max_daily_orders
+
+        risk_manager.record_orders_sync(
+            Order(
+                order_id=f'TEST{i}',
+                symbol='RELIANCE',
+                exchange='NSE',
+                quantity=1,
+                transaction_type='BUY',
+                order_type='LIMIT',
+                price=2500
+            )
+            for i in range(risk_manager.max_daily_orders + 2)
+        )
+
+        assert risk_manager._daily_order_count == risk_manager.max_daily_orders + 2
+        assert len(risk_manager._daily_orders) == risk_manager.max_daily_orders
+        assert risk_manager._daily_orders[-1].order_id == f'TEST{risk_manager.max_daily_orders + 1}'
+
+        risk_manager.reset_daily_counters()
+        assert len(risk_manager._daily_orders) == 0
+        assert risk_manager._daily_orders.maxlen == risk_manager.max_daily_orders
+
+    def test_daily_order_histories_stay_in_step(self, risk_manager):
+        """Test recording past the limit drops the same orders from both histories."""
+        orders = [
+            Order(
+                order_id=f'TEST{i}',
+                symbol='RELIANCE',
+                exchange='NSE',
+                quantity=1,
+                transaction_type='BUY',
+                order_type='LIMIT',
+                price=2500
+            )
+            for i in range(risk_manager.max_daily_orders + 3)
+        ]
+
+        risk_manager.record_order_sync(orders[0])
+        risk_manager.record_orders_sync(orders[1:-1])
+        risk_manager.record_order_sync(orders[-1])
+
+        kept = orders[-risk_manager.max_daily_orders:]
+        assert list(risk_manager._daily_orders) == kept
+        assert list(risk_manager._daily_orders_dumped) == [
+            order.model_dump(mode='json') for order in kept
+        ]
 
 
 class TestStatistics:
@@ -404,3 +589,222 @@ class TestStatistics:
         assert stats['orders_approved'] == 1
         assert stats['orders_rejected'] == 1
         assert stats['approval_rate'] == 50.0
+        assert stats['rejection_reasons'] == {'max_single_order_value': 1}
+        assert risk_manager.stats['orders_rejected'] == 1
+
+
+class TestValidationLogging:
+    """Test per-order validation logging can be disabled."""
+
+    @pytest.mark.asyncio
+    async def test_log_every_disabled(self, mock_groww_client, mock_config):
+        """Test approved orders skip INFO logs when risk.log_every is off."""
+        mock_config.get = {'risk': {'log_every': False}}.get
+        risk_manager = RiskManager(mock_groww_client, config=mock_config)
+        risk_manager._check_day_rollover()  # Once-a-day rollover logs are not per order
+
+        with patch('src.trader.risk.manager.logger') as mock_logger:
+            result = await risk_manager.validate_order(
+                symbol='RELIANCE',
+                quantity=1,
+                price=100,
+                transaction_type='BUY'
+            )
+
+        assert result.approved is True
+        mock_logger.info.assert_not_called()
+
+
+class TestSymbolLocks:
+    """Test per-symbol locks used for batched order placement."""
+
+    def test_symbol_lock_reused_per_symbol(self, risk_manager):
+        """Test the same lock is returned for a symbol and differs across symbols."""
+        lock = risk_manager.symbol_lock('RELIANCE')
+
+        assert risk_manager.symbol_lock('RELIANCE') is lock
+        assert risk_manager.symbol_lock('TCS') is not lock
+
+
+class TestOrderReservation:
+    """Test limit slots held by concurrent order placement."""
+
+    @staticmethod
+    def _reserve(risk_manager, symbol, transaction_type='BUY'):
+        return risk_manager.reserve_order(
+            symbol=symbol,
+            quantity=1,
+            price=100,
+            transaction_type=transaction_type
+        )
+
+    def test_reservations_count_toward_open_positions(self, risk_manager):
+        """Test in-flight opening BUYs fill the open position limit."""
+        risk_manager._current_day = date.today()
+
+        for symbol in ('RELIANCE', 'TCS', 'INFY'):
+            validation, reservation = self._reserve(risk_manager, symbol)
+            assert validation.approved is True
+            assert reservation.opens_position is True
+
+        validation, reservation = self._reserve(risk_manager, 'WIPRO')
+        assert validation.approved is False
+        assert validation.limit_type == 'max_open_positions'
+        assert reservation is None
+
+        # Adding to a pending position does not open a new one
+        validation, _ = self._reserve(risk_manager, 'TCS')
+        assert validation.approved is True
+        assert len(risk_manager._pending_positions) == 3
+
+    def test_reservations_count_toward_daily_orders(self, risk_manager):
+        """Test in-flight orders fill the daily order limit."""
+        risk_manager._current_day = date.today()
+
+        for i in range(risk_manager.max_daily_orders):
+            validation, _ = self._reserve(risk_manager, f'STOCK{i}', 'SELL')
+            assert validation.approved is True
+
+        assert risk_manager.daily_order_limit_reached() is True
+
+        validation, _ = self._reserve(risk_manager, 'RELIANCE', 'SELL')
+        assert validation.approved is False
+        assert validation.limit_type == 'max_daily_orders'
+
+    def test_failed_order_releases_slots(self, risk_manager):
+        """Test a failed placement gives back its order and position slots."""
+        risk_manager._current_day = date.today()
+        _, first = self._reserve(risk_manager, 'RELIANCE')
+        _, second = self._reserve(risk_manager, 'RELIANCE')
+
+        risk_manager.release_reservation(first, placed=False)
+
+        # The other in-flight BUY still holds the position slot
+        assert risk_manager._reserved_orders == 1
+        assert 'RELIANCE' in risk_manager._pending_positions
+
+        risk_manager.release_reservation(second, placed=False)
+
+        assert risk_manager._reserved_orders == 0
+        assert 'RELIANCE' not in risk_manager._pending_positions
+
+    @pytest.mark.asyncio
+    async def test_placed_buy_holds_position_until_refresh(self, risk_manager, mock_groww_client):
+        """Test a placed opening BUY holds its position slot until positions show it."""
+        risk_manager._current_day = date.today()
+        _, reservation = self._reserve(risk_manager, 'RELIANCE')
+
+        await risk_manager.enqueue_order(Order(
+            order_id='TEST1',
+            symbol='RELIANCE',
+            exchange='NSE',
+            quantity=1,
+            transaction_type='BUY',
+            order_type='LIMIT',
+            price=100
+        ))
+        risk_manager.release_reservation(reservation, placed=True)
+
+        assert risk_manager._reserved_orders == 0
+        assert risk_manager.daily_order_count == 1
+        assert 'RELIANCE' in risk_manager._pending_positions
+
+        # Not filled yet: still pending
+        await risk_manager.update_daily_pnl()
+        assert 'RELIANCE' in risk_manager._pending_positions
+
+        # Filled: counted as an open position instead
+        mock_groww_client.positions = _PNL_POSITIONS
+        await risk_manager.update_daily_pnl()
+        assert 'RELIANCE' not in risk_manager._pending_positions
+        assert risk_manager._position_count == 2
+
+    def test_day_rollover_drops_pending_positions(self, risk_manager):
+        """Test pending opening BUYs are dropped when the day rolls over."""
+        risk_manager._current_day = date.today()
+        _, reservation = self._reserve(risk_manager, 'RELIANCE')
+        risk_manager.release_reservation(reservation, placed=True)
+
+        with patch('src.trader.risk.manager.date') as mock_date:
+            mock_date.today.return_value = date(2099, 1, 1)
+            risk_manager._last_today_check = -1
+            risk_manager._check_day_rollover()
+
+        assert not risk_manager._pending_positions
+
+
+class TestDailyOrderLimitPrecheck:
+    """Test cheap daily order limit pre-check."""
+
+    def test_daily_order_limit_reached(self, risk_manager):
+        """Test pre-check reflects the daily order count."""
+        assert risk_manager.daily_order_limit_reached() is False
+
+        risk_manager._daily_order_count = 15
+
+        assert risk_manager.daily_order_limit_reached() is True
+
+
+class TestBackgroundRecording:
+    """Test background order recording."""
+
+    @staticmethod
+    def _order(order_id):
+        return Order(
+            order_id=order_id,
+            symbol='RELIANCE',
+            exchange='NSE',
+            quantity=1,
+            transaction_type='BUY',
+            order_type='LIMIT',
+            price=2500
+        )
+
+    @pytest.mark.asyncio
+    async def test_enqueue_without_worker_records_immediately(self, risk_manager):
+        """Test enqueue_order records inline when recording isn't started."""
+        await risk_manager.enqueue_order(self._order('TEST1'))
+
+        assert risk_manager._daily_order_count == 1
+
+    @pytest.mark.asyncio
+    async def test_enqueue_counts_before_worker_drains(self, recording_risk_manager):
+        """Test queued orders count toward the daily limit before they are stored."""
+        risk_manager = recording_risk_manager
+        await risk_manager.start_recording()
+        risk_manager._current_day = date.today()
+        risk_manager._daily_order_count = risk_manager.max_daily_orders - 1
+
+        await risk_manager.enqueue_order(self._order('TEST1'))
+
+        # The worker has not run yet
+        assert len(risk_manager._daily_orders) == 0
+        assert risk_manager.daily_order_limit_reached() is True
+
+        result = await risk_manager.validate_order(
+            symbol='TCS',
+            quantity=1,
+            price=100,
+            transaction_type='BUY'
+        )
+        assert result.approved is False
+        assert result.limit_type == 'max_daily_orders'
+
+        await risk_manager.stop_recording()
+
+        assert risk_manager.daily_order_count == risk_manager.max_daily_orders
+        assert [o.order_id for o in risk_manager._daily_orders] == ['TEST1']
+
+    @pytest.mark.asyncio
+    async def test_enqueue_with_worker_preserves_order(self, recording_risk_manager):
+        """Test queued orders are all recorded, in order, by stop_recording."""
+        risk_manager = recording_risk_manager
+        await risk_manager.start_recording()
+
+        for i in range(3):
+            await risk_manager.enqueue_order(self._order(f'TEST{i}'))
+
+        await risk_manager.stop_recording()
+
+        assert risk_manager._daily_order_count == 3
+        assert [o.order_id for o in risk_manager._daily_orders] == ['TEST0', 'TEST1', 'TEST2']